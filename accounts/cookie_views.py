@@ -2,7 +2,9 @@
 Cookie management views for secure cookie upload and management.
 """
 
+import codecs
 import logging
+import threading
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -13,15 +15,63 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
+from django.core.cache import cache
 from cookie_management.cookie_manager import cookie_manager, get_cookie_status
 
 logger = logging.getLogger("cookie_views")
 
+# cookies.txt exports are plain text; some browsers label them as binary
+ALLOWED_COOKIE_CONTENT_TYPES = ('text/plain', 'application/octet-stream')
+MAX_COOKIE_FILE_SIZE = 1024 * 1024  # 1MB
+
+# Short-lived cache so the page and the status API don't both decrypt storage
+COOKIE_STATUS_CACHE_TIMEOUT = 5  # seconds
+
+
+def _cookie_status_cache_key(user):
+    return f"cookie_status:{user.pk}"
+
+
+def _cookie_status_cached(user):
+    """Return the user's cookie status, reusing a result computed in the last few seconds."""
+    cache_key = _cookie_status_cache_key(user)
+    cookie_status = cache.get(cache_key)
+    if cookie_status is None:
+        cookie_status = get_cookie_status(user)
+        cache.set(cache_key, cookie_status, COOKIE_STATUS_CACHE_TIMEOUT)
+    return cookie_status
+
+
+def _invalidate_cookie_status(user):
+    """Drop the cached cookie status after the user's cookies change."""
+    cache.delete(_cookie_status_cache_key(user))
+
+
+# One UTF-8 decoder per worker thread, reset before each upload
+_decoder_local = threading.local()
+
+
+def _utf8_decoder():
+    decoder = getattr(_decoder_local, 'decoder', None)
+    if decoder is None:
+        decoder = _decoder_local.decoder = codecs.getincrementaldecoder('utf-8')()
+    else:
+        decoder.reset()
+    return decoder
+
+
+def _read_uploaded_text(uploaded_file, chunk_size=64 * 1024):
+    """Decode an uploaded file as UTF-8 chunk by chunk instead of reading it whole."""
+    decoder = _utf8_decoder()
+    parts = [decoder.decode(chunk) for chunk in uploaded_file.chunks(chunk_size)]
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts)
+
 
 @login_required
 def cookie_management_view(request):
     """Main cookie management page."""
-    cookie_status = get_cookie_status(request.user)
+    cookie_status = _cookie_status_cached(request.user)
     
     context = {
         'cookie_status': cookie_status,
@@ -31,24 +81,51 @@ def cookie_management_view(request):
     return render(request, 'accounts/cookie_management.html', context)
 
 
+def _wants_json(request):
+    """True when the client (the cookie page's fetch() calls) asked for JSON."""
+    return 'application/json' in request.headers.get('Accept', '')
+
+
+def _cookie_action_response(request, success, message):
+    """
+    Finish a cookie action.
+
+    JSON clients get the outcome plus the refreshed cookie status in one
+    response; regular form posts keep the message + redirect flow.
+    """
+    if _wants_json(request):
+        return JsonResponse({
+            'success': success,
+            'message': message,
+            'cookie_status': _cookie_status_cached(request.user),
+        }, status=200 if success else 400)
+    
+    if success:
+        messages.success(request, message)
+    else:
+        messages.error(request, message)
+    return redirect('accounts:cookie_management')
+
+
 @login_required
 @require_http_methods(["POST"])
 def upload_cookies_view(request):
     """Handle cookie file upload."""
     try:
         if 'cookie_file' not in request.FILES:
-            messages.error(request, "No cookie file provided")
-            return redirect('accounts:cookie_management')
+            return _cookie_action_response(request, False, "No cookie file provided")
         
         cookie_file = request.FILES['cookie_file']
         
-        # Validate file size (max 1MB)
-        if cookie_file.size > 1024 * 1024:
-            messages.error(request, "Cookie file too large (max 1MB)")
-            return redirect('accounts:cookie_management')
+        # Reject before touching the payload: size first, then declared type
+        if cookie_file.size > MAX_COOKIE_FILE_SIZE:
+            return _cookie_action_response(request, False, "Cookie file too large (max 1MB)")
+        
+        if cookie_file.content_type not in ALLOWED_COOKIE_CONTENT_TYPES:
+            return _cookie_action_response(request, False, "Cookie file must be a plain text cookies.txt export")
         
         # Read file content
-        cookie_content = cookie_file.read().decode('utf-8')
+        cookie_content = _read_uploaded_text(cookie_file)
         
         # Store cookies
         result = cookie_manager.store_user_cookies(
@@ -56,23 +133,22 @@ def upload_cookies_view(request):
             cookie_content, 
             source="upload"
         )
+        _invalidate_cookie_status(request.user)
         
         if result['success']:
-            messages.success(
-                request, 
+            logger.info(f"User {request.user.username} uploaded cookies successfully")
+            return _cookie_action_response(
+                request, True,
                 f"Cookies uploaded successfully! They will expire in 7 days. "
                 f"Found {result['validation']['cookie_count']} YouTube/Google cookies."
             )
-            logger.info(f"User {request.user.username} uploaded cookies successfully")
-        else:
-            messages.error(request, f"Failed to upload cookies: {result['error']}")
-            logger.warning(f"User {request.user.username} failed to upload cookies: {result['error']}")
+        
+        logger.warning(f"User {request.user.username} failed to upload cookies: {result['error']}")
+        return _cookie_action_response(request, False, f"Failed to upload cookies: {result['error']}")
         
     except Exception as e:
-        messages.error(request, f"Upload failed: {str(e)}")
         logger.error(f"Cookie upload error for user {request.user.username}: {e}")
-    
-    return redirect('accounts:cookie_management')
+        return _cookie_action_response(request, False, f"Upload failed: {str(e)}")
 
 
 @login_required
@@ -83,8 +159,7 @@ def paste_cookies_view(request):
         cookie_content = request.POST.get('cookie_content', '').strip()
         
         if not cookie_content:
-            messages.error(request, "No cookie content provided")
-            return redirect('accounts:cookie_management')
+            return _cookie_action_response(request, False, "No cookie content provided")
         
         # Store cookies
         result = cookie_manager.store_user_cookies(
@@ -92,23 +167,22 @@ def paste_cookies_view(request):
             cookie_content, 
             source="paste"
         )
+        _invalidate_cookie_status(request.user)
         
         if result['success']:
-            messages.success(
-                request, 
+            logger.info(f"User {request.user.username} pasted cookies successfully")
+            return _cookie_action_response(
+                request, True,
                 f"Cookies pasted successfully! They will expire in 7 days. "
                 f"Found {result['validation']['cookie_count']} YouTube/Google cookies."
             )
-            logger.info(f"User {request.user.username} pasted cookies successfully")
-        else:
-            messages.error(request, f"Failed to paste cookies: {result['error']}")
-            logger.warning(f"User {request.user.username} failed to paste cookies: {result['error']}")
+        
+        logger.warning(f"User {request.user.username} failed to paste cookies: {result['error']}")
+        return _cookie_action_response(request, False, f"Failed to paste cookies: {result['error']}")
         
     except Exception as e:
-        messages.error(request, f"Paste failed: {str(e)}")
         logger.error(f"Cookie paste error for user {request.user.username}: {e}")
-    
-    return redirect('accounts:cookie_management')
+        return _cookie_action_response(request, False, f"Paste failed: {str(e)}")
 
 
 @login_required
@@ -117,19 +191,18 @@ def delete_cookies_view(request):
     """Delete user's stored cookies."""
     try:
         success = cookie_manager.delete_user_cookies(request.user)
+        _invalidate_cookie_status(request.user)
         
         if success:
-            messages.success(request, "Cookies deleted successfully")
             logger.info(f"User {request.user.username} deleted their cookies")
-        else:
-            messages.error(request, "Failed to delete cookies")
-            logger.warning(f"User {request.user.username} failed to delete cookies")
+            return _cookie_action_response(request, True, "Cookies deleted successfully")
+        
+        logger.warning(f"User {request.user.username} failed to delete cookies")
+        return _cookie_action_response(request, False, "Failed to delete cookies")
         
     except Exception as e:
-        messages.error(request, f"Delete failed: {str(e)}")
         logger.error(f"Cookie delete error for user {request.user.username}: {e}")
-    
-    return redirect('accounts:cookie_management')
+        return _cookie_action_response(request, False, f"Delete failed: {str(e)}")
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -142,7 +215,7 @@ class CookieAPIView(View):
             return JsonResponse({'error': 'Authentication required'}, status=401)
         
         try:
-            cookie_status = get_cookie_status(request.user)
+            cookie_status = _cookie_status_cached(request.user)
             return JsonResponse(cookie_status)
         except Exception as e:
             logger.error(f"Cookie status API error for user {request.user.username}: {e}")
@@ -159,7 +232,7 @@ class CookieAPIView(View):
             # Check for file upload
             if 'cookie_file' in request.FILES:
                 cookie_file = request.FILES['cookie_file']
-                cookie_content = cookie_file.read().decode('utf-8')
+                cookie_content = _read_uploaded_text(cookie_file)
                 source = "api_upload"
             elif 'cookie_content' in data:
                 cookie_content = data['cookie_content']
@@ -169,6 +242,7 @@ class CookieAPIView(View):
             
             # Store cookies
             result = cookie_manager.store_user_cookies(request.user, cookie_content, source)
+            _invalidate_cookie_status(request.user)
             return JsonResponse(result)
             
         except Exception as e:
@@ -182,6 +256,7 @@ class CookieAPIView(View):
         
         try:
             success = cookie_manager.delete_user_cookies(request.user)
+            _invalidate_cookie_status(request.user)
             return JsonResponse({'success': success})
             
         except Exception as e:
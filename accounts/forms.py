@@ -1,6 +1,6 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
-from django.contrib.auth import get_user_model
+from django.contrib.auth import authenticate, get_user_model
 from django.core.exceptions import ValidationError
 
 User = get_user_model()
@@ -73,16 +73,9 @@ class UserLoginForm(AuthenticationForm):
         password = self.cleaned_data.get('password')
         
         if email and password:
-            # Use email to authenticate
-            self.user_cache = None
-            try:
-                user = User.objects.get(email=email)
-                if user.check_password(password):
-                    self.user_cache = user
-                else:
-                    raise ValidationError("Please enter a correct email and password.")
-            except User.DoesNotExist:
-                raise ValidationError("Please enter a correct email and password.")
+            # ModelBackend looks the user up by USERNAME_FIELD (email) and runs the
+            # password hasher even for unknown emails, so timing doesn't leak existence
+            self.user_cache = authenticate(self.request, username=email, password=password)
             
             if self.user_cache is None:
                 raise ValidationError("Please enter a correct email and password.")
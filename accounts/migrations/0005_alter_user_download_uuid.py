@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 22:43
+
+import core.shared_utils.id_utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_user_download_uuid'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='download_uuid',
+            field=models.UUIDField(default=core.shared_utils.id_utils.uuid7, unique=True, verbose_name='Download UUID'),
+        ),
+    ]
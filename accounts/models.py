@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
-import uuid
+from functools import cached_property
+
+from core.shared_utils.id_utils import uuid7
 
 
 class UserManager(BaseUserManager):
@@ -35,7 +38,7 @@ class User(AbstractUser):
     """
     username = None  # Remove username field
     email = models.EmailField(unique=True, verbose_name="Email Address")
-    download_uuid = models.UUIDField(unique=True, verbose_name="Download UUID")
+    download_uuid = models.UUIDField(default=uuid7, unique=True, verbose_name="Download UUID")
     
     objects = UserManager()
     
@@ -45,15 +48,17 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
     
-    def save(self, *args, **kwargs):
-        if not self.download_uuid:
-            self.download_uuid = uuid.uuid4()
-        super().save(*args, **kwargs)
+    @cached_property
+    def _download_directories(self):
+        """Per-instance memo of download paths, keyed by download type."""
+        return {}
     
     def get_download_directory(self, download_type='audio'):
         """Get the user-specific download directory path."""
-        from django.conf import settings
-        return settings.MEDIA_ROOT / 'downloads' / download_type / str(self.download_uuid)
+        directories = self._download_directories
+        if download_type not in directories:
+            directories[download_type] = settings.MEDIA_ROOT / 'downloads' / download_type / str(self.download_uuid)
+        return directories[download_type]
     
     class Meta:
         verbose_name = "User"
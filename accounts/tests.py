@@ -1,3 +1,254 @@
+# accounts/tests.py
+import base64
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from cookie_management.cookie_manager import CookieManager
+from .forms import UserLoginForm
+
+User = get_user_model()
+
+
+class UserLoginFormTestCase(TestCase):
+    """Test cases for email-based login."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+    
+    def test_valid_credentials(self):
+        """Test login with the correct email and password."""
+        form = UserLoginForm(data={'username': 'test@example.com', 'password': 'testpass123'})
+        
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.get_user(), self.user)
+    
+    def test_wrong_password(self):
+        """Test login with a wrong password."""
+        form = UserLoginForm(data={'username': 'test@example.com', 'password': 'wrong'})
+        
+        self.assertFalse(form.is_valid())
+        self.assertIsNone(form.get_user())
+    
+    def test_unknown_email(self):
+        """Test login with an email that has no account."""
+        form = UserLoginForm(data={'username': 'nobody@example.com', 'password': 'testpass123'})
+        
+        self.assertFalse(form.is_valid())
+    
+    def test_inactive_user(self):
+        """Test that inactive accounts cannot log in."""
+        self.user.is_active = False
+        self.user.save()
+        form = UserLoginForm(data={'username': 'test@example.com', 'password': 'testpass123'})
+        
+        self.assertFalse(form.is_valid())
+
+
+class UserDownloadUUIDTestCase(TestCase):
+    """Test cases for the per-user download UUID."""
+    
+    def test_new_users_get_time_ordered_uuid(self):
+        """Test that download UUIDs are version 7 and increase with signup order."""
+        first = User.objects.create_user(email='first@example.com', password='testpass123')
+        time.sleep(0.002)
+        second = User.objects.create_user(email='second@example.com', password='testpass123')
+        
+        self.assertEqual(first.download_uuid.version, 7)
+        self.assertLess(first.download_uuid, second.download_uuid)
+
+
+class LoginPageCachingTestCase(TestCase):
+    """Test cases for conditional GET on the login page."""
+    
+    def test_repeat_anonymous_get_is_not_modified(self):
+        """Test that an anonymous revisit with a matching ETag gets a 304."""
+        first = self.client.get('/accounts/login/')
+        self.assertEqual(first.status_code, 200)
+        
+        # The first visit sets the CSRF cookie; the second one can be tagged
+        second = self.client.get('/accounts/login/')
+        self.assertIn('ETag', second)
+        self.assertIn('no-cache', second['Cache-Control'])
+        
+        third = self.client.get('/accounts/login/', HTTP_IF_NONE_MATCH=second['ETag'])
+        self.assertEqual(third.status_code, 304)
+    
+    def test_signed_in_user_is_not_served_cached_form(self):
+        """Test that signed-in users are redirected, not sent a 304."""
+        user = User.objects.create_user(email='test@example.com', password='testpass123')
+        self.client.get('/accounts/login/')
+        etag = self.client.get('/accounts/login/')['ETag']
+        
+        self.client.force_login(user)
+        response = self.client.get('/accounts/login/', HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn('ETag', response)
+        self.assertIn('no-store', response['Cache-Control'])
+    
+    def test_post_is_never_cached(self):
+        """Test that form submissions keep the never-cache headers."""
+        response = self.client.post('/accounts/login/', {'username': 'x@example.com', 'password': 'wrong'})
+        
+        self.assertIn('no-store', response['Cache-Control'])
+        self.assertNotIn('ETag', response)
+
 
-# Create your tests here.
+class CookieManagerTestCase(TestCase):
+    """Test cases for cookie storage, status and cleanup."""
+    
+    COOKIES = ".youtube.com\tTRUE\t/\tTRUE\t1999999999\tSID\tabc123\n"
+    
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(email='test@example.com', password='testpass123')
+        self.storage_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.storage_dir.cleanup)
+        self.addCleanup(cache.clear)
+        self.manager = CookieManager()
+        self.manager.cookie_storage_dir = Path(self.storage_dir.name)
+    
+    def test_status_does_not_decrypt(self):
+        """Test that status comes from the metadata sidecar, not the encrypted file."""
+        self.assertTrue(self.manager.store_user_cookies(self.user, self.COOKIES)['success'])
+        cache.clear()
+        
+        with patch.object(self.manager, '_decrypt_cookies', side_effect=AssertionError('decrypted')):
+            cookie_status = self.manager.get_cookie_status(self.user)
+        
+        self.assertTrue(cookie_status['has_cookies'])
+        self.assertEqual(cookie_status['source'], 'upload')
+    
+    def test_delete_removes_sidecar(self):
+        """Test that deleting cookies also removes the metadata sidecar."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        self.manager.delete_user_cookies(self.user)
+        
+        self.assertFalse(self.manager.get_cookie_status(self.user)['has_cookies'])
+        self.assertEqual(list(Path(self.storage_dir.name).iterdir()), [])
+    
+    def test_cleanup_skips_recent_files(self):
+        """Test that cleanup only reads files older than the cookie lifetime."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        
+        with patch.object(self.manager, '_load_cookie_meta', side_effect=AssertionError('read')):
+            self.assertEqual(self.manager.cleanup_expired_cookies(), 0)
+    
+    def test_cleanup_removes_expired_files(self):
+        """Test that expired cookie files and their sidecars are removed."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        cache.clear()
+        
+        # Age the files past the cookie lifetime and expire the metadata
+        old = time.time() - self.manager.COOKIE_LIFETIME.total_seconds() - 60
+        for path in Path(self.storage_dir.name).iterdir():
+            os.utime(path, (old, old))
+        with patch('cookie_management.cookie_manager.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() + self.manager.COOKIE_LIFETIME
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            self.assertEqual(self.manager.cleanup_expired_cookies(), 1)
+        
+        self.assertEqual(list(Path(self.storage_dir.name).iterdir()), [])
+    
+    def test_cached_cookies_follow_file_changes(self):
+        """Test that a cached copy is dropped once the cookie file changes."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        stale_entry = cache.get(f"user_cookies:{self.user.id}")
+        
+        # Another process replaces the file; this process still caches the old copy
+        updated = self.COOKIES.replace('abc123', 'def456')
+        self.manager.store_user_cookies(self.user, updated)
+        cache.set(f"user_cookies:{self.user.id}", stale_entry)
+        self.assertEqual(self.manager.get_user_cookies(self.user), updated)
+        
+        # Another process deletes the file
+        cache.set(f"user_cookies:{self.user.id}", stale_entry)
+        (Path(self.storage_dir.name) / f"user_{self.user.id}_cookies.enc").unlink()
+        self.assertIsNone(self.manager.get_user_cookies(self.user))
+    
+    def test_legacy_text_file_is_migrated(self):
+        """Test that a double-base64 text cookie file is read and rewritten as raw bytes."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        cache.clear()
+        
+        # Rewrite the file the way older versions stored it
+        cookie_file = Path(self.storage_dir.name) / f"user_{self.user.id}_cookies.enc"
+        token = base64.urlsafe_b64encode(cookie_file.read_bytes())
+        cookie_file.write_bytes(base64.b64encode(token))
+        
+        self.assertEqual(self.manager.get_user_cookies(self.user), self.COOKIES)
+        self.assertEqual(cookie_file.read_bytes()[:1], b'\x80')
+        self.assertEqual(self.manager.get_user_cookies(self.user), self.COOKIES)
+    
+    def test_upload_by_another_process_is_seen_at_once(self):
+        """Test that a 'no cookies' answer is not remembered past the upload."""
+        self.assertFalse(self.manager.has_cookies(self.user))
+        self.assertFalse(self.manager.get_cookie_status(self.user)['has_cookies'])
+        
+        # Another process stores cookies; its cache entries aren't visible here
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        cache.clear()
+        
+        self.assertTrue(self.manager.has_cookies(self.user))
+        self.assertTrue(self.manager.get_cookie_status(self.user)['has_cookies'])
+    
+    def test_delete_by_another_process_is_seen_at_once(self):
+        """Test that cached cookies and metadata are not trusted once the file is gone."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        self.manager.get_cookie_status(self.user)
+        
+        # Another process deletes the files; this process still caches both entries
+        for path in Path(self.storage_dir.name).iterdir():
+            path.unlink()
+        
+        self.assertFalse(self.manager.has_cookies(self.user))
+        self.assertFalse(self.manager.get_cookie_status(self.user)['has_cookies'])
+    
+    def test_has_cookies_does_not_decrypt(self):
+        """Test that the presence check needs no decrypt, with or without cached entries."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        
+        with patch.object(self.manager, '_decrypt_cookies', side_effect=AssertionError('decrypted')):
+            self.assertTrue(self.manager.has_cookies(self.user))
+            cache.clear()
+            self.assertTrue(self.manager.has_cookies(self.user))
+    
+    def test_cached_status_follows_file_changes(self):
+        """Test that cached metadata is dropped once another process replaces the cookie file."""
+        self.manager.store_user_cookies(self.user, self.COOKIES, source='upload')
+        stale_meta = cache.get(f"user_cookies_meta:{self.user.id}")
+        
+        # Another process uploads new cookies; this process still caches the old metadata
+        self.manager.store_user_cookies(self.user, self.COOKIES, source='browser')
+        cache.set(f"user_cookies_meta:{self.user.id}", stale_meta)
+        
+        self.assertEqual(self.manager.get_cookie_status(self.user)['source'], 'browser')
+    
+    def test_stale_expired_status_does_not_delete_new_upload(self):
+        """Test that cached metadata saying 'expired' never removes cookies uploaded since."""
+        self.manager.store_user_cookies(self.user, self.COOKIES)
+        expired_meta = {
+            **cache.get(f"user_cookies_meta:{self.user.id}"),
+            "expires_at": datetime(2000, 1, 1).isoformat(),
+        }
+        
+        # The cached metadata claims to describe the current file, but the
+        # sidecar on disk (written by the upload) says the cookies are fresh
+        cache.set(f"user_cookies_meta:{self.user.id}", expired_meta)
+        self.manager.get_cookie_status(self.user)
+        
+        cookie_file = Path(self.storage_dir.name) / f"user_{self.user.id}_cookies.enc"
+        self.assertTrue(cookie_file.exists())
+        self.assertEqual(self.manager.get_user_cookies(self.user), self.COOKIES)
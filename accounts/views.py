@@ -1,13 +1,72 @@
+import hashlib
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.views.decorators.http import require_http_methods
-from django.views.decorators.cache import never_cache
+from django.template.loader import get_template
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.views.decorators.http import require_http_methods, condition
 from .forms import UserSignupForm, UserLoginForm
 
 
-@never_cache
+@lru_cache(maxsize=None)
+def _template_version(template_name):
+    """Modification time of a page template and the base layout it extends."""
+    mtimes = []
+    for name in (template_name, 'base.html'):
+        origin = get_template(name).origin
+        try:
+            mtimes.append(str(Path(origin.name).stat().st_mtime_ns))
+        except OSError:
+            mtimes.append('0')
+    return ':'.join(mtimes)
+
+
+def _form_page_etag(template_name, request, *args, **kwargs):
+    """
+    ETag for the blank form an anonymous visitor gets on GET.
+    
+    Returns None (no conditional handling) whenever the page would differ:
+    signed-in users, pending flash messages, or no CSRF cookie yet. The CSRF
+    cookie is part of the tag so a cached page never carries a stale token.
+    """
+    if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+        return None
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+    if not csrf_cookie or len(messages.get_messages(request)):
+        return None
+    tag = f"{_template_version(template_name)}:{csrf_cookie}"
+    return hashlib.sha256(tag.encode()).hexdigest()[:32]
+
+
+def _revalidated_form_page(template_name):
+    """
+    Let browsers revalidate an anonymous form page instead of refetching it.
+    
+    Anonymous GETs get an ETag and ``Cache-Control: private, no-cache`` so a
+    repeat visit is answered with 304 without rendering; every other response
+    (POSTs, redirects, signed-in users) keeps the never-cache headers.
+    """
+    def decorator(view_func):
+        conditional_view = condition(etag_func=partial(_form_page_etag, template_name))(view_func)
+        
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header('ETag'):
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                add_never_cache_headers(response)
+            return response
+        return _wrapped_view
+    return decorator
+
+
+@_revalidated_form_page('accounts/signup.html')
 def signup_view(request):
     """
     User registration view.
@@ -28,7 +87,7 @@ def signup_view(request):
     return render(request, 'accounts/signup.html', {'form': form})
 
 
-@never_cache
+@_revalidated_form_page('accounts/login.html')
 def login_view(request):
     """
     User login view.
@@ -37,7 +96,7 @@ def login_view(request):
         return redirect('accounts:dashboard')
     
     if request.method == 'POST':
-        form = UserLoginForm(data=request.POST)
+        form = UserLoginForm(request, data=request.POST)
         if form.is_valid():
             user = form.get_user()
             login(request, user)
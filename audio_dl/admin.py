@@ -1,7 +1,16 @@
+import csv
 from django.contrib import admin
+from django.http import StreamingHttpResponse
 from .models import DownloadJob, JobMetadata
 
 
+class _Echo:
+    """File-like object whose write() hands the row back to csv.writer's caller."""
+    
+    def write(self, value):
+        return value
+
+
 @admin.register(DownloadJob)
 class DownloadJobAdmin(admin.ModelAdmin):
     list_display = ['job_id', 'user', 'download_type', 'status', 'filename', 'created_at', 'download_source']
@@ -10,6 +19,29 @@ class DownloadJobAdmin(admin.ModelAdmin):
     readonly_fields = ['job_id', 'created_at', 'started_at', 'completed_at', 'duration_seconds']
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
+    list_select_related = ('user',)
+
+    actions = ['export_as_csv']
+
+    def get_queryset(self, request):
+        # Join the user FK up front so the changelist doesn't query per row
+        return super().get_queryset(request).select_related('user')
+
+    @admin.action(description="Export selected jobs as CSV")
+    def export_as_csv(self, request, queryset):
+        """Stream the selected jobs as CSV without materializing the queryset."""
+        columns = ['job_id', 'user__email', 'download_type', 'status', 'filename', 'file_size', 'created_at']
+        rows = queryset.order_by().values_list(*columns).iterator(chunk_size=500)
+        writer = csv.writer(_Echo())
+
+        def stream():
+            yield writer.writerow(columns)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="download_jobs.csv"'
+        return response
 
 
 @admin.register(JobMetadata)
@@ -18,3 +50,12 @@ class JobMetadataAdmin(admin.ModelAdmin):
     list_filter = ['ext', 'is_deleted', 'job__download_type']
     search_fields = ['title', 'uploader', 'job__job_id', 'job__user__email']
     readonly_fields = ['job', 'raw_metadata']
+    list_select_related = ('job', 'job__user')
+    # Newest jobs first; kept here rather than on the model so other
+    # JobMetadata queries don't pay for the join and sort
+    ordering = ['-job__created_at']
+
+    def get_queryset(self, request):
+        # __str__ of the job touches job.user, so join both levels. The raw
+        # yt-dlp JSON isn't listed; the change view loads it on access.
+        return super().get_queryset(request).select_related('job', 'job__user').defer('raw_metadata')
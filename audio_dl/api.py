@@ -4,70 +4,16 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import FileResponse
-from core.downloaders.audio.download_audio import download_audio
 from core.shared_utils.url_utils import YouTubeURLSanitizer, YouTubeURLError
 from core.downloaders.shared_downloader import get_file_info
-from core.shared_utils.app_config import APP_CONFIG
-from cookie_management.cookie_manager import get_user_cookies
+from core.shared_utils.app_config_snapshot import DOWNLOAD_CFG
+from core.shared_utils.response_utils import file_download_response
+from core.shared_utils.id_utils import uuid7
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def download_audio_api(request):
-    url = (request.data.get("url") or "").strip()
-    if not url:
-        return Response({"detail": "Missing 'url'"}, status=status.HTTP_400_BAD_REQUEST)
-
-    # Validate YouTube URL before processing
-    try:
-        if not YouTubeURLSanitizer.is_youtube_url(url):
-            return Response({"detail": "Invalid YouTube URL"}, status=status.HTTP_400_BAD_REQUEST)
-    except Exception as e:
-        return Response({"detail": f"URL validation error: {str(e)}"}, status=status.HTTP_400_BAD_REQUEST)
-
-    # Get user-specific download directory for audio
-    user_download_dir = request.user.get_download_directory('audio')
-    
-    # Check if user wants to download to remote (from request data)
-    download_to_remote = request.data.get('download_to_remote', True)
-    
-    # Get user tracking information
-    user_ip = request.META.get('REMOTE_ADDR')
-    user_agent = request.META.get('HTTP_USER_AGENT', '')
-    
-    # Get user cookies for authentication
-    user_cookies = get_user_cookies(request.user)
-    
-    # Use the core download function with user-specific directory
-    result = download_audio(
-        url, 
-        output_dir=str(user_download_dir),
-        user=request.user,
-        user_ip=user_ip,
-        user_agent=user_agent,
-        download_source='api',
-        user_cookies=user_cookies
-    )
-    
-    if not result['success']:
-        return Response({"detail": result['error']}, status=status.HTTP_400_BAD_REQUEST)
-    
-    if download_to_remote:
-        # Return the file (current behavior - download dialog)
-        fileobj = open(result['filepath'], "rb")
-        return FileResponse(fileobj, as_attachment=True, filename=result['filename'])
-    else:
-        # Return file info as JSON (server-only storage)
-        file_info = get_file_info(result['filepath'])
-        return Response({
-            'success': True,
-            'message': 'File downloaded successfully to server',
-            'file_info': file_info,
-            'job_id': result.get('job_id'),
-            'metadata': result.get('metadata', {})
-        }, status=status.HTTP_200_OK)
+# Module-level so tests can patch it
+_DOWNLOAD_TO_REMOTE = DOWNLOAD_CFG.download_to_remote_location
 
-# ---------------------- NEW: Async endpoints (django-background-tasks) ----------------------
+# ---------------------- Async endpoints (django-background-tasks) ----------------------
 from django.urls import reverse
 from background_task.models import Task
 from django.shortcuts import get_object_or_404
@@ -93,12 +39,26 @@ def download_audio_api_async(request):
     user_download_dir = request.user.get_download_directory('audio')
     
     # Create a unique task ID
-    task_id = str(uuid.uuid4())
+    task_id = str(uuid7())
     
     # Get user tracking information
     user_ip = request.META.get('REMOTE_ADDR')
     user_agent = request.META.get('HTTP_USER_AGENT', '')
     
+    # Record the job up front so job_status can report it while it waits in the queue
+    from audio_dl.models import DownloadJob
+    DownloadJob.objects.create(
+        job_id=task_id,
+        task_id=task_id,
+        user=request.user,
+        url=url,
+        download_type='audio',
+        status='queued',
+        user_ip=user_ip,
+        user_agent=user_agent,
+        download_source=DownloadJob.DOWNLOAD_SOURCE_IDS['api_async'],
+    )
+    
     # Queue the background task with user-specific directory
     from audio_dl.tasks import process_youtube_audio
     process_youtube_audio(
@@ -111,8 +71,8 @@ def download_audio_api_async(request):
         repeat=0
     )
 
-    status_url = request.build_absolute_uri(reverse("job_status", args=[task_id]))
-    result_url = request.build_absolute_uri(reverse("job_result", args=[task_id]))
+    status_url = request.build_absolute_uri(reverse("audio_dl:job_status", args=[task_id]))
+    result_url = request.build_absolute_uri(reverse("audio_dl:job_result", args=[task_id]))
 
     return Response({
         "task_id": task_id,
@@ -122,81 +82,130 @@ def download_audio_api_async(request):
     }, status=status.HTTP_202_ACCEPTED)
 
 
+# The synchronous endpoint used to run yt-dlp inside the request thread, pinning
+# a worker for the whole download. It now queues the same background job; clients
+# poll job_status and fetch the file from job_result.
+download_audio_api = download_audio_api_async
+
+
+# Columns read by job_status (duration_seconds derives from started_at/completed_at)
+JOB_STATUS_FIELDS = (
+    'job_id', 'status', 'created_at', 'started_at', 'completed_at',
+    'filename', 'file_size', 'error_message', 'download_source',
+)
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def job_status(request, job_id: str):
+def job_status(request, job_id):
     """Return current task status from database."""
-    try:
-        # Import our custom models
-        from audio_dl.models import DownloadJob
-        
-        # Look for job in our database
-        job = DownloadJob.objects.filter(job_id=job_id, user=request.user).first()
-        
-        if not job:
-            return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
-        
-        # Return job status and details
-        return Response({
-            "task_id": job_id,
+    from audio_dl.models import DownloadJob
+
+    # Single indexed lookup scoped to the requesting user; 404 if missing.
+    # Only the columns the response needs are fetched.
+    job = get_object_or_404(
+        DownloadJob.objects.only(*JOB_STATUS_FIELDS),
+        job_id=job_id,
+        user=request.user,
+    )
+
+    # Return job status and details
+    return Response({
+        "task_id": job_id,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "filename": job.filename,
+        "file_size": job.file_size,
+        "error_message": job.error_message,
+        "download_source": job.download_source_name,
+        "duration_seconds": job.duration_seconds,
+    }, status=status.HTTP_200_OK)
+
+
+# Upper bound on ids accepted by job_status_bulk in one request
+MAX_BULK_STATUS_IDS = 100
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def job_status_bulk(request):
+    """Return the status of several jobs in one request: {"ids": [...]}."""
+    from audio_dl.models import DownloadJob
+
+    ids = request.data.get("ids")
+    if not isinstance(ids, list):
+        return Response({"detail": "'ids' must be a list of job ids"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(ids) > MAX_BULK_STATUS_IDS:
+        return Response(
+            {"detail": f"Too many ids (max {MAX_BULK_STATUS_IDS})"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # Drop malformed ids; they cannot match a job anyway
+    job_ids = []
+    for job_id in ids:
+        try:
+            job_ids.append(uuid.UUID(str(job_id)))
+        except ValueError:
+            continue
+
+    # One IN-list query scoped to the requesting user
+    jobs = DownloadJob.objects.filter(job_id__in=job_ids, user=request.user).only(
+        'job_id', 'status', 'filename', 'file_size', 'error_message',
+    )
+
+    return Response({
+        str(job.job_id): {
             "status": job.status,
-            "created_at": job.created_at.isoformat(),
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
             "filename": job.filename,
             "file_size": job.file_size,
             "error_message": job.error_message,
-            "download_source": job.download_source,
-            "duration_seconds": job.duration_seconds,
-        }, status=status.HTTP_200_OK)
-
-    except Exception as e:
-        return Response({"detail": f"Error checking job status: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        }
+        for job in jobs
+    }, status=status.HTTP_200_OK)
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def job_result(request, job_id: str):
+def job_result(request, job_id):
     """If task finished successfully, stream the generated file."""
-    try:
-        # Import our custom models
-        from audio_dl.models import DownloadJob
-        
-        # Look for job in our database
-        job = DownloadJob.objects.filter(job_id=job_id, user=request.user).first()
-        
-        if not job:
-            return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
-        
-        # Check if job is completed
-        if job.status != 'completed':
-            return Response({"detail": f"Job not completed (status: {job.status})"}, status=status.HTTP_202_ACCEPTED)
-        
-        # Check if file exists
-        if not job.filepath or not os.path.exists(job.filepath):
+    from audio_dl.models import DownloadJob
+
+    # Fetch only what this response needs; the metadata blob is joined in
+    # only when it is returned (server-only storage mode)
+    jobs = DownloadJob.objects.only('job_id', 'status', 'filename', 'filepath')
+    if not _DOWNLOAD_TO_REMOTE:
+        jobs = jobs.select_related('metadata').only(
+            'job_id', 'status', 'filename', 'filepath', 'metadata__raw_metadata',
+        )
+    job = get_object_or_404(jobs, job_id=job_id, user=request.user)
+
+    # Check if job is completed
+    if job.status != 'completed':
+        return Response({"detail": f"Job not completed (status: {job.status})"}, status=status.HTTP_202_ACCEPTED)
+
+    # Check if file exists
+    if not job.filepath or not os.path.isfile(job.filepath):
+        return Response({"detail": "File not found on disk"}, status=status.HTTP_410_GONE)
+
+    # Check if we should download to remote location (client)
+    if _DOWNLOAD_TO_REMOTE:
+        # Return the file (current behavior - download dialog)
+        try:
+            return file_download_response(job.filepath, job.filename)
+        except OSError:
             return Response({"detail": "File not found on disk"}, status=status.HTTP_410_GONE)
-        
-        # Check if we should download to remote location (client)
-        download_to_remote = APP_CONFIG.get("download", {}).get("download_to_remote_location", "True").lower() == "true"
-        
-        if download_to_remote:
-            # Return the file (current behavior - download dialog)
-            try:
-                fileobj = open(job.filepath, "rb")
-                return FileResponse(fileobj, as_attachment=True, filename=job.filename)
-            except OSError:
-                return Response({"detail": "File not found on disk"}, status=status.HTTP_410_GONE)
-        else:
-            # Return file info as JSON (server-only storage)
-            file_info = get_file_info(job.filepath)
-            return Response({
-                'success': True,
-                'message': 'File available for download',
-                'file_info': file_info,
-                'filepath': job.filepath,
-                'job_id': job.job_id,
-                'metadata': job.metadata.raw_metadata if hasattr(job, 'metadata') and job.metadata else None,
-            }, status=status.HTTP_200_OK)
-            
-    except Exception as e:
-        return Response({"detail": f"Error retrieving result: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+    else:
+        # Return file info as JSON (server-only storage)
+        file_info = get_file_info(job.filepath)
+        metadata = getattr(job, 'metadata', None)
+        return Response({
+            'success': True,
+            'message': 'File available for download',
+            'file_info': file_info,
+            'filepath': job.filepath,
+            'job_id': job.job_id,
+            'metadata': metadata.raw_metadata if metadata else None,
+        }, status=status.HTTP_200_OK)
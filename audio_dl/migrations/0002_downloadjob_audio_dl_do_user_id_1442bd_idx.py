@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 22:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='downloadjob',
+            index=models.Index(fields=['user', 'job_id'], name='audio_dl_do_user_id_1442bd_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 22:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0002_downloadjob_audio_dl_do_user_id_1442bd_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='downloadjob',
+            index=models.Index(fields=['user', 'status'], name='audio_dl_do_user_id_194419_idx'),
+        ),
+    ]
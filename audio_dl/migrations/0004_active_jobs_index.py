@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-15 22:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN suits the append-only created_at column; Postgres only
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS dj_created_brin ON audio_dl_downloadjob USING BRIN (created_at)'
+        )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS dj_created_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0003_downloadjob_audio_dl_do_user_id_194419_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='jobmetadata',
+            options={'verbose_name': 'Job Metadata', 'verbose_name_plural': 'Job Metadata'},
+        ),
+        migrations.AddIndex(
+            model_name='downloadjob',
+            index=models.Index(condition=models.Q(('status__in', ('pending', 'queued', 'downloading'))), fields=['created_at'], name='dj_active_created_idx'),
+        ),
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
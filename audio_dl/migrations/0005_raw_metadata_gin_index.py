@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-15 22:48
+
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # jsonb_path_ops GIN serves raw_metadata__contains (@>) lookups; Postgres only
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS jm_raw_meta_gin ON audio_dl_jobmetadata '
+            'USING GIN (raw_metadata jsonb_path_ops)'
+        )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS jm_raw_meta_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0004_active_jobs_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
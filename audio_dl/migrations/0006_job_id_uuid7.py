@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-15 22:50
+
+import core.shared_utils.id_utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0005_raw_metadata_gin_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='downloadjob',
+            name='audio_dl_do_job_id_de6472_idx',
+        ),
+        migrations.AlterField(
+            model_name='downloadjob',
+            name='job_id',
+            field=models.UUIDField(default=core.shared_utils.id_utils.uuid7, editable=False, unique=True, verbose_name='Job ID'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-15 22:59
+
+from django.db import migrations
+
+# Old string values and the integer codes that replace them
+DOWNLOAD_SOURCE_CODES = {'api': '0', 'website': '1', 'api_async': '2'}
+
+
+def names_to_codes(apps, schema_editor):
+    # Rewrite the text column to digit strings so the type change can cast them
+    DownloadJob = apps.get_model('audio_dl', 'DownloadJob')
+    for name, code in DOWNLOAD_SOURCE_CODES.items():
+        DownloadJob.objects.filter(download_source=name).update(download_source=code)
+    DownloadJob.objects.exclude(download_source__in=DOWNLOAD_SOURCE_CODES.values()).update(download_source='0')
+
+
+def codes_to_names(apps, schema_editor):
+    DownloadJob = apps.get_model('audio_dl', 'DownloadJob')
+    for name, code in DOWNLOAD_SOURCE_CODES.items():
+        DownloadJob.objects.filter(download_source=code).update(download_source=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0006_job_id_uuid7'),
+    ]
+
+    operations = [
+        migrations.RunPython(names_to_codes, codes_to_names),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0007_download_source_codes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='downloadjob',
+            name='download_source',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'api'), (1, 'website'), (2, 'api_async')], default=0, verbose_name='Download Source'),
+        ),
+    ]
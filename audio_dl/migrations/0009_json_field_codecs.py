@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-15 23:10
+
+import core.shared_utils.json_utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_dl', '0008_download_source_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='downloadjob',
+            name='error_details',
+            field=models.JSONField(blank=True, decoder=core.shared_utils.json_utils.FastJSONDecoder, encoder=core.shared_utils.json_utils.FastJSONEncoder, null=True, verbose_name='Error Details'),
+        ),
+        migrations.AlterField(
+            model_name='jobmetadata',
+            name='raw_metadata',
+            field=models.JSONField(blank=True, decoder=core.shared_utils.json_utils.FastJSONDecoder, encoder=core.shared_utils.json_utils.FastJSONEncoder, null=True, verbose_name='Raw Metadata'),
+        ),
+    ]
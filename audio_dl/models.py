@@ -1,10 +1,81 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 import json
-import uuid
+
+from core.shared_utils.id_utils import uuid7
+from core.shared_utils.json_utils import FastJSONEncoder, FastJSONDecoder
 
 User = get_user_model()
 
+# Statuses of jobs that have not finished yet
+ACTIVE_JOB_STATUSES = ('pending', 'queued', 'downloading')
+
+
+class DownloadJobQuerySet(models.QuerySet):
+    """Query helpers for DownloadJob."""
+    
+    def with_details(self):
+        """Join the owning user and the metadata row in the same query."""
+        return self.select_related('user', 'metadata')
+    
+    def fail_unstarted(self, error_message):
+        """
+        Mark jobs that never left the queue as failed.
+        
+        Jobs that already started are left alone; their own task reports
+        how they ended.
+        
+        Args:
+            error_message: Message shown to the user polling the job
+        
+        Returns:
+            int: Number of jobs updated
+        """
+        return self.filter(status__in=('pending', 'queued')).update(
+            status='failed',
+            error_message=error_message,
+            completed_at=timezone.now(),
+        )
+    
+    def fail_queued_job(self, task_id, error_message):
+        """
+        Fail the job row the API created for a task that returns without downloading.
+        
+        Without this, status polls would report the job queued forever.
+        
+        Args:
+            task_id: Background task ID (the job ID of the row); nothing happens if empty
+            error_message: Message shown to the user polling the job
+        """
+        if task_id:
+            self.filter(job_id=task_id).fail_unstarted(error_message)
+    
+    def fail_duplicate_job(self, task_id, user_id, url, download_type):
+        """
+        Fail a queued job skipped because the same download is already running.
+        
+        The error message names the job of the same type that is already
+        downloading the URL, when there is one.
+        
+        Args:
+            task_id: Background task ID of the skipped job
+            user_id: Owner of both jobs
+            url: URL being downloaded
+            download_type: 'audio' or 'video'
+        """
+        running_job_id = (
+            self.filter(user_id=user_id, url=url, download_type=download_type, status__in=ACTIVE_JOB_STATUSES)
+            .exclude(job_id=task_id)
+            .values_list('job_id', flat=True)
+            .first()
+        )
+        if running_job_id:
+            error_message = f"Duplicate of job {running_job_id}, which is already downloading this URL"
+        else:
+            error_message = "The same download is already running"
+        self.fail_queued_job(task_id, error_message)
+
 
 class DownloadJob(models.Model):
     """Primary job tracking table for all download operations."""
@@ -23,8 +94,16 @@ class DownloadJob(models.Model):
         ('video', 'Video'),
     ]
     
+    # Stored as a small integer; the labels are the names used by callers and the API
+    DOWNLOAD_SOURCE_CHOICES = [
+        (0, 'api'),
+        (1, 'website'),
+        (2, 'api_async'),
+    ]
+    DOWNLOAD_SOURCE_IDS = {name: value for value, name in DOWNLOAD_SOURCE_CHOICES}
+    
     # Primary identification
-    job_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, verbose_name="Job ID")
+    job_id = models.UUIDField(default=uuid7, unique=True, editable=False, verbose_name="Job ID")
     task_id = models.UUIDField(null=True, blank=True, verbose_name="Background Task ID")
     
     # Job details
@@ -40,18 +119,20 @@ class DownloadJob(models.Model):
     
     # Error information
     error_message = models.TextField(null=True, blank=True, verbose_name="Error Message")
-    error_details = models.JSONField(null=True, blank=True, verbose_name="Error Details")
+    error_details = models.JSONField(null=True, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder, verbose_name="Error Details")
     
     # Tracking information
     user_ip = models.GenericIPAddressField(null=True, blank=True, verbose_name="User IP Address")
     user_agent = models.TextField(null=True, blank=True, verbose_name="User Agent")
-    download_source = models.CharField(max_length=20, default='api', verbose_name="Download Source")  # 'api', 'website', 'api_async'
+    download_source = models.PositiveSmallIntegerField(choices=DOWNLOAD_SOURCE_CHOICES, default=0, verbose_name="Download Source")
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     started_at = models.DateTimeField(null=True, blank=True, verbose_name="Started At")
     completed_at = models.DateTimeField(null=True, blank=True, verbose_name="Completed At")
     
+    objects = DownloadJobQuerySet.as_manager()
+    
     # Duration calculation
     @property
     def duration_seconds(self):
@@ -60,6 +141,11 @@ class DownloadJob(models.Model):
             return (self.completed_at - self.started_at).total_seconds()
         return None
     
+    @property
+    def download_source_name(self):
+        """Name of the download source ('api', 'website' or 'api_async')."""
+        return self.get_download_source_display()
+    
     class Meta:
         verbose_name = "Download Job"
         verbose_name_plural = "Download Jobs"
@@ -67,12 +153,34 @@ class DownloadJob(models.Model):
         indexes = [
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['status', 'created_at']),
-            models.Index(fields=['job_id']),
+            models.Index(fields=['user', 'status']),
+            models.Index(fields=['user', 'job_id']),
             models.Index(fields=['task_id']),
+            # Partial index over the small set of jobs still in flight
+            models.Index(
+                fields=['created_at'],
+                name='dj_active_created_idx',
+                condition=models.Q(status__in=ACTIVE_JOB_STATUSES),
+            ),
         ]
     
+    def set_status(self, status, **fields):
+        """
+        Move the job to a new status, writing only the columns that changed.
+        
+        Args:
+            status: New status value
+            **fields: Other model fields to update alongside the status
+        """
+        self.status = status
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.save(update_fields=['status', *fields])
+    
     def __str__(self):
-        return f"{self.user.email} - {self.download_type} - {self.status} ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
+        # Only use the email when the user row was already joined; don't query for it
+        owner = self.user.email if DownloadJob.user.is_cached(self) else f"user {self.user_id}"
+        return f"{owner} - {self.download_type} - {self.status} ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
 
 
 class JobMetadata(models.Model):
@@ -97,7 +205,7 @@ class JobMetadata(models.Model):
     fps = models.FloatField(null=True, blank=True, verbose_name="FPS")
     
     # Complete yt-dlp metadata as JSON
-    raw_metadata = models.JSONField(null=True, blank=True, verbose_name="Raw Metadata")
+    raw_metadata = models.JSONField(null=True, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder, verbose_name="Raw Metadata")
     
     # Additional tracking
     download_speed = models.FloatField(null=True, blank=True, verbose_name="Download Speed (MB/s)")
@@ -111,9 +219,10 @@ class JobMetadata(models.Model):
     class Meta:
         verbose_name = "Job Metadata"
         verbose_name_plural = "Job Metadata"
-        ordering = ['-job__created_at']
     
     def __str__(self):
-        return f"Metadata for {self.job}"
+        # Same rule as DownloadJob.__str__: describe the job only if it is already loaded
+        job = self.job if JobMetadata.job.is_cached(self) else f"job {self.job_id}"
+        return f"Metadata for {job}"
 
 # Create your models here.
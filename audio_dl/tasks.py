@@ -9,15 +9,24 @@ from typing import Dict, Any
 from background_task import background
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
 
 # Reuse your existing core downloader
 # (keeps behavior identical between sync and async paths)
 from core.downloaders.audio.download_audio import download_audio
 from core.shared_utils.url_utils import YouTubeURLSanitizer, YouTubeURLError
+from core.shared_utils.db_locks import advisory_lock
 from cookie_management.cookie_manager import get_user_cookies
+from audio_dl.models import DownloadJob
 
+User = get_user_model()
 
-@background(schedule=0)  # Run immediately
+# Fallback output directory when the caller doesn't pass a user-specific one
+_DEFAULT_OUTPUT_DIR = Path(settings.MEDIA_ROOT) / 'downloads' / 'audio'
+
+
+@background(schedule=0, queue='audio')  # Run immediately, on the audio queue
 def process_youtube_audio(url: str, task_id: str = None, output_dir: str = None, user_id: int = None, user_ip: str = None, user_agent: str = None):
     """Download audio for the given URL into user-specific directory.
     
@@ -29,51 +38,71 @@ def process_youtube_audio(url: str, task_id: str = None, output_dir: str = None,
         user_ip: User's IP address
         user_agent: User's browser/agent string
     """
+    # Persistent connections (CONN_MAX_AGE) may have gone stale while the worker idled
+    close_old_connections()
+
     try:
         # Validate YouTube URL before processing
         if not YouTubeURLSanitizer.is_youtube_url(url):
             print(f"Background task {task_id} failed: Invalid YouTube URL")
+            DownloadJob.objects.fail_queued_job(task_id, "Invalid YouTube URL")
             return
 
-        # Get user object for database logging
-        user = None
-        if user_id:
-            from accounts.models import User
-            try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
-                print(f"Background task {task_id} failed: User {user_id} not found")
+        # A task can be picked up again (e.g. after a worker restart); only
+        # start jobs that haven't left the queue yet
+        if task_id:
+            job_status = DownloadJob.objects.filter(job_id=task_id).values_list('status', flat=True).first()
+            if job_status not in (None, 'pending', 'queued'):
+                print(f"Background task {task_id} skipped: job already {job_status}")
                 return
 
-        # Use provided output directory or default to general downloads folder
-        if output_dir:
-            output_path = Path(output_dir)
-        else:
-            output_path = Path(settings.MEDIA_ROOT) / 'downloads' / 'audio'
+        # Concurrent requests for the same user, URL and type download it only once
+        with advisory_lock(user_id or 0, f"audio:{url}") as acquired:
+            if not acquired:
+                print(f"Background task {task_id} skipped: same download already running")
+                DownloadJob.objects.fail_duplicate_job(task_id, user_id, url, 'audio')
+                return
+
+            # Get user object for database logging
+            user = None
+            if user_id:
+                try:
+                    # The downloader and cookie lookup only need the primary key
+                    user = User.objects.only('id').get(id=user_id)
+                except User.DoesNotExist:
+                    print(f"Background task {task_id} failed: User {user_id} not found")
+                    DownloadJob.objects.fail_queued_job(task_id, f"User {user_id} not found")
+                    return
+
+            # Use provided output directory or default to general downloads folder
+            output_path = Path(output_dir) if output_dir else _DEFAULT_OUTPUT_DIR
         
-        # Ensure output directory exists
-        output_path.mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists
+            output_path.mkdir(parents=True, exist_ok=True)
 
-        # Get user cookies for authentication
-        user_cookies = get_user_cookies(user) if user else None
+            # Get user cookies for authentication
+            user_cookies = get_user_cookies(user) if user else None
         
-        # Delegate to the shared downloader with database logging
-        result = download_audio(
-            url, 
-            output_dir=str(output_path),
-            user=user,
-            user_ip=user_ip,
-            user_agent=user_agent,
-            download_source='api_async',
-            task_id=task_id,
-            user_cookies=user_cookies
-        )
+            # Delegate to the shared downloader with database logging
+            result = download_audio(
+                url, 
+                output_dir=str(output_path),
+                user=user,
+                user_ip=user_ip,
+                user_agent=user_agent,
+                download_source='api_async',
+                task_id=task_id,
+                user_cookies=user_cookies
+            )
 
-        # Log the result
-        if result and result.get('success'):
-            print(f"Background task {task_id} completed successfully: {result.get('filename')}")
-        else:
-            print(f"Background task {task_id} failed: {result.get('error') if result else 'Unknown error'}")
+            # Log the result
+            if result and result.get('success'):
+                print(f"Background task {task_id} completed successfully: {result.get('filename')}")
+            else:
+                print(f"Background task {task_id} failed: {result.get('error') if result else 'Unknown error'}")
             
     except Exception as e:
         print(f"Background task {task_id} encountered an exception: {str(e)}")
+        DownloadJob.objects.fail_queued_job(task_id, str(e))
+    finally:
+        close_old_connections()
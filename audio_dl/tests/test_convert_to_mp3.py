@@ -0,0 +1,226 @@
+# audio_dl/tests/test_convert_to_mp3.py
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core.downloaders.audio.audio_helpers import convert_to_mp3 as convert_module
+from core.shared_utils.app_config_snapshot import AudioConfig
+
+
+def _write_partial_output(cmd, timeout):
+    """Stand-in for FFmpeg that writes some output before failing."""
+    with open(cmd[-1], 'wb') as f:
+        f.write(b'partial mp3')
+    return "Error while decoding stream"
+
+
+@patch.object(convert_module, 'AUDIO_CFG', AudioConfig(save_to_mp3=True, remove_original=False))
+@patch.object(convert_module, '_FFMPEG_PATH', 'ffmpeg')
+@patch.object(convert_module, 'av', None)
+class ConvertToMp3TestCase(SimpleTestCase):
+    """Test cases for convert_to_mp3 with the FFmpeg executable."""
+
+    def setUp(self):
+        """Create an input file in a scratch directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.input_file = os.path.join(self.temp_dir, 'song.webm')
+        with open(self.input_file, 'wb') as f:
+            f.write(b'audio')
+        self.output_file = os.path.join(self.temp_dir, 'song.mp3')
+
+    def test_success_moves_output_into_place(self):
+        """Test that the encoded file ends up under the final name only."""
+        def encode(cmd, timeout):
+            with open(cmd[-1], 'wb') as f:
+                f.write(b'mp3')
+            return None
+
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=encode):
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['output_file'], self.output_file)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['song.mp3', 'song.webm'])
+
+    def test_failed_encode_leaves_no_output(self):
+        """Test that a non-zero FFmpeg exit leaves nothing behind to be reused."""
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=_write_partial_output):
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        self.assertFalse(result['success'])
+        self.assertEqual(os.listdir(self.temp_dir), ['song.webm'])
+
+    def test_timed_out_encode_leaves_no_output(self):
+        """Test that a killed FFmpeg run leaves nothing behind to be reused."""
+        def time_out(cmd, timeout):
+            _write_partial_output(cmd, timeout)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=time_out):
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        self.assertFalse(result['success'])
+        self.assertEqual(os.listdir(self.temp_dir), ['song.webm'])
+
+    def test_retry_after_failure_encodes_again(self):
+        """Test that a failed conversion is not reported as cached on the next call."""
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=_write_partial_output):
+            convert_module.convert_to_mp3(self.input_file)
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=_write_partial_output) as mock_ffmpeg:
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        mock_ffmpeg.assert_called_once()
+        self.assertFalse(result['success'])
+
+    def test_up_to_date_output_is_reused(self):
+        """Test that a finished MP3 newer than its input is not encoded again."""
+        with open(self.output_file, 'wb') as f:
+            f.write(b'mp3')
+
+        with patch.object(convert_module, '_run_ffmpeg') as mock_ffmpeg:
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        mock_ffmpeg.assert_not_called()
+        self.assertTrue(result['success'])
+        self.assertTrue(result['cached'])
+
+
+def _fake_convert(input_file, threads=None, output_file=None):
+    """Stand-in for convert_to_mp3; earlier files take longest so they finish last."""
+    time.sleep(0.01 * (3 - int(os.path.basename(input_file)[0])))
+    return {'success': True, 'input_file': input_file, 'output_file': output_file, 'threads': threads}
+
+
+@patch('os.cpu_count', return_value=8)
+class ConvertToMp3BatchTestCase(SimpleTestCase):
+    """Test cases for converting several files concurrently."""
+
+    def test_results_follow_input_order(self, mock_cpu_count):
+        """Test that results come back in input order, not completion order."""
+        input_files = ['/in/0.webm', '/in/1.webm', '/in/2.webm']
+
+        with patch.object(convert_module, 'convert_to_mp3', side_effect=_fake_convert):
+            results = convert_module.convert_to_mp3_batch(input_files)
+
+        self.assertEqual([result['input_file'] for result in results], input_files)
+        # Without output_dir each file is converted next to its input
+        self.assertEqual([result['output_file'] for result in results], [None, None, None])
+
+    def test_output_dir_gives_each_file_its_mp3_path(self, mock_cpu_count):
+        """Test that a shared output directory maps every input to <stem>.mp3 there."""
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+
+        with patch.object(convert_module, 'convert_to_mp3', side_effect=_fake_convert):
+            results = convert_module.convert_to_mp3_batch(['/in/0.song.webm', '/in/1.m4a'], output_dir=output_dir)
+
+        self.assertEqual(
+            [result['output_file'] for result in results],
+            [os.path.join(output_dir, '0.song.mp3'), os.path.join(output_dir, '1.mp3')],
+        )
+
+    def test_workers_and_ffmpeg_threads_share_the_cpus(self, mock_cpu_count):
+        """Test that the pool uses half the CPUs and splits the CPUs between FFmpeg processes."""
+        cases = [
+            # (files, expected workers, expected threads per FFmpeg) with 8 CPUs
+            (1, 1, 8),
+            (3, 3, 2),
+            (10, 4, 2),
+        ]
+        for file_count, workers, threads in cases:
+            with self.subTest(files=file_count):
+                input_files = [f'/in/{i % 3}.webm' for i in range(file_count)]
+                with patch.object(convert_module, 'convert_to_mp3', side_effect=_fake_convert), \
+                        patch.object(convert_module, 'ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_pool:
+                    results = convert_module.convert_to_mp3_batch(input_files)
+
+                mock_pool.assert_called_once_with(max_workers=workers)
+                self.assertEqual({result['threads'] for result in results}, {threads})
+
+    def test_empty_batch(self, mock_cpu_count):
+        """Test that an empty batch starts no pool."""
+        with patch.object(convert_module, 'ThreadPoolExecutor') as mock_pool:
+            self.assertEqual(convert_module.convert_to_mp3_batch([]), [])
+
+        mock_pool.assert_not_called()
+
+
+@patch.object(convert_module, 'AUDIO_CFG', AudioConfig(save_to_mp3=True, remove_original=False))
+class ConvertToMp3EncoderSelectionTestCase(SimpleTestCase):
+    """Test cases for choosing between PyAV and the FFmpeg executable."""
+
+    def setUp(self):
+        """Create an input file in a scratch directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.input_file = os.path.join(self.temp_dir, 'song.webm')
+        with open(self.input_file, 'wb') as f:
+            f.write(b'audio')
+
+    @patch.object(convert_module, '_FFMPEG_PATH', '/usr/bin/ffmpeg')
+    @patch.object(convert_module, 'av', None)
+    def test_without_pyav_falls_back_to_ffmpeg(self):
+        """Test that the FFmpeg executable is used when PyAV isn't installed."""
+        def encode(cmd, timeout):
+            with open(cmd[-1], 'wb') as f:
+                f.write(b'mp3')
+            return None
+
+        with patch.object(convert_module, '_run_ffmpeg', side_effect=encode) as mock_ffmpeg, \
+                patch.object(convert_module, '_encode_mp3_with_pyav') as mock_pyav:
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        mock_pyav.assert_not_called()
+        cmd = mock_ffmpeg.call_args[0][0]
+        self.assertEqual(cmd[0], '/usr/bin/ffmpeg')
+        self.assertIn('libmp3lame', cmd)
+        self.assertTrue(result['success'])
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'song.mp3')))
+
+    @patch.object(convert_module, '_FFMPEG_PATH', None)
+    @patch.object(convert_module, 'av', None)
+    def test_without_pyav_or_ffmpeg_fails(self):
+        """Test that a missing encoder is reported instead of attempted."""
+        result = convert_module.convert_to_mp3(self.input_file)
+
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], "FFmpeg not found in system PATH")
+
+    @patch.object(convert_module, '_FFMPEG_PATH', None)
+    @patch.object(convert_module, 'av', object())
+    def test_pyav_encode_used_when_installed(self):
+        """Test that PyAV encodes in-process, without the FFmpeg executable."""
+        def encode(input_path, output_path):
+            with open(output_path, 'wb') as f:
+                f.write(b'mp3')
+
+        with patch.object(convert_module, '_encode_mp3_with_pyav', side_effect=encode), \
+                patch.object(convert_module, '_run_ffmpeg') as mock_ffmpeg:
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        mock_ffmpeg.assert_not_called()
+        self.assertTrue(result['success'])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['song.mp3', 'song.webm'])
+
+    @patch.object(convert_module, '_FFMPEG_PATH', None)
+    @patch.object(convert_module, 'av', object())
+    def test_failed_pyav_encode_leaves_no_output(self):
+        """Test that a PyAV encode raising partway leaves no MP3 to be reused later."""
+        def encode_then_fail(input_path, output_path):
+            with open(output_path, 'wb') as f:
+                f.write(b'partial mp3')
+            raise RuntimeError("Invalid data found when processing input")
+
+        with patch.object(convert_module, '_encode_mp3_with_pyav', side_effect=encode_then_fail):
+            result = convert_module.convert_to_mp3(self.input_file)
+
+        self.assertFalse(result['success'])
+        self.assertIn("Invalid data found", result['error'])
+        self.assertEqual(os.listdir(self.temp_dir), ['song.webm'])
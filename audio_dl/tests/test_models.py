@@ -0,0 +1,129 @@
+# audio_dl/tests/test_models.py
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from audio_dl.models import DownloadJob, JobMetadata
+from core.downloaders.shared_downloader import DownloadJob as SharedDownloadJob, log_to_database
+
+User = get_user_model()
+
+
+class DownloadJobSetStatusTestCase(TestCase):
+    """Test cases for DownloadJob status transitions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job = DownloadJob.objects.create(
+            user=self.user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+            status='queued',
+        )
+
+    def test_set_status_updates_given_fields(self):
+        """Test that the status and extra fields are persisted."""
+        started_at = timezone.now()
+        self.job.set_status('downloading', started_at=started_at)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, 'downloading')
+        self.assertEqual(self.job.started_at, started_at)
+
+    def test_set_status_writes_only_changed_columns(self):
+        """Test that the UPDATE is limited to the status and extra fields."""
+        with CaptureQueriesContext(connection) as queries:
+            self.job.set_status('failed', error_message='boom')
+
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql']
+        self.assertIn('"status"', sql)
+        self.assertIn('"error_message"', sql)
+        self.assertNotIn('"url"', sql)
+        self.assertNotIn('"user_agent"', sql)
+
+
+class DownloadJobQuerySetTestCase(TestCase):
+    """Test cases for DownloadJob query helpers."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job = DownloadJob.objects.create(
+            user=self.user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+        )
+
+    def test_with_details_joins_user(self):
+        """Test that with_details loads the user without a second query."""
+        with self.assertNumQueries(1):
+            job = DownloadJob.objects.with_details().get(pk=self.job.pk)
+            self.assertIn('test@example.com', str(job))
+
+    def test_str_does_not_query_user(self):
+        """Test that __str__ doesn't lazy-load the user row."""
+        job = DownloadJob.objects.get(pk=self.job.pk)
+        with self.assertNumQueries(0):
+            self.assertIn(f'user {self.user.pk}', str(job))
+
+    def test_metadata_str_does_not_query_job(self):
+        """Test that JobMetadata.__str__ doesn't lazy-load the job or its user."""
+        JobMetadata.objects.create(job=self.job, title='Test')
+        metadata = JobMetadata.objects.get(job=self.job)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(metadata), f'Metadata for job {self.job.pk}')
+
+
+class LogToDatabaseTestCase(TestCase):
+    """Test cases for recording downloader progress in the database."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job = SharedDownloadJob("https://www.youtube.com/watch?v=dQw4w9WgXcQ", 'audio')
+
+    def test_job_and_metadata_are_created_then_updated(self):
+        """Test that repeated logging updates the same job and metadata rows."""
+        self.job.status = 'downloading'
+        self.assertTrue(log_to_database(self.job, user=self.user))
+
+        self.job.status = 'completed'
+        self.job.metadata = {'title': 'First', 'duration': 10}
+        self.assertTrue(log_to_database(self.job, user=self.user))
+        self.job.metadata = {'title': 'Second', 'duration': 10}
+        self.assertTrue(log_to_database(self.job, user=self.user))
+
+        db_job = DownloadJob.objects.get(job_id=self.job.job_id)
+        self.assertEqual(db_job.status, 'completed')
+        self.assertEqual(JobMetadata.objects.get(job=db_job).title, 'Second')
+
+    def test_later_transitions_are_a_single_update(self):
+        """Test that once the row is known, a status change costs one query."""
+        self.job.status = 'downloading'
+        self.assertTrue(log_to_database(self.job, user=self.user))
+
+        self.job.status = 'failed'
+        with self.assertNumQueries(1):
+            self.assertTrue(log_to_database(self.job, user=self.user))
+        self.assertEqual(DownloadJob.objects.get(job_id=self.job.job_id).status, 'failed')
+
+    def test_download_source_is_stored_as_code(self):
+        """Test that the source name is stored as its integer code."""
+        self.assertTrue(log_to_database(self.job, user=self.user, download_source='website'))
+
+        db_job = DownloadJob.objects.get(job_id=self.job.job_id)
+        self.assertEqual(db_job.download_source, 1)
+        self.assertEqual(db_job.download_source_name, 'website')
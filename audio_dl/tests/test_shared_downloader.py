@@ -0,0 +1,79 @@
+# audio_dl/tests/test_shared_downloader.py
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core.downloaders import shared_downloader
+
+
+def _fake_download_media(url, download_type, output_dir=None, **kwargs):
+    """Stand-in for download_media; later URLs finish first, 'bad' URLs fail."""
+    time.sleep(0.05 if url.endswith('1') else 0)
+    if 'bad' in url:
+        return {'success': False, 'filename': None, 'error': f"Unavailable: {url}"}
+    return {'success': True, 'filename': f"{url[-1]}.{download_type}", 'error': None}
+
+
+@patch.object(shared_downloader, 'connection')
+@patch.object(shared_downloader, 'download_media', side_effect=_fake_download_media)
+class DownloadMediaBatchAsyncTestCase(SimpleTestCase):
+    """Test cases for the concurrent batch download helper."""
+
+    def test_results_follow_input_order(self, mock_download, mock_connection):
+        """Test that results line up with the URLs even when they finish out of order."""
+        urls = ["https://youtu.be/video1", "https://youtu.be/video2", "https://youtu.be/video3"]
+
+        results = asyncio.run(shared_downloader.download_media_batch_async(urls, "audio", "/tmp/out", user_ip="127.0.0.1"))
+
+        self.assertEqual([result['filename'] for result in results], ["1.audio", "2.audio", "3.audio"])
+        self.assertEqual(mock_download.call_count, 3)
+        mock_download.assert_any_call(urls[0], "audio", "/tmp/out", user_ip="127.0.0.1")
+        # Each worker thread closes its own database connection
+        self.assertEqual(mock_connection.close.call_count, 3)
+
+    def test_failed_urls_return_their_own_errors(self, mock_download, mock_connection):
+        """Test that one failed URL doesn't affect the results of the others."""
+        urls = ["https://youtu.be/video1", "https://youtu.be/bad2", "https://youtu.be/video3"]
+
+        results = asyncio.run(shared_downloader.download_media_batch_async(urls, "video"))
+
+        self.assertEqual([result['success'] for result in results], [True, False, True])
+        self.assertEqual(results[1]['error'], "Unavailable: https://youtu.be/bad2")
+        self.assertIsNone(results[0]['error'])
+
+
+class DownloadMediaFilepathTestCase(SimpleTestCase):
+    """Test cases for locating the file download_media produced."""
+
+    def setUp(self):
+        """Create the postprocessed file yt-dlp would leave behind."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.mp3_path = os.path.join(self.temp_dir, 'Some_Title.mp3')
+        with open(self.mp3_path, 'wb') as f:
+            f.write(b'mp3 data')
+
+    @patch.object(shared_downloader, 'YoutubeDL')
+    def test_uses_final_path_reported_by_yt_dlp(self, mock_ydl_class):
+        """Test that the postprocessed path comes from requested_downloads, not a guessed extension."""
+        ydl = mock_ydl_class.return_value.__enter__.return_value
+        ydl.extract_info.return_value = {
+            'title': 'Some Title',
+            'requested_downloads': [{'filepath': self.mp3_path}],
+        }
+        ydl.sanitize_info.side_effect = lambda info: info
+        ydl.prepare_filename.return_value = os.path.join(self.temp_dir, 'Some_Title.webm')
+
+        result = shared_downloader.download_media(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "audio", self.temp_dir
+        )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['filepath'], self.mp3_path)
+        self.assertEqual(result['filename'], 'Some_Title.mp3')
+        ydl.prepare_filename.assert_not_called()
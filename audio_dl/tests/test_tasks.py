@@ -0,0 +1,111 @@
+# audio_dl/tests/test_tasks.py
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from audio_dl.models import DownloadJob
+from audio_dl.tasks import process_youtube_audio
+
+User = get_user_model()
+
+
+class AudioDownloadTaskTestCase(TestCase):
+    """Test cases for the audio download background task."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.job = DownloadJob.objects.create(
+            user=self.user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+            status='completed',
+        )
+
+    @patch('audio_dl.tasks.download_audio')
+    def test_finished_job_is_not_downloaded_again(self, mock_download):
+        """Test that a re-run task for a finished job is skipped."""
+        process_youtube_audio.now(self.job.url, task_id=str(self.job.job_id), user_id=self.user.id)
+
+        mock_download.assert_not_called()
+
+    @patch('audio_dl.tasks.download_audio')
+    @patch('audio_dl.tasks.advisory_lock', return_value=nullcontext(False))
+    def test_duplicate_download_is_skipped(self, mock_lock, mock_download):
+        """Test that the task backs off while the same user and URL are being downloaded."""
+        self.job.set_status('queued')
+        process_youtube_audio.now(self.job.url, task_id=str(self.job.job_id), user_id=self.user.id)
+
+        mock_lock.assert_called_once_with(self.user.id, f"audio:{self.job.url}")
+        mock_download.assert_not_called()
+
+    @patch('audio_dl.tasks.download_audio')
+    @patch('audio_dl.tasks.advisory_lock', return_value=nullcontext(False))
+    def test_duplicate_download_fails_queued_job(self, mock_lock, mock_download):
+        """Test that a skipped duplicate closes its queued job and names the running one."""
+        self.job.set_status('downloading')
+        duplicate = DownloadJob.objects.create(
+            user=self.user,
+            url=self.job.url,
+            download_type='audio',
+            status='queued',
+        )
+        process_youtube_audio.now(duplicate.url, task_id=str(duplicate.job_id), user_id=self.user.id)
+
+        duplicate.refresh_from_db()
+        self.assertEqual(duplicate.status, 'failed')
+        self.assertIn(str(self.job.job_id), duplicate.error_message)
+        self.assertIsNotNone(duplicate.completed_at)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, 'downloading')
+
+    @patch('audio_dl.tasks.download_audio')
+    def test_invalid_url_fails_queued_job(self, mock_download):
+        """Test that a task rejecting its URL does not leave the job queued."""
+        self.job.set_status('queued')
+        process_youtube_audio.now("https://example.com/video", task_id=str(self.job.job_id), user_id=self.user.id)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, 'failed')
+        self.assertEqual(self.job.error_message, "Invalid YouTube URL")
+        mock_download.assert_not_called()
+
+    @patch('audio_dl.tasks.download_audio')
+    def test_missing_user_fails_queued_job(self, mock_download):
+        """Test that a task whose user is gone does not leave the job queued."""
+        self.job.set_status('queued')
+        process_youtube_audio.now(self.job.url, task_id=str(self.job.job_id), user_id=self.user.id + 1000)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, 'failed')
+        self.assertIn("not found", self.job.error_message)
+        mock_download.assert_not_called()
+
+    @patch('audio_dl.tasks.download_audio')
+    @patch('audio_dl.tasks.advisory_lock', return_value=nullcontext(False))
+    def test_duplicate_message_ignores_other_download_types(self, mock_lock, mock_download):
+        """Test that a running video download of the URL isn't named as the audio job's duplicate."""
+        self.job.set_status('failed')
+        video_job = DownloadJob.objects.create(
+            user=self.user,
+            url=self.job.url,
+            download_type='video',
+            status='downloading',
+        )
+        duplicate = DownloadJob.objects.create(
+            user=self.user,
+            url=self.job.url,
+            download_type='audio',
+            status='queued',
+        )
+        process_youtube_audio.now(duplicate.url, task_id=str(duplicate.job_id), user_id=self.user.id)
+
+        duplicate.refresh_from_db()
+        self.assertEqual(duplicate.status, 'failed')
+        self.assertNotIn(str(video_job.job_id), duplicate.error_message)
+        self.assertEqual(duplicate.error_message, "The same download is already running")
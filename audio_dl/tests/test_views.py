@@ -1,3 +1,212 @@
-from django.test import TestCase
+# audio_dl/tests/test_views.py
+import os
+import tempfile
+import uuid
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from audio_dl.models import DownloadJob, JobMetadata
+
+User = get_user_model()
+
+
+class AudioJobStatusAPITestCase(APITestCase):
+    """Test cases for the audio job status/result endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.job = DownloadJob.objects.create(
+            user=self.user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+            status='downloading',
+        )
+
+    def test_job_status_found(self):
+        """Test status lookup for the owner's job."""
+        # One query, with no deferred-field reloads while building the response
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/jobs/{self.job.job_id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'downloading')
+        self.assertEqual(response.data['download_source'], 'api')
+
+    def test_job_status_unknown_job(self):
+        """Test status lookup for a job id that does not exist."""
+        response = self.client.get(f'/api/jobs/{uuid.uuid4()}/')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_job_status_other_users_job(self):
+        """Test that a user cannot see another user's job."""
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(f'/api/jobs/{self.job.job_id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_job_result_not_completed(self):
+        """Test result lookup while the job is still running."""
+        response = self.client.get(f'/api/jobs/{self.job.job_id}/result/')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+    @patch('audio_dl.api._DOWNLOAD_TO_REMOTE', False)
+    def test_job_result_completed_server_storage(self):
+        """Test result lookup for a finished job kept on the server."""
+        with tempfile.NamedTemporaryFile(suffix='.m4a') as audio_file:
+            self.job.status = 'completed'
+            self.job.filename = os.path.basename(audio_file.name)
+            self.job.filepath = audio_file.name
+            self.job.save()
+            JobMetadata.objects.create(job=self.job, raw_metadata={'title': 'Test'})
+
+            response = self.client.get(f'/api/jobs/{self.job.job_id}/result/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['metadata'], {'title': 'Test'})
+
+
+class AudioDownloadQueueAPITestCase(APITestCase):
+    """Test cases for queuing audio downloads."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+    @patch('audio_dl.tasks.process_youtube_audio')
+    def test_download_is_queued(self, mock_task):
+        """Test that the download endpoint queues a job that can be polled."""
+        response = self.client.post('/api/download-audio/', {'url': self.test_url})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_task.assert_called_once()
+        task_id = response.data['task_id']
+
+        job = DownloadJob.objects.get(job_id=task_id)
+        self.assertEqual(job.status, 'queued')
+
+        status_response = self.client.get(f'/api/jobs/{task_id}/')
+        self.assertEqual(status_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(status_response.data['status'], 'queued')
+
+    def test_download_invalid_url(self):
+        """Test that invalid URLs are rejected before queuing."""
+        response = self.client.post('/api/download-audio/', {'url': 'https://invalid-url.com'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(DownloadJob.objects.exists())
+
+
+class AudioJobStatusBulkAPITestCase(APITestCase):
+    """Test cases for the batch job status endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.jobs = [
+            DownloadJob.objects.create(
+                user=self.user,
+                url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                download_type='audio',
+                status=job_status,
+            )
+            for job_status in ('queued', 'completed')
+        ]
+        self.other_job = DownloadJob.objects.create(
+            user=self.other_user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+            status='queued',
+        )
+
+    def test_bulk_status(self):
+        """Test that several jobs are returned in one response, keyed by id."""
+        ids = [str(job.job_id) for job in self.jobs]
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/jobs/status/', {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[ids[0]]['status'], 'queued')
+        self.assertEqual(response.data[ids[1]]['status'], 'completed')
+
+    def test_bulk_status_skips_other_users_and_unknown_ids(self):
+        """Test that foreign, unknown and malformed ids are left out."""
+        ids = [str(self.other_job.job_id), str(uuid.uuid4()), 'not-a-uuid']
+        response = self.client.post('/api/jobs/status/', {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {})
+
+    def test_bulk_status_too_many_ids(self):
+        """Test that oversized batches are rejected."""
+        ids = [str(uuid.uuid4()) for _ in range(101)]
+        response = self.client.post('/api/jobs/status/', {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AudioJobResultXAccelTestCase(APITestCase):
+    """Test cases for handing result downloads to nginx."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        self.filepath = os.path.join(self.media_root.name, 'Café.m4a')
+        with open(self.filepath, 'wb') as f:
+            f.write(b'audio')
+
+        self.job = DownloadJob.objects.create(
+            user=self.user,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            download_type='audio',
+            status='completed',
+            filename='Café.m4a',
+            filepath=self.filepath,
+        )
+
+    @patch('audio_dl.api._DOWNLOAD_TO_REMOTE', True)
+    @patch.dict('core.shared_utils.response_utils.APP_CONFIG', {'download': {'use_xaccel': 'true', 'xaccel_prefix': '/protected/'}})
+    def test_result_uses_x_accel_redirect(self):
+        """Test that the file is handed to nginx with an RFC 5987 filename."""
+        with self.settings(MEDIA_ROOT=self.media_root.name):
+            response = self.client.get(f'/api/jobs/{self.job.job_id}/result/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected/Caf%C3%A9.m4a')
+        self.assertIn("filename*=utf-8''Caf%C3%A9.m4a", response['Content-Disposition'])
+        self.assertEqual(response.content, b'')
@@ -1,11 +1,12 @@
 # youtube_downloader/audio_dl/views.py
-from django.http import HttpResponseBadRequest, FileResponse, JsonResponse
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from core.downloaders.audio.download_audio import download_audio
 from core.downloaders.shared_downloader import get_file_info
 from core.shared_utils.app_config import APP_CONFIG
+from core.shared_utils.response_utils import file_download_response
 from core.shared_utils.security_utils import get_client_ip, log_request_info
 from core.shared_utils.rate_limiting import get_download_stats, is_ip_allowed
 from cookie_management.cookie_manager import get_user_cookies
@@ -48,8 +49,7 @@ def index(request):
             
             if download_to_remote:
                 # Return the file (current behavior - download dialog)
-                fileobj = open(result['filepath'], "rb")
-                return FileResponse(fileobj, as_attachment=True, filename=result['filename'])
+                return file_download_response(result['filepath'], result['filename'])
             else:
                 # Server-only storage - show success message and redirect
                 messages.success(request, f'Audio downloaded successfully to server: {result["filename"]}')
@@ -71,14 +71,9 @@ def index(request):
     client_ip = get_client_ip(request)
     download_stats = get_download_stats(client_ip)
     
-    # Get cookie status
-    from cookie_management.cookie_manager import get_cookie_status
-    cookie_status = get_cookie_status(request.user)
-    
     context = {
         'download_stats': download_stats,
-        'ip_allowed': is_ip_allowed(client_ip),
-        'cookie_status': cookie_status
+        'ip_allowed': is_ip_allowed(client_ip)
     }
     
     return render(request, "audio_dl/download_form.html", context)
@@ -6,26 +6,60 @@ for YouTube authentication to bypass bot detection.
 """
 
 import os
+import re
 import json
+import time
 import base64
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.core.cache import cache
 from django.contrib.auth.models import User
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("cookie_manager")
 
+# Non-comment lines with any content, and the subset naming a YouTube/Google domain
+_DATA_LINE_RE = re.compile(r'^(?!#)[^\n]*\S', re.MULTILINE)
+_YOUTUBE_LINE_RE = re.compile(r'^(?!#)[^\n]*(?:youtube|google)\.com[^\n]*', re.MULTILINE)
+
+# First byte of every Fernet token
+_FERNET_VERSION = b'\x80'
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _json_loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CookieManager:
     """Manages secure storage and retrieval of user cookies."""
     
+    # How long stored cookies stay valid after upload
+    COOKIE_LIFETIME = timedelta(days=7)
+    
     def __init__(self):
         self.cookie_storage_dir = Path(settings.BASE_DIR) / "secure_cookies"
         self.cookie_storage_dir.mkdir(exist_ok=True, mode=0o700)  # Secure directory
         self._encryption_key = self._get_or_create_encryption_key()
+        # Build the cipher once; Fernet splits and validates the key on construction
+        self._fernet = Fernet(self._encryption_key)
     
     def _get_or_create_encryption_key(self) -> bytes:
         """Get or create encryption key for cookie storage."""
@@ -43,18 +77,166 @@ class CookieManager:
             logger.info("Generated new encryption key for cookie storage")
             return key
     
-    def _encrypt_cookies(self, cookies_data: str) -> str:
-        """Encrypt cookie data."""
-        fernet = Fernet(self._encryption_key)
-        encrypted_data = fernet.encrypt(cookies_data.encode())
-        return base64.b64encode(encrypted_data).decode()
+    def _encrypt_cookies(self, cookies_data: bytes) -> bytes:
+        """Encrypt cookie data to raw token bytes (the Fernet token without its base64 text layer)."""
+        return base64.urlsafe_b64decode(self._fernet.encrypt(cookies_data))
+    
+    def _decrypt_cookies(self, encrypted_data: bytes) -> bytes:
+        """Decrypt raw token bytes to the serialized JSON bytes."""
+        return self._fernet.decrypt(base64.urlsafe_b64encode(encrypted_data))
+    
+    def _decrypt_legacy_cookies(self, encrypted_data: bytes) -> bytes:
+        """Decrypt a file written as a text Fernet token, possibly base64-encoded again."""
+        try:
+            return self._fernet.decrypt(encrypted_data)
+        except InvalidToken:
+            return self._fernet.decrypt(base64.b64decode(encrypted_data))
+    
+    def _write_cookie_file(self, user_id: int, encrypted_data: bytes) -> None:
+        """
+        Write the encrypted cookie file.
+        
+        Writes a temp file and renames it over the old one so readers never
+        see a partial file and each write gets a new inode.
+        """
+        user_cookie_file = self._cookie_file(user_id)
+        temp_file = user_cookie_file.with_suffix(".tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(encrypted_data)
+        temp_file.chmod(0o600)  # Secure file permissions
+        os.replace(temp_file, user_cookie_file)
+    
+    def _read_cookie_file(self, user_id: int) -> Dict[str, Any]:
+        """
+        Read and decrypt the user's cookie file.
+        
+        Files in the older text format are rewritten as raw token bytes
+        the first time they are read.
+        
+        Returns:
+            The decrypted cookie data
+        """
+        with open(self._cookie_file(user_id), 'rb') as f:
+            encrypted_data = f.read()
+        
+        # Raw tokens start with the Fernet version byte; text tokens are ASCII
+        if encrypted_data[:1] == _FERNET_VERSION:
+            return _json_loads(self._decrypt_cookies(encrypted_data))
+        
+        decrypted_data = self._decrypt_legacy_cookies(encrypted_data.strip())
+        # The mtime is the upload time for has_cookies and the cleanup cutoff;
+        # carry it over so migrating doesn't make old cookies look fresh
+        user_cookie_file = self._cookie_file(user_id)
+        legacy_stat = user_cookie_file.stat()
+        self._write_cookie_file(user_id, self._encrypt_cookies(decrypted_data))
+        os.utime(user_cookie_file, ns=(legacy_stat.st_atime_ns, legacy_stat.st_mtime_ns))
+        logger.info(f"Migrated cookie file for user {user_id} to binary format")
+        return _json_loads(decrypted_data)
+    
+    def _cookie_file(self, user_id) -> Path:
+        """Path of the user's encrypted cookie file."""
+        return self.cookie_storage_dir / f"user_{user_id}_cookies.enc"
+    
+    @staticmethod
+    def _stat_version(stat: os.stat_result) -> str:
+        """Identify a cookie file by inode, mtime and size."""
+        return f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    def _cookie_file_version(self, user_id: int) -> Optional[str]:
+        """Identify the current cookie file by inode, mtime and size, or None if there is none."""
+        try:
+            stat = self._cookie_file(user_id).stat()
+        except FileNotFoundError:
+            return None
+        return self._stat_version(stat)
+    
+    def _meta_file(self, user_id: int) -> Path:
+        """Plaintext sidecar holding the non-secret cookie metadata."""
+        return self.cookie_storage_dir / f"user_{user_id}_cookies.meta.json"
+    
+    def _write_cookie_meta(self, user_id: int, cookie_data: Dict[str, Any], version: Optional[str]) -> Dict[str, Any]:
+        """
+        Write the status fields (never the cookie content) to the sidecar and cache.
+        
+        The metadata carries the version of the cookie file it describes, so
+        readers can tell when another worker has replaced that file since.
+        """
+        meta = {key: cookie_data[key] for key in ("source", "uploaded_at", "expires_at")}
+        meta["version"] = version
+        meta_file = self._meta_file(user_id)
+        with open(meta_file, 'wb') as f:
+            f.write(_json_dumps(meta))
+        meta_file.chmod(0o600)
+        cache.set(f"user_cookies_meta:{user_id}", meta, timeout=86400)
+        return meta
+    
+    def _read_meta_file(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Read the sidecar from disk, bypassing the cache; None if there is none."""
+        try:
+            with open(self._meta_file(user_id), 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+    
+    def _load_cookie_meta(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Load cookie metadata without decrypting the cookie file.
+        
+        Cached and sidecar metadata are only used while they match the
+        current cookie file's version. Falls back to one decrypt for files
+        whose sidecar is missing or stale (including sidecars written before
+        they carried a version), and rewrites the sidecar so later checks
+        stay cheap.
+        
+        Returns:
+            Dict with source/uploaded_at/expires_at, or None if no cookies are stored
+        """
+        # One stat; a missing file means no cookies, whatever any cache says
+        version = self._cookie_file_version(user_id)
+        if version is None:
+            return None
+        
+        cache_key = f"user_cookies_meta:{user_id}"
+        meta = cache.get(cache_key)
+        if meta and meta.get("version") == version:
+            return meta
+        
+        meta = self._read_meta_file(user_id)
+        if meta and meta.get("version") == version:
+            cache.set(cache_key, meta, timeout=86400)
+            return meta
+        
+        # Re-stat after the read in case a legacy file was rewritten
+        cookie_data = self._read_cookie_file(user_id)
+        return self._write_cookie_meta(user_id, cookie_data, self._cookie_file_version(user_id))
+    
+    def _remove_if_expired(self, user_id: int) -> bool:
+        """
+        Remove the user's cookie files if the cookies on disk have expired.
+        
+        Decides from the sidecar re-read from disk (or the decrypted file if
+        the sidecar doesn't match it), never from cached metadata: another
+        worker may have uploaded fresh cookies since that was cached.
+        
+        Returns:
+            True if the files were removed
+        """
+        version = self._cookie_file_version(user_id)
+        if version is None:
+            return False
+        meta = self._read_meta_file(user_id)
+        if not meta or meta.get("version") != version:
+            meta = self._read_cookie_file(user_id)
+        if datetime.now() < datetime.fromisoformat(meta["expires_at"]):
+            return False
+        self._remove_cookie_files(user_id)
+        return True
     
-    def _decrypt_cookies(self, encrypted_data: str) -> str:
-        """Decrypt cookie data."""
-        fernet = Fernet(self._encryption_key)
-        decoded_data = base64.b64decode(encrypted_data.encode())
-        decrypted_data = fernet.decrypt(decoded_data)
-        return decrypted_data.decode()
+    def _remove_cookie_files(self, user_id: int) -> None:
+        """Remove a user's cookie file, its sidecar and both cache entries."""
+        cache.delete_many([f"user_cookies:{user_id}", f"user_cookies_meta:{user_id}"])
+        for path in (self._cookie_file(user_id), self._meta_file(user_id)):
+            path.unlink(missing_ok=True)
     
     def store_user_cookies(self, user: User, cookies_content: str, source: str = "upload") -> Dict[str, Any]:
         """
@@ -88,17 +270,16 @@ class CookieManager:
             }
             
             # Encrypt the entire cookie data
-            encrypted_data = self._encrypt_cookies(json.dumps(cookie_data))
+            encrypted_data = self._encrypt_cookies(_json_dumps(cookie_data))
             
             # Store in user-specific file
-            user_cookie_file = self.cookie_storage_dir / f"user_{user.id}_cookies.enc"
-            with open(user_cookie_file, 'w') as f:
-                f.write(encrypted_data)
-            user_cookie_file.chmod(0o600)  # Secure file permissions
+            self._write_cookie_file(user.id, encrypted_data)
+            version = self._cookie_file_version(user.id)
+            self._write_cookie_meta(user.id, cookie_data, version)
             
             # Cache for quick access
             cache_key = f"user_cookies:{user.id}"
-            cache.set(cache_key, cookie_data, timeout=3600)  # 1 hour cache
+            cache.set(cache_key, {**cookie_data, "version": version}, timeout=3600)  # 1 hour cache
             
             logger.info(f"Stored encrypted cookies for user {user.username} (ID: {user.id})")
             
@@ -127,11 +308,18 @@ class CookieManager:
             Raw cookies content or None if not found/expired
         """
         try:
+            # The cached copy is only valid for the file it was decrypted from;
+            # another worker may have replaced or deleted it since
+            version = self._cookie_file_version(user.id)
+            if version is None:
+                logger.debug(f"No cookie file found for user {user.id}")
+                return None
+            
             # Check cache first
             cache_key = f"user_cookies:{user.id}"
             cached_data = cache.get(cache_key)
             
-            if cached_data:
+            if cached_data and cached_data.get("version") == version:
                 # Check if expired
                 expires_at = datetime.fromisoformat(cached_data["expires_at"])
                 if datetime.now() < expires_at:
@@ -142,28 +330,19 @@ class CookieManager:
                     cache.delete(cache_key)
                     logger.info(f"Cookies expired for user {user.id}")
             
-            # Load from file
-            user_cookie_file = self.cookie_storage_dir / f"user_{user.id}_cookies.enc"
-            if not user_cookie_file.exists():
-                logger.debug(f"No cookie file found for user {user.id}")
-                return None
-            
-            with open(user_cookie_file, 'r') as f:
-                encrypted_data = f.read()
-            
-            # Decrypt and parse
-            decrypted_data = self._decrypt_cookies(encrypted_data)
-            cookie_data = json.loads(decrypted_data)
+            # Load from file, then re-stat in case a legacy file was rewritten
+            cookie_data = self._read_cookie_file(user.id)
+            version = self._cookie_file_version(user.id)
             
             # Check expiry
             expires_at = datetime.fromisoformat(cookie_data["expires_at"])
             if datetime.now() >= expires_at:
                 logger.info(f"Cookies expired for user {user.id}, removing file")
-                user_cookie_file.unlink()
+                self._remove_cookie_files(user.id)
                 return None
             
             # Cache for future use
-            cache.set(cache_key, cookie_data, timeout=3600)
+            cache.set(cache_key, {**cookie_data, "version": version}, timeout=3600)
             
             logger.debug(f"Retrieved cookies from file for user {user.id}")
             return cookie_data["content"]
@@ -183,23 +362,22 @@ class CookieManager:
             Dict with validation result and details
         """
         try:
-            lines = cookies_content.strip().split('\n')
+            content = cookies_content.strip()
             
             # Skip comments and empty lines
-            cookie_lines = [line.strip() for line in lines if line.strip() and not line.startswith('#')]
-            
-            if not cookie_lines:
+            if not _DATA_LINE_RE.search(content):
                 return {
                     "valid": False,
                     "error": "No cookie data found (only comments or empty lines)"
                 }
             
-            # Check for Netscape format
+            # Check for Netscape format. Only lines mentioning a YouTube/Google
+            # domain can count, so let the regex pick those out in one pass
             valid_cookies = 0
             youtube_domains = set()
             
-            for line in cookie_lines:
-                parts = line.split('\t')
+            for line in _YOUTUBE_LINE_RE.findall(content):
+                parts = line.strip().split('\t')
                 if len(parts) >= 7:  # Netscape format has 7 tab-separated fields
                     domain = parts[0]
                     if 'youtube.com' in domain or 'google.com' in domain:
@@ -229,6 +407,9 @@ class CookieManager:
         """
         Get cookie status and metadata for a user.
         
+        Reads the cached or sidecar metadata only; the encrypted cookie file
+        is not decrypted.
+        
         Args:
             user: Django User instance
         
@@ -236,25 +417,8 @@ class CookieManager:
             Dict with cookie status information
         """
         try:
-            # Check cache first
-            cache_key = f"user_cookies:{user.id}"
-            cached_data = cache.get(cache_key)
-            
-            if cached_data:
-                expires_at = datetime.fromisoformat(cached_data["expires_at"])
-                is_expired = datetime.now() >= expires_at
-                
-                return {
-                    "has_cookies": not is_expired,
-                    "expires_at": cached_data["expires_at"],
-                    "source": cached_data["source"],
-                    "uploaded_at": cached_data["uploaded_at"],
-                    "expires_in_hours": max(0, (expires_at - datetime.now()).total_seconds() / 3600)
-                }
-            
-            # Check file
-            user_cookie_file = self.cookie_storage_dir / f"user_{user.id}_cookies.enc"
-            if not user_cookie_file.exists():
+            meta = self._load_cookie_meta(user.id)
+            if not meta:
                 return {
                     "has_cookies": False,
                     "expires_at": None,
@@ -263,32 +427,25 @@ class CookieManager:
                     "expires_in_hours": 0
                 }
             
-            # Load and check expiry
-            with open(user_cookie_file, 'r') as f:
-                encrypted_data = f.read()
-            
-            decrypted_data = self._decrypt_cookies(encrypted_data)
-            cookie_data = json.loads(decrypted_data)
-            
-            expires_at = datetime.fromisoformat(cookie_data["expires_at"])
+            expires_at = datetime.fromisoformat(meta["expires_at"])
             is_expired = datetime.now() >= expires_at
             
             if is_expired:
-                # Clean up expired file
-                user_cookie_file.unlink()
+                # Clean up expired file (re-checked against the file on disk)
+                self._remove_if_expired(user.id)
                 return {
                     "has_cookies": False,
-                    "expires_at": cookie_data["expires_at"],
-                    "source": cookie_data["source"],
-                    "uploaded_at": cookie_data["uploaded_at"],
+                    "expires_at": meta["expires_at"],
+                    "source": meta["source"],
+                    "uploaded_at": meta["uploaded_at"],
                     "expires_in_hours": 0
                 }
             
             return {
                 "has_cookies": True,
-                "expires_at": cookie_data["expires_at"],
-                "source": cookie_data["source"],
-                "uploaded_at": cookie_data["uploaded_at"],
+                "expires_at": meta["expires_at"],
+                "source": meta["source"],
+                "uploaded_at": meta["uploaded_at"],
                 "expires_in_hours": (expires_at - datetime.now()).total_seconds() / 3600
             }
             
@@ -303,6 +460,36 @@ class CookieManager:
                 "error": str(e)
             }
     
+    def has_cookies(self, user: User) -> bool:
+        """
+        Cheap presence check for pages that only need the has-cookies flag.
+        
+        Stats the cookie file once; cached cookies or metadata are used only
+        while they match that file's version, otherwise the file's mtime
+        (written at upload time) stands in for decrypting it. Nothing is
+        assumed from the cache alone: another worker may have uploaded or
+        deleted the file, and the default cache is per process.
+        
+        Args:
+            user: Django User instance
+        
+        Returns:
+            True if the user has unexpired cookies stored
+        """
+        try:
+            stat = self._cookie_file(user.id).stat()
+        except FileNotFoundError:
+            return False
+        
+        version = self._stat_version(stat)
+        cached = cache.get_many([f"user_cookies:{user.id}", f"user_cookies_meta:{user.id}"])
+        for cached_data in cached.values():
+            if cached_data.get("version") == version:
+                return datetime.now() < datetime.fromisoformat(cached_data["expires_at"])
+        
+        uploaded_at = datetime.fromtimestamp(stat.st_mtime)
+        return datetime.now() < uploaded_at + self.COOKIE_LIFETIME
+    
     def delete_user_cookies(self, user: User) -> bool:
         """
         Delete stored cookies for a user.
@@ -314,14 +501,8 @@ class CookieManager:
             True if successful, False otherwise
         """
         try:
-            # Remove from cache
-            cache_key = f"user_cookies:{user.id}"
-            cache.delete(cache_key)
-            
-            # Remove file
-            user_cookie_file = self.cookie_storage_dir / f"user_{user.id}_cookies.enc"
-            if user_cookie_file.exists():
-                user_cookie_file.unlink()
+            # Remove from cache and disk, sidecar included
+            self._remove_cookie_files(user.id)
             
             logger.info(f"Deleted cookies for user {user.username} (ID: {user.id})")
             return True
@@ -332,7 +513,7 @@ class CookieManager:
     
     def _calculate_expiry(self) -> datetime:
         """Calculate cookie expiry time (7 days from now)."""
-        return datetime.now() + timedelta(days=7)
+        return datetime.now() + self.COOKIE_LIFETIME
     
     def cleanup_expired_cookies(self) -> int:
         """
@@ -343,24 +524,29 @@ class CookieManager:
         """
         cleaned_count = 0
         try:
-            for cookie_file in self.cookie_storage_dir.glob("user_*_cookies.enc"):
+            # Files are rewritten on every store, so anything modified within the
+            # cookie lifetime cannot have expired yet; skip those without reading them
+            cutoff = time.time() - self.COOKIE_LIFETIME.total_seconds()
+            
+            with os.scandir(self.cookie_storage_dir) as entries:
+                candidates = [
+                    entry for entry in entries
+                    if entry.name.startswith("user_") and entry.name.endswith("_cookies.enc")
+                    and entry.stat().st_mtime <= cutoff
+                ]
+            
+            for entry in candidates:
+                cookie_file = Path(entry.path)
+                user_id = entry.name[len("user_"):-len("_cookies.enc")]
                 try:
-                    with open(cookie_file, 'r') as f:
-                        encrypted_data = f.read()
-                    
-                    decrypted_data = self._decrypt_cookies(encrypted_data)
-                    cookie_data = json.loads(decrypted_data)
-                    
-                    expires_at = datetime.fromisoformat(cookie_data["expires_at"])
-                    if datetime.now() >= expires_at:
-                        cookie_file.unlink()
+                    if self._remove_if_expired(user_id):
                         cleaned_count += 1
                         logger.debug(f"Cleaned up expired cookie file: {cookie_file}")
                         
                 except Exception as e:
                     logger.warning(f"Failed to process cookie file {cookie_file}: {e}")
                     # If we can't decrypt, assume it's corrupted and delete
-                    cookie_file.unlink()
+                    self._remove_cookie_files(user_id)
                     cleaned_count += 1
             
             if cleaned_count > 0:
@@ -389,3 +575,8 @@ def store_user_cookies(user: User, cookies_content: str, source: str = "upload")
 def get_cookie_status(user: User) -> Dict[str, Any]:
     """Convenience function to get cookie status."""
     return cookie_manager.get_cookie_status(user)
+
+
+def has_user_cookies(user: User) -> bool:
+    """Convenience function for the cheap cookie presence check."""
+    return cookie_manager.has_cookies(user)
@@ -2,24 +2,126 @@
 Audio conversion utilities for YouTube downloader.
 
 This module provides functions to convert downloaded audio files to MP3 format
-using FFmpeg, with integration to the application configuration system.
+using FFmpeg (in-process through PyAV when it is installed, otherwise the ffmpeg
+executable), with integration to the application configuration system.
 """
 
 import os
 import subprocess
 import shutil
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, List, Optional
 
 from core.shared_utils.path_utils import resolve_path
-from core.shared_utils.app_config import APP_CONFIG
+from core.shared_utils.app_config_snapshot import AUDIO_CFG
+
+try:
+    import av
+except ImportError:
+    av = None
 
 # Initialize logger for this module
 logger = logging.getLogger("convert_to_mp3")
 
+# Resolved once; PATH doesn't change while the process runs. shutil.which
+# already tries the PATHEXT extensions (ffmpeg.exe) on Windows.
+_FFMPEG_PATH = shutil.which('ffmpeg')
+
+# FFmpeg stderr lines kept for the error message of a failed conversion
+_STDERR_TAIL_LINES = 200
+
+
+def get_ffmpeg_path() -> Optional[str]:
+    """
+    The FFmpeg executable found on PATH, shared by every module that needs FFmpeg.
+    
+    Returns:
+        str or None: The FFmpeg executable path, or None if it isn't found
+    """
+    return _FFMPEG_PATH
+
+
+def refresh_ffmpeg_path() -> Optional[str]:
+    """
+    Look FFmpeg up on PATH again (e.g. after installing it, or in tests).
+    
+    Returns:
+        str or None: The FFmpeg executable path, or None if it isn't found
+    """
+    global _FFMPEG_PATH
+    _FFMPEG_PATH = shutil.which('ffmpeg')
+    return _FFMPEG_PATH
+
+
+def _encode_mp3_with_pyav(input_path: Path, output_path: Path) -> None:
+    """Encode the first audio stream of input_path to a 192k MP3 with libmp3lame, in-process."""
+    # The format is explicit because output_path may be a ".part" temporary name
+    with av.open(str(input_path)) as source, av.open(str(output_path), mode='w', format='mp3') as target:
+        source_stream = source.streams.audio[0]
+        mp3_stream = target.add_stream('libmp3lame', rate=source_stream.codec_context.sample_rate or 44100)
+        mp3_stream.bit_rate = 192000
+        for frame in source.decode(source_stream):
+            # Let the encoder assign timestamps for the resampled frames
+            frame.pts = None
+            target.mux(mp3_stream.encode(frame))
+        # Flush buffered frames
+        target.mux(mp3_stream.encode(None))
+
+
+def _run_ffmpeg(cmd: List[str], timeout: float) -> Optional[str]:
+    """
+    Run an FFmpeg command, keeping only the tail of its stderr.
+    
+    stderr is drained line by line on a helper thread into a bounded deque,
+    so a chatty FFmpeg can neither fill the pipe nor grow memory.
+    
+    Args:
+        cmd: FFmpeg command line
+        timeout: Seconds to wait before killing FFmpeg
+        
+    Returns:
+        str or None: The last stderr lines if FFmpeg failed, None on success
+        
+    Raises:
+        subprocess.TimeoutExpired: If FFmpeg ran longer than timeout
+    """
+    stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1,
+        text=True,
+        errors='replace'
+    ) as process:
+        reader = threading.Thread(target=lambda: stderr_tail.extend(line.rstrip('\n') for line in process.stderr), daemon=True)
+        reader.start()
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+        finally:
+            reader.join()
+    
+    return '\n'.join(stderr_tail) if returncode != 0 else None
+
 
-def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] = None) -> Dict[str, Any]:
+def _mp3_path(input_file: Union[str, Path], output_dir: str) -> str:
+    """Build output_dir/<input stem>.mp3 with string operations (no PurePath objects)."""
+    filename = os.path.basename(input_file)
+    dot = filename.rfind('.')
+    # Same rule as Path.stem: a leading dot (".hidden") isn't a suffix
+    stem = filename[:dot] if dot > 0 else filename
+    return f"{output_dir}{os.sep}{stem}.mp3"
+
+
+def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] = None, threads: int = None, force: bool = False,
+                   output_file: Union[str, Path] = None) -> Dict[str, Any]:
     """
     Convert an audio file to MP3 format using FFmpeg.
     Hardcoded settings: 192k quality, saves to specified output directory.
@@ -28,13 +130,17 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
     Args:
         input_file: Path to input audio file
         output_dir: Directory to save MP3 file (defaults to same directory as input)
+        threads: FFmpeg executable thread cap (defaults to FFmpeg's own choice; unused with PyAV)
+        force: Re-encode even if an up-to-date MP3 already exists
+        output_file: Exact MP3 path to write (overrides output_dir)
         
     Returns:
         dict: {
             'success': bool,
             'input_file': str,
             'output_file': str or None,
-            'error': str or None
+            'error': str or None,
+            'cached': bool (only on success; True if the existing MP3 was reused)
         }
     """
     logger.info(f"Starting MP3 conversion for: {input_file}")
@@ -42,7 +148,9 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
     # Resolve input file path
     input_path = resolve_path(input_file)
     
-    if not input_path.exists():
+    try:
+        input_stat = input_path.stat()
+    except FileNotFoundError:
         error_msg = f"Input file does not exist: {input_path}"
         logger.error(error_msg)
         return {
@@ -53,8 +161,7 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
         }
     
     # Check if conversion is enabled in config
-    save_to_mp3 = APP_CONFIG.get("audio", {}).get("save_to_mp3", "False")
-    if save_to_mp3.lower() != "true":
+    if not AUDIO_CFG.save_to_mp3:
         logger.info("MP3 conversion disabled in configuration")
         return {
             'success': False,
@@ -63,13 +170,39 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
             'error': "MP3 conversion disabled in configuration"
         }
     
-    # Get remove_original setting from config
-    remove_original = APP_CONFIG.get("audio", {}).get("remove_original", "True")
-    should_remove_original = remove_original.lower() == "true"
+    # Create output filename in specified directory (or same directory as input)
+    if output_file:
+        output_path = Path(output_file)
+    else:
+        output_dir_path = resolve_path(output_dir) if output_dir else input_path.parent
+        output_filename = input_path.stem + ".mp3"
+        output_path = output_dir_path / output_filename
+    
+    logger.debug("Output path: %s", output_path)
+    # Encode next to the final file and move it into place only on success, so
+    # a failed or killed encode never leaves a partial MP3 under the final name
+    # (the up-to-date check below would take it for a finished conversion)
+    partial_path = output_path.with_name(output_path.name + ".part")
+    
+    # A retry of the same file: reuse the MP3 if it is newer than its input
+    if not force:
+        try:
+            output_stat = output_path.stat()
+        except FileNotFoundError:
+            output_stat = None
+        if output_stat and output_stat.st_size > 0 and output_stat.st_mtime >= input_stat.st_mtime:
+            logger.info(f"MP3 already up to date, skipping conversion: {output_path}")
+            return {
+                'success': True,
+                'input_file': str(input_path),
+                'output_file': str(output_path),
+                'error': None,
+                'cached': True
+            }
     
-    # Find FFmpeg
-    ffmpeg_path = shutil.which('ffmpeg') or shutil.which('ffmpeg.exe')
-    if not ffmpeg_path:
+    # Find FFmpeg (not needed when PyAV encodes in-process)
+    ffmpeg_path = _FFMPEG_PATH
+    if av is None and not ffmpeg_path:
         error_msg = "FFmpeg not found in system PATH"
         logger.error(error_msg)
         return {
@@ -79,39 +212,39 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
             'error': error_msg
         }
     
-    # Create output filename in specified directory (or same directory as input)
-    output_dir_path = resolve_path(output_dir) if output_dir else input_path.parent
-    output_filename = input_path.stem + ".mp3"
-    output_path = output_dir_path / output_filename
-    
-    logger.debug(f"Output path: {output_path}")
-    
     try:
-        # Build FFmpeg command with hardcoded settings
-        cmd = [
-            ffmpeg_path,
-            '-i', str(input_path),
-            '-codec:a', 'libmp3lame',
-            '-b:a', '192k',  # Hardcoded quality
-            '-y',  # Overwrite output file if it exists
-            str(output_path)
-        ]
+        if av is not None:
+            # Same codec and bitrate without starting an FFmpeg process per file
+            logger.debug("Encoding with PyAV: %s", output_path)
+            _encode_mp3_with_pyav(input_path, partial_path)
+            ffmpeg_error = None
+        else:
+            # Build FFmpeg command with hardcoded settings
+            cmd = [
+                ffmpeg_path,
+                '-loglevel', 'error',  # Only errors on stderr, no progress lines
+                '-i', str(input_path),
+                '-codec:a', 'libmp3lame',
+                '-b:a', '192k',  # Hardcoded quality
+                '-f', 'mp3',  # The ".part" name has no extension to infer it from
+                '-y',  # Overwrite output file if it exists
+            ]
+            if threads:
+                cmd += ['-threads', str(threads)]
+            cmd.append(str(partial_path))
         
-        logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running FFmpeg command: %s", ' '.join(cmd))
         
-        # Run FFmpeg conversion
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+            # Run FFmpeg conversion; only stderr is read (for error messages)
+            ffmpeg_error = _run_ffmpeg(cmd, timeout=300)  # 5 minute timeout
         
-        if result.returncode == 0:
+        if ffmpeg_error is None:
+            os.replace(partial_path, output_path)
             logger.info(f"Successfully converted to MP3: {output_path}")
             
             # Remove original file if configured to do so
-            if should_remove_original:
+            if AUDIO_CFG.remove_original:
                 try:
                     input_path.unlink()
                     logger.info(f"Removed original file: {input_path}")
@@ -124,10 +257,11 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
                 'success': True,
                 'input_file': str(input_path),
                 'output_file': str(output_path),
-                'error': None
+                'error': None,
+                'cached': False
             }
         else:
-            error_msg = f"FFmpeg conversion failed: {result.stderr}"
+            error_msg = f"FFmpeg conversion failed: {ffmpeg_error}"
             logger.error(error_msg)
             return {
                 'success': False,
@@ -154,6 +288,50 @@ def convert_to_mp3(input_file: Union[str, Path], output_dir: Union[str, Path] =
             'output_file': None,
             'error': error_msg
         }
+    finally:
+        # Already moved into place on success; otherwise drop the partial output
+        try:
+            partial_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove partial MP3 {partial_path}: {e}")
+
+
+def convert_to_mp3_batch(input_files: List[Union[str, Path]], output_dir: Union[str, Path] = None) -> List[Dict[str, Any]]:
+    """
+    Convert several audio files to MP3 concurrently.
+    
+    Runs one conversion per file on a pool of half the CPUs, and caps each
+    FFmpeg process's threads so the pool as a whole doesn't oversubscribe the
+    CPUs. The pool uses threads because each one either waits on its FFmpeg
+    process or encodes through PyAV, which releases the GIL in codec calls.
+    
+    Args:
+        input_files: Paths to input audio files
+        output_dir: Directory to save MP3 files (defaults to each input's directory)
+        
+    Returns:
+        list: One convert_to_mp3 result dict per input file, in input order
+    """
+    if not input_files:
+        return []
+    
+    cpu_count = os.cpu_count() or 1
+    workers = min(len(input_files), max(1, cpu_count // 2))
+    threads = max(1, cpu_count // workers)
+    logger.info(f"Converting {len(input_files)} files to MP3 with {workers} workers x {threads} threads")
+    
+    # Resolve the shared output directory once and build each MP3 path from strings
+    output_files = [None] * len(input_files)
+    if output_dir:
+        output_dir_str = str(resolve_path(output_dir))
+        output_files = [_mp3_path(input_file, output_dir_str) for input_file in input_files]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda input_file, output_file: convert_to_mp3(input_file, threads=threads, output_file=output_file),
+            input_files,
+            output_files
+        ))
 
 
 if __name__ == "__main__":
@@ -2,19 +2,23 @@
 import sys
 import os
 import django
+from django.apps import apps
 from pathlib import Path
 
+# Project root (the directory holding manage.py), resolved once
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 # Initialize Django settings for standalone execution
 def setup_django():
     """Initialize Django settings for standalone module execution."""
+    # Already booted (imported from the web app or a worker); setup is costly
+    if apps.ready:
+        return True
+    
     try:
-        # Get the project root directory
-        current_dir = Path(__file__).resolve()
-        project_root = current_dir.parent.parent.parent.parent
-        
         # Add project root to Python path
-        if str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
+        if str(_PROJECT_ROOT) not in sys.path:
+            sys.path.insert(0, str(_PROJECT_ROOT))
         
         # Set Django settings module
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'youtube_downloader.settings')
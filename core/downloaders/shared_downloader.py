@@ -7,18 +7,25 @@ content from YouTube, with database logging and JSON artifact saving.
 
 import sys
 import os
-import json
+import io
+import re
+import asyncio
 import uuid
 import random
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from django.utils import timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, Optional, Literal, List, Tuple
+from django.db import connection
 from yt_dlp import YoutubeDL
 
 from ..shared_utils.path_utils import resolve_path
-from ..shared_utils.app_config import APP_CONFIG
+from ..shared_utils.app_config_snapshot import AUDIO_CFG, PUBLIC_ACCESS_CFG
+from ..shared_utils.id_utils import uuid7
 from ..shared_utils.url_utils import YouTubeURLSanitizer, YouTubeURLError
+from .audio.audio_helpers.convert_to_mp3 import get_ffmpeg_path
 
 # Initialize logger for this module
 import logging
@@ -27,11 +34,27 @@ logger = logging.getLogger("shared_downloader")
 # Download types
 DownloadType = Literal["audio", "video"]
 
+# First line of a Netscape cookies file, as required by http.cookiejar
+_COOKIE_FILE_HEADER_RE = re.compile(r'#( Netscape)? HTTP Cookie File')
+
+# yt-dlp info keys that are large and not used by the database or API
+_DROP_METADATA_KEYS = frozenset({
+    'formats', 'requested_formats', 'thumbnails', 'automatic_captions',
+    'subtitles', 'heatmap', 'requested_downloads',
+})
+
+# Fragments of a DASH/HLS stream fetched in parallel. Fragment downloads are
+# network-bound; the cap keeps the request burst modest for bot detection.
+_CONCURRENT_FRAGMENTS = min(os.cpu_count() or 1, 8)
+
+# Bytes per megabyte, for size_mb
+_MB = 1024 * 1024
+
 class DownloadJob:
     """Represents a download job with tracking and metadata."""
     
-    def __init__(self, url: str, download_type: DownloadType, output_dir: Optional[str] = None):
-        self.job_id = str(uuid.uuid4())
+    def __init__(self, url: str, download_type: DownloadType, output_dir: Optional[str] = None, job_id: Optional[str] = None):
+        self.job_id = job_id or str(uuid7())
         self.url = url
         self.download_type = download_type
         self.output_dir = output_dir or os.getcwd()
@@ -44,6 +67,8 @@ class DownloadJob:
         self.file_size = None
         self.error = None
         self.metadata = {}
+        # Primary key of the database row once log_to_database has found or created it
+        self.db_id = None
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for JSON serialization."""
@@ -63,6 +88,14 @@ class DownloadJob:
             "metadata": self.metadata
         }
 
+@lru_cache(maxsize=4096)
+def _sanitize_url_cached(url: str) -> Tuple[bool, str]:
+    """Memoized sanitize returning (True, clean_url) or (False, error); invalid URLs are cached too."""
+    try:
+        return True, YouTubeURLSanitizer.sanitize_url(url, preserve_metadata=True).clean_url
+    except YouTubeURLError as e:
+        return False, str(e)
+
 def sanitize_download_url(url: str) -> str:
     """
     Sanitize and validate YouTube URL before download.
@@ -76,15 +109,14 @@ def sanitize_download_url(url: str) -> str:
     Raises:
         ValueError: If URL is invalid or not a YouTube URL
     """
-    try:
-        logger.debug(f"Sanitizing URL: {url}")
-        url_info = YouTubeURLSanitizer.sanitize_url(url, preserve_metadata=True)
-        logger.debug(f"URL sanitized successfully: {url_info.clean_url}")
-        return url_info.clean_url
-    except YouTubeURLError as e:
-        error_msg = f"Invalid YouTube URL: {e}"
+    logger.debug("Sanitizing URL: %s", url)
+    ok, value = _sanitize_url_cached(url)
+    if not ok:
+        error_msg = f"Invalid YouTube URL: {value}"
         logger.error(error_msg)
         raise ValueError(error_msg)
+    logger.debug("URL sanitized successfully: %s", value)
+    return value
 
 def get_file_info(filepath: str) -> Dict[str, Any]:
     """
@@ -96,7 +128,10 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
     Returns:
         Dictionary with file information
     """
-    if not filepath or not os.path.exists(filepath):
+    # One stat both checks existence and gives the size
+    try:
+        size_bytes = os.stat(filepath).st_size
+    except (OSError, TypeError, ValueError):
         return {
             'filename': None,
             'filepath': None,
@@ -105,27 +140,13 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
             'exists': False
         }
     
-    try:
-        stat = os.stat(filepath)
-        size_bytes = stat.st_size
-        size_mb = round(size_bytes / (1024 * 1024), 2)
-        
-        return {
-            'filename': os.path.basename(filepath),
-            'filepath': filepath,
-            'size_bytes': size_bytes,
-            'size_mb': size_mb,
-            'exists': True
-        }
-    except Exception as e:
-        logger.error(f"Error getting file info for {filepath}: {e}")
-        return {
-            'filename': os.path.basename(filepath) if filepath else None,
-            'filepath': filepath,
-            'size_bytes': 0,
-            'size_mb': 0.0,
-            'exists': False
-        }
+    return {
+        'filename': os.path.basename(filepath),
+        'filepath': filepath,
+        'size_bytes': size_bytes,
+        'size_mb': round(size_bytes / _MB, 2),
+        'exists': True
+    }
 
 def get_format_selector(download_type: DownloadType) -> str:
     """Get the appropriate format selector for the download type."""
@@ -138,44 +159,52 @@ def get_format_selector(download_type: DownloadType) -> str:
     else:
         raise ValueError(f"Invalid download type: {download_type}")
 
+# User agent pools and fixed request headers, built once instead of per download
+_USER_AGENTS = PUBLIC_ACCESS_CFG.user_agents
+_MOBILE_USER_AGENTS = tuple(
+    ua for ua in _USER_AGENTS
+    if "Mobile" in ua or "Android" in ua or "iPhone" in ua or "iPad" in ua
+)
+_BASE_HEADERS = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+})
+
 def get_random_user_agent() -> str:
     """Get a random user agent for bot detection avoidance."""
-    return random.choice(APP_CONFIG["user_agents"])
+    return random.choice(_USER_AGENTS)
 
 
-def get_ydl_options(download_type: DownloadType, output_template: str, user_cookies: str = None) -> Dict[str, Any]:
-    """Get yt-dlp options for the specified download type with enhanced anti-detection measures."""
-    # Get configuration
-    config = APP_CONFIG.get("public_access", {})
-    
+def _select_user_agent() -> str:
+    """Pick the user agent for one download according to the public_access settings."""
     # Enhanced user agent selection with mobile preference
-    if config.get("use_mobile_fallback", True):
+    if PUBLIC_ACCESS_CFG.use_mobile_fallback:
         # Prefer mobile user agents for better anti-detection
-        mobile_agents = [ua for ua in APP_CONFIG["user_agents"] if "Mobile" in ua or "Android" in ua or "iPhone" in ua or "iPad" in ua]
-        selected_ua = random.choice(mobile_agents) if mobile_agents else get_random_user_agent()
-    else:
-        selected_ua = get_random_user_agent() if config.get("rotate_user_agents", True) else APP_CONFIG["user_agents"][0]
+        return random.choice(_MOBILE_USER_AGENTS) if _MOBILE_USER_AGENTS else get_random_user_agent()
+    return get_random_user_agent() if PUBLIC_ACCESS_CFG.rotate_user_agents else _USER_AGENTS[0]
+
+@lru_cache(maxsize=4)
+def _static_ydl_options(download_type: DownloadType) -> MappingProxyType:
+    """
+    yt-dlp options that are the same for every download of a type.
     
+    Built once per download type; get_ydl_options adds the per-download
+    output template and user agent on top.
+    """
     base_options = {
         "format": get_format_selector(download_type),
-        "outtmpl": output_template,
         "noplaylist": True,
         "quiet": False,  # Enable logging to see what's happening
         "nocheckcertificate": True,
         "restrictfilenames": True,
-        # Simplified but effective anti-detection measures
-        "http_headers": {
-            "User-Agent": selected_ua,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        },
         # Conservative anti-detection options
         "sleep_interval": 1,  # Sleep between downloads
         "max_sleep_interval": 3,  # Maximum sleep time
         "retries": 3,  # Retry failed downloads
         "fragment_retries": 3,  # Retry failed fragments
+        "concurrent_fragment_downloads": _CONCURRENT_FRAGMENTS,  # Overlap fragment round trips
         "socket_timeout": 30,  # Socket timeout
         "extractor_retries": 2,  # Retry extractor failures
         "no_check_certificate": True,  # Disable SSL certificate checking
@@ -183,34 +212,72 @@ def get_ydl_options(download_type: DownloadType, output_template: str, user_cook
         "force_ipv4": True,  # Force IPv4 to avoid some blocking
         "geo_bypass": True,  # Bypass geo-restrictions
         "geo_bypass_country": "US",  # Use US as bypass country
-    }
-    
-    # Enhanced anti-bot detection methods (no browser cookies needed)
-    base_options.update({
-        # Additional anti-detection measures
-        "user_agent": base_options["http_headers"]["User-Agent"],
+        # Additional anti-detection measures (no browser cookies needed)
         "referer": "https://www.youtube.com/",
-        # Try browser cookies only if specifically enabled and available
-    })
-    
-    # Use user-provided cookies if available
-    if user_cookies and user_cookies.strip():
-        # Create temporary cookie file for yt-dlp
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_cookie:
-            temp_cookie.write(user_cookies)
-            temp_cookie_path = temp_cookie.name
-        
-        base_options["cookiefile"] = temp_cookie_path
-        logger.info(f"Using user-provided cookies from secure storage")
-        
-        # Store temp path for cleanup
-        base_options["_temp_cookie_path"] = temp_cookie_path
+    }
     
     if download_type == "video":
         base_options["merge_output_format"] = "mp4"
     
-    return base_options
+    if download_type == "audio":
+        # bestaudio is picked from the player response's adaptive formats; the
+        # DASH manifest is an extra request that only adds formats we ignore
+        base_options["extractor_args"] = {"youtube": {"skip": ["dash"]}}
+        base_options["format_sort"] = ["abr"]  # Highest audio bitrate first
+        # Encode MP3 in the same yt-dlp run instead of reading the download
+        # back for a separate conversion pass; the postprocessor runs the
+        # FFmpeg executable, looked up once by convert_to_mp3
+        if AUDIO_CFG.save_to_mp3 and get_ffmpeg_path():
+            base_options["postprocessors"] = ({
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": "mp3",
+                "preferredquality": "192",
+            },)
+            base_options["keepvideo"] = not AUDIO_CFG.remove_original
+    
+    return MappingProxyType(base_options)
+
+def get_ydl_options(download_type: DownloadType, output_template: str) -> Dict[str, Any]:
+    """Get yt-dlp options for the specified download type with enhanced anti-detection measures."""
+    selected_ua = _select_user_agent()
+    return {
+        **_static_ydl_options(download_type),
+        "outtmpl": output_template,
+        # Simplified but effective anti-detection measures
+        "http_headers": {"User-Agent": selected_ua, **_BASE_HEADERS},
+        "user_agent": selected_ua,
+    }
+
+def _load_user_cookies(ydl: YoutubeDL, user_cookies: str) -> None:
+    """
+    Load the user's Netscape-format cookies straight into yt-dlp's cookie jar.
+    
+    The cookies stay in memory; nothing is written to a temporary file that
+    would need cleaning up (or leak if the worker died mid-download).
+    """
+    # The jar's loader insists on the Netscape header line, which pasted cookies may lack
+    if not _COOKIE_FILE_HEADER_RE.match(user_cookies):
+        user_cookies = "# Netscape HTTP Cookie File\n" + user_cookies
+    ydl.cookiejar.load(io.StringIO(user_cookies))
+    logger.info(f"Using user-provided cookies from secure storage")
+
+def _metadata_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Map yt-dlp info to JobMetadata column values."""
+    return {
+        'title': metadata.get('title'),
+        'duration': metadata.get('duration'),
+        'uploader': metadata.get('uploader'),
+        'upload_date': metadata.get('upload_date'),
+        'view_count': metadata.get('view_count'),
+        'like_count': metadata.get('like_count'),
+        'format_id': metadata.get('format_id'),
+        'ext': metadata.get('ext'),
+        'vcodec': metadata.get('vcodec'),
+        'acodec': metadata.get('acodec'),
+        'filesize': metadata.get('filesize'),
+        'fps': metadata.get('fps'),
+        'raw_metadata': metadata,
+    }
 
 def log_to_database(job: DownloadJob, user=None, user_ip=None, user_agent=None, download_source='api', task_id=None) -> bool:
     """
@@ -230,70 +297,53 @@ def log_to_database(job: DownloadJob, user=None, user_ip=None, user_agent=None,
     try:
         # Only proceed if we have Django context (user available)
         if not user:
-            logger.debug(f"Database log skipped - no user context: {job.to_dict()}")
+            # to_dict() formats every field; only build it when it will be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Database log skipped - no user context: %s", job.to_dict())
             return True
         
         # Import Django models here to avoid circular imports
         from audio_dl.models import DownloadJob as DBJob, JobMetadata
         
-        # Create or update database job record
-        db_job, created = DBJob.objects.update_or_create(
-            job_id=job.job_id,
-            defaults={
-                'task_id': task_id,
-                'user': user,
-                'url': job.url,
-                'download_type': job.download_type,
-                'status': job.status,
-                'filename': job.filename,
-                'filepath': job.filepath,
-                'file_size': job.file_size,
-                'error_message': job.error,
-                'user_ip': user_ip,
-                'user_agent': user_agent,
-                'download_source': download_source,
-                'started_at': job.started_at,
-                'completed_at': job.completed_at,
-            }
-        )
+        progress_fields = {
+            'status': job.status,
+            'filename': job.filename,
+            'filepath': job.filepath,
+            'file_size': job.file_size,
+            'error_message': job.error,
+            'started_at': job.started_at,
+            'completed_at': job.completed_at,
+        }
+        
+        # Look the row up once per job (it exists already for queued jobs) and
+        # remember its key; later transitions are a single UPDATE by primary key
+        if job.db_id is None:
+            job.db_id = DBJob.objects.filter(job_id=job.job_id).values_list('pk', flat=True).first()
+        created = job.db_id is None
+        if created:
+            job.db_id = DBJob.objects.create(
+                job_id=job.job_id,
+                task_id=task_id,
+                user=user,
+                url=job.url,
+                download_type=job.download_type,
+                user_ip=user_ip,
+                user_agent=user_agent,
+                download_source=DBJob.DOWNLOAD_SOURCE_IDS[download_source],
+                **progress_fields,
+            ).pk
+        else:
+            DBJob.objects.filter(pk=job.db_id).update(**progress_fields)
         
-        # Create metadata record if we have metadata
-        if job.metadata and created:
-            JobMetadata.objects.create(
-                job=db_job,
-                title=job.metadata.get('title'),
-                duration=job.metadata.get('duration'),
-                uploader=job.metadata.get('uploader'),
-                upload_date=job.metadata.get('upload_date'),
-                view_count=job.metadata.get('view_count'),
-                like_count=job.metadata.get('like_count'),
-                format_id=job.metadata.get('format_id'),
-                ext=job.metadata.get('ext'),
-                vcodec=job.metadata.get('vcodec'),
-                acodec=job.metadata.get('acodec'),
-                filesize=job.metadata.get('filesize'),
-                fps=job.metadata.get('fps'),
-                raw_metadata=job.metadata,
-            )
-        elif job.metadata and not created:
-            # Update existing metadata
-            metadata, _ = JobMetadata.objects.get_or_create(job=db_job)
-            metadata.title = job.metadata.get('title')
-            metadata.duration = job.metadata.get('duration')
-            metadata.uploader = job.metadata.get('uploader')
-            metadata.upload_date = job.metadata.get('upload_date')
-            metadata.view_count = job.metadata.get('view_count')
-            metadata.like_count = job.metadata.get('like_count')
-            metadata.format_id = job.metadata.get('format_id')
-            metadata.ext = job.metadata.get('ext')
-            metadata.vcodec = job.metadata.get('vcodec')
-            metadata.acodec = job.metadata.get('acodec')
-            metadata.filesize = job.metadata.get('filesize')
-            metadata.fps = job.metadata.get('fps')
-            metadata.raw_metadata = job.metadata
-            metadata.save()
+        # Create or update the metadata record: one UPDATE when it already
+        # exists, one INSERT when it doesn't
+        if job.metadata:
+            metadata_fields = _metadata_fields(job.metadata)
+            updated = 0 if created else JobMetadata.objects.filter(job_id=job.db_id).update(**metadata_fields)
+            if not updated:
+                JobMetadata.objects.create(job_id=job.db_id, **metadata_fields)
         
-        logger.debug(f"Database job {'created' if created else 'updated'}: {db_job.job_id} - {job.status}")
+        logger.debug("Database job %s: %s - %s", 'created' if created else 'updated', job.job_id, job.status)
         return True
         
     except Exception as e:
@@ -329,7 +379,7 @@ def download_media(url: str, download_type: DownloadType, output_dir: Optional[s
     # Sanitize and validate URL
     try:
         sanitized_url = sanitize_download_url(url)
-        logger.debug(f"Using sanitized URL: {sanitized_url}")
+        logger.debug("Using sanitized URL: %s", sanitized_url)
     except ValueError as e:
         logger.error(f"URL validation failed: {e}")
         return {
@@ -341,8 +391,9 @@ def download_media(url: str, download_type: DownloadType, output_dir: Optional[s
             'metadata': {}
         }
     
-    # Create download job with sanitized URL
-    job = DownloadJob(sanitized_url, download_type, output_dir)
+    # Create download job with sanitized URL. Queued jobs reuse the task id as
+    # their job id so the row created at enqueue time is the one updated here.
+    job = DownloadJob(sanitized_url, download_type, output_dir, job_id=task_id)
     job.status = "downloading"
     job.started_at = timezone.now()
     
@@ -356,23 +407,36 @@ def download_media(url: str, download_type: DownloadType, output_dir: Optional[s
     # Create output template
     outtmpl = str(output_path / f"%(title)s.%(ext)s")
     
-    # Get yt-dlp options with user cookies
-    ydl_opts = get_ydl_options(download_type, outtmpl, user_cookies)
+    # Get yt-dlp options
+    ydl_opts = get_ydl_options(download_type, outtmpl)
     
     try:
         with YoutubeDL(ydl_opts) as ydl:
-            # Extract info first to get metadata
-            info = ydl.extract_info(url, download=False)
-            job.metadata = info
+            # Use user-provided cookies if available
+            if user_cookies and user_cookies.strip():
+                _load_user_cookies(ydl, user_cookies)
+            
+            # Fetch metadata and download in one pass (one page/API round trip)
+            info = ydl.extract_info(url, download=True)
             
-            # Now download
-            ydl.download([url])
+            # Where the file ended up after postprocessing (e.g. the MP3
+            # written by the extract-audio postprocessor)
+            requested_downloads = info.get('requested_downloads')
+            if requested_downloads and requested_downloads[0].get('filepath'):
+                filepath = requested_downloads[0]['filepath']
+            else:
+                filepath = ydl.prepare_filename(info)
             
-            # Get the actual filepath
-            filepath = ydl.prepare_filename(info)
+            # Keep a JSON-safe copy without the bulky per-format/thumbnail lists
+            info = ydl.sanitize_info(info)
+            job.metadata = {key: value for key, value in info.items() if key not in _DROP_METADATA_KEYS}
             
-        # Check if file was actually created
-        if not filepath or not os.path.exists(filepath):
+        # Check if file was actually created; the same stat gives its size
+        try:
+            file_size = os.stat(filepath).st_size if filepath else None
+        except OSError:
+            file_size = None
+        if file_size is None:
             job.status = "failed"
             job.error = "Download failed - file not created"
             job.completed_at = timezone.now()
@@ -392,26 +456,13 @@ def download_media(url: str, download_type: DownloadType, output_dir: Optional[s
         job.filepath = filepath
         job.filename = os.path.basename(filepath)
         job.completed_at = timezone.now()
-        
-        # Calculate file size
-        try:
-            job.file_size = os.path.getsize(filepath)
-        except OSError:
-            job.file_size = 0
+        job.file_size = file_size
         
         # Final database log
         log_to_database(job, user=user, user_ip=user_ip, user_agent=user_agent, download_source=download_source, task_id=task_id)
         
         logger.info(f"Successfully downloaded {download_type}: {job.filename}")
         
-        # Cleanup temporary cookie file if created
-        if "_temp_cookie_path" in ydl_opts:
-            try:
-                os.unlink(ydl_opts["_temp_cookie_path"])
-                logger.debug("Cleaned up temporary cookie file")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp cookie file: {e}")
-        
         return {
             'success': True,
             'job_id': job.job_id,
@@ -429,14 +480,6 @@ def download_media(url: str, download_type: DownloadType, output_dir: Optional[s
         
         logger.error(f"Download failed: {e}")
         
-        # Cleanup temporary cookie file if created
-        if "_temp_cookie_path" in ydl_opts:
-            try:
-                os.unlink(ydl_opts["_temp_cookie_path"])
-                logger.debug("Cleaned up temporary cookie file")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp cookie file: {e}")
-        
         return {
             'success': False,
             'job_id': job.job_id,
@@ -454,6 +497,54 @@ def download_video(url: str, output_dir: Optional[str] = None, user=None, user_i
     """Download video from YouTube URL."""
     return download_media(url, "video", output_dir, user=user, user_ip=user_ip, user_agent=user_agent, download_source=download_source, task_id=task_id, user_cookies=user_cookies)
 
+def _download_media_in_thread(*args, **kwargs) -> Dict[str, Any]:
+    """Run download_media on a worker thread and close that thread's DB connection after."""
+    try:
+        return download_media(*args, **kwargs)
+    finally:
+        connection.close()
+
+async def download_media_async(url: str, download_type: DownloadType, output_dir: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """
+    Download media without blocking the event loop.
+    
+    yt-dlp is synchronous, so the download runs on a worker thread; the caller's
+    loop stays free while the network transfer is in progress.
+    
+    Args:
+        url: YouTube URL to download
+        download_type: 'audio' or 'video'
+        output_dir: Directory to save file
+        **kwargs: Remaining download_media arguments (user, user_ip, task_id, ...)
+    
+    Returns:
+        The download_media result dict
+    """
+    return await asyncio.to_thread(_download_media_in_thread, url, download_type, output_dir, **kwargs)
+
+async def download_audio_async(url: str, output_dir: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """Download audio from YouTube URL without blocking the event loop."""
+    return await download_media_async(url, "audio", output_dir, **kwargs)
+
+async def download_video_async(url: str, output_dir: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """Download video from YouTube URL without blocking the event loop."""
+    return await download_media_async(url, "video", output_dir, **kwargs)
+
+async def download_media_batch_async(urls: List[str], download_type: DownloadType, output_dir: Optional[str] = None, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Download several URLs concurrently.
+    
+    Args:
+        urls: YouTube URLs to download
+        download_type: 'audio' or 'video'
+        output_dir: Directory to save files
+        **kwargs: Remaining download_media arguments, shared by every URL
+    
+    Returns:
+        One download_media result dict per URL, in input order
+    """
+    return await asyncio.gather(*(download_media_async(url, download_type, output_dir, **kwargs) for url in urls))
+
 if __name__ == "__main__":
     # Test the downloader
     import sys
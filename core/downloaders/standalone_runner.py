@@ -17,12 +17,20 @@ project_root = current_dir.parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+# Stdlib-only, so it can validate the URL before Django is set up
+from core.shared_utils.url_utils import YouTubeURLSanitizer
+
 def setup_django():
     """Initialize Django settings for standalone execution."""
     try:
         import django
+        from django.apps import apps
         from django.conf import settings
         
+        # Nothing to do if Django is already set up
+        if apps.ready:
+            return True
+        
         # Set Django settings module
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'youtube_downloader.settings')
         
@@ -119,6 +127,11 @@ Examples:
     
     args = parser.parse_args()
     
+    # Validate URL before paying for Django's app loading
+    if not YouTubeURLSanitizer.is_youtube_url(args.url):
+        print("✗ Error: Please provide a valid YouTube URL")
+        sys.exit(1)
+    
     print("=" * 60)
     print("YouTube Downloader - Standalone Runner")
     print("=" * 60)
@@ -130,11 +143,6 @@ Examples:
         print("⚠ Django initialization skipped")
         django_initialized = False
     
-    # Validate URL
-    if not args.url or not ('youtube.com' in args.url or 'youtu.be' in args.url):
-        print("✗ Error: Please provide a valid YouTube URL")
-        sys.exit(1)
-    
     # Run the appropriate download
     success = False
     if args.type == 'audio':
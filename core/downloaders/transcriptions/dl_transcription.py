@@ -15,12 +15,14 @@ Dependencies:
 import sys
 import argparse
 import os
-import json
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from yt_dlp import YoutubeDL
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+# yt_dlp and youtube_transcript_api are imported where they're used: they are
+# slow to import, and --help or a bad argument shouldn't have to wait for them
 
 # Import logging
 try:
@@ -32,21 +34,76 @@ except ImportError:
 # Setup logger for this module
 logger = setup_logger("core")
 
+# (TranscriptsDisabled, NoTranscriptFound), filled in on first use
+_TRANSCRIPT_ERRORS = None
+
+
+def _transcript_errors() -> tuple:
+    """Return youtube_transcript_api's "no transcript" exceptions, importing them once."""
+    global _TRANSCRIPT_ERRORS
+    if _TRANSCRIPT_ERRORS is None:
+        from youtube_transcript_api import TranscriptsDisabled, NoTranscriptFound
+        _TRANSCRIPT_ERRORS = (TranscriptsDisabled, NoTranscriptFound)
+    return _TRANSCRIPT_ERRORS
+
+
+# Sibling-module objects, resolved on first use (package-relative import, or
+# top-level when this file runs as a script)
+_TRANSCRIPT_PROCESSOR_CLS = None
+_DOWNLOAD_TRANSCRIPT = None
+
+
+def _transcript_processor_class():
+    """Return transcript_processor.TranscriptProcessor, importing it once."""
+    global _TRANSCRIPT_PROCESSOR_CLS
+    if _TRANSCRIPT_PROCESSOR_CLS is None:
+        try:
+            from .transcript_processor import TranscriptProcessor
+        except ImportError:
+            from transcript_processor import TranscriptProcessor
+        _TRANSCRIPT_PROCESSOR_CLS = TranscriptProcessor
+    return _TRANSCRIPT_PROCESSOR_CLS
+
+
+def _download_transcript_func():
+    """Return yt_downloads_utils.download_transcript, importing it once."""
+    global _DOWNLOAD_TRANSCRIPT
+    if _DOWNLOAD_TRANSCRIPT is None:
+        try:
+            from .yt_downloads_utils import download_transcript
+        except ImportError:
+            from yt_downloads_utils import download_transcript
+        _DOWNLOAD_TRANSCRIPT = download_transcript
+    return _DOWNLOAD_TRANSCRIPT
+
 # -------------------- Core Functions --------------------
 
+# One YoutubeDL per thread, reused across get_video_info calls so batch runs
+# don't set up the extractors again for every URL
+_ydl_local = threading.local()
+
+
+def _info_ydl():
+    """Return this thread's YoutubeDL for metadata extraction, creating it on first use."""
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None:
+        from yt_dlp import YoutubeDL
+        ydl_opts = {
+            'quiet': True,
+            'skip_download': True,
+            'forcejson': True,
+        }
+        ydl = _ydl_local.ydl = YoutubeDL(ydl_opts)
+    return ydl
+
+
 def get_video_info(url: str) -> Optional[Dict]:
-    logger.debug(f"Extracting video info for URL: {url}")
-    ydl_opts = {
-        'quiet': True,
-        'skip_download': True,
-        'forcejson': True,
-    }
+    logger.debug("Extracting video info for URL: %s", url)
     try:
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            logger.debug(f"Extracted info for video: {info.get('title', 'Unknown title')} (ID: {info.get('id', 'Unknown ID')})")
-            logger.debug(f"Found {len(info.get('formats', []))} formats")
-            return info
+        info = _info_ydl().extract_info(url, download=False)
+        logger.debug("Extracted info for video: %s (ID: %s)", info.get('title', 'Unknown title'), info.get('id', 'Unknown ID'))
+        logger.debug("Found %s formats", len(info.get('formats', [])))
+        return info
     except Exception as e:
         logger.error(f"Failed to extract video info for {url}: {e}")
         return None
@@ -54,17 +111,50 @@ def get_video_info(url: str) -> Optional[Dict]:
 
 # -------------------- Transcript Metadata --------------------
 
+# Language codes that count as English when picking an auto-generated transcript
+_ENGLISH_CODES = frozenset(('en', 'en-US', 'en-GB'))
+
+# One row of the "Transcript Info" table
+_TRANSCRIPT_ROW_FMT = "{:<8} | {:<24} | generated: {} | translatable: {} {}"
+
+# Transcript lists by video_id as (fetched at, list). Selecting, previewing and
+# downloading a transcript each ask for the list within seconds of each other;
+# one request to YouTube serves them all.
+_TRANSCRIPT_LIST_CACHE: Dict[str, Tuple[float, Any]] = {}
+_TRANSCRIPT_LIST_TTL = 60  # seconds
+_TRANSCRIPT_LIST_CACHE_SIZE = 128
+# Shared by the batch thread pool and the background-task threads
+_TRANSCRIPT_LIST_LOCK = threading.Lock()
+
+
 def _get_transcript_list(video_id: str):
     """Utility function to get transcript list with API compatibility handling."""
+    now = time.monotonic()
+    with _TRANSCRIPT_LIST_LOCK:
+        cached = _TRANSCRIPT_LIST_CACHE.get(video_id)
+    if cached and now - cached[0] < _TRANSCRIPT_LIST_TTL:
+        logger.debug("Using cached transcript list for video_id: %s", video_id)
+        return cached[1]
+    
+    from youtube_transcript_api import YouTubeTranscriptApi
     try:
         api = YouTubeTranscriptApi()
-        return api.list(video_id)
+        transcript_list = api.list(video_id)
     except AttributeError:
-        return YouTubeTranscriptApi.list(video_id)
+        transcript_list = YouTubeTranscriptApi.list(video_id)
+    
+    # Re-inserting moves the entry to the end, so the first one is the oldest.
+    # The fetch above runs unlocked; only the dict updates are serialized.
+    with _TRANSCRIPT_LIST_LOCK:
+        _TRANSCRIPT_LIST_CACHE.pop(video_id, None)
+        _TRANSCRIPT_LIST_CACHE[video_id] = (now, transcript_list)
+        while len(_TRANSCRIPT_LIST_CACHE) > _TRANSCRIPT_LIST_CACHE_SIZE:
+            del _TRANSCRIPT_LIST_CACHE[next(iter(_TRANSCRIPT_LIST_CACHE))]
+    return transcript_list
 
 
 def list_transcript_metadata(video_id: str) -> List[Dict[str, Any]]:
-    logger.debug(f"Listing transcript metadata for video_id: {video_id}")
+    logger.debug("Listing transcript metadata for video_id: %s", video_id)
     try:
         transcript_list = _get_transcript_list(video_id)
     except Exception as e:
@@ -88,26 +178,26 @@ def list_transcript_metadata(video_id: str) -> List[Dict[str, Any]]:
             "is_default": is_default
         }
         
-        logger.debug(f"Transcript metadata: {transcript_meta}")
+        logger.debug("Transcript metadata: %s", transcript_meta)
         meta.append(transcript_meta)
     
-    logger.debug(f"Total transcripts found: {len(meta)}")
+    logger.debug("Total transcripts found: %s", len(meta))
     return meta
 
 
 def print_and_select_default_transcript(video_id: str, preferred_language: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    logger.debug(f"Starting transcript discovery for video_id: {video_id}, preferred_language: {preferred_language}")
+    logger.debug("Starting transcript discovery for video_id: %s, preferred_language: %s", video_id, preferred_language)
     
     # If no preferred language provided, use English as default
     if not preferred_language:
         preferred_language = "en"  # Default to English
-        logger.debug(f"Using default preferred language: {preferred_language}")
+        logger.debug("Using default preferred language: %s", preferred_language)
     
     print("\nTranscript Info")
     print("-" * 40)
     try:
         rows = list_transcript_metadata(video_id)
-        logger.debug(f"Found {len(rows)} transcript metadata rows")
+        logger.debug("Found %s transcript metadata rows", len(rows))
         
         if not rows:
             logger.warning("No transcripts found")
@@ -115,58 +205,66 @@ def print_and_select_default_transcript(video_id: str, preferred_language: Optio
             return None
 
         default_transcript = None
-        manual_transcripts = []
-        auto_generated_transcripts = []
+        # First transcript per language code, so the fallbacks below are lookups
+        manual_by_code = {}
+        auto_by_code = {}
+        first_manual = None
+        first_auto = None
+        english_auto = None
+        table_lines = []
         
         for i, r in enumerate(rows):
-            logger.debug(f"Transcript {i}: {r}")
+            logger.debug("Transcript %s: %s", i, r)
             
             # Categorize transcripts
             if not r["is_generated"]:
-                manual_transcripts.append(r)
-                logger.debug(f"Found manual transcript: {r['language_code']} - {r['language']}")
+                manual_by_code.setdefault(r['language_code'], r)
+                if first_manual is None:
+                    first_manual = r
+                logger.debug("Found manual transcript: %s - %s", r['language_code'], r['language'])
             else:
-                auto_generated_transcripts.append(r)
-                logger.debug(f"Found auto-generated transcript: {r['language_code']} - {r['language']}")
+                auto_by_code.setdefault(r['language_code'], r)
+                if first_auto is None:
+                    first_auto = r
+                if english_auto is None and r['language_code'] in _ENGLISH_CODES:
+                    english_auto = r
+                logger.debug("Found auto-generated transcript: %s - %s", r['language_code'], r['language'])
             
             tag = "[DEFAULT]" if r["is_default"] else ""
-            print(
-                f"{(r['language_code'] or '-'): <8} | "
-                f"{(r['language'] or '-'): <24} | "
-                f"generated: {r['is_generated']} | "
-                f"translatable: {r['is_translatable']} {tag}"
-            )
+            table_lines.append(_TRANSCRIPT_ROW_FMT.format(
+                r['language_code'] or '-', r['language'] or '-', r['is_generated'], r['is_translatable'], tag
+            ))
             if r["is_default"]:
                 default_transcript = r
-                logger.debug(f"Found explicit default transcript: {r}")
+                logger.debug("Found explicit default transcript: %s", r)
+        
+        print("\n".join(table_lines))
 
         # Enhanced selection logic with language preference priority
         if not default_transcript:
             logger.debug("No explicit default found, applying enhanced fallback logic")
-            all_transcripts = manual_transcripts + auto_generated_transcripts
             
             # Priority 1: Check for preferred language (from CLI --lang or config)
             if preferred_language:
-                preferred_transcript = next((t for t in all_transcripts if t['language_code'] == preferred_language), None)
+                preferred_transcript = manual_by_code.get(preferred_language) or auto_by_code.get(preferred_language)
                 if preferred_transcript:
                     default_transcript = preferred_transcript
                     logger.info(f"Selected preferred language transcript: {preferred_transcript['language']} ({preferred_transcript['language_code']})")
             
             # Priority 2: Prefer manual transcripts over auto-generated (if no preferred language match)
-            if not default_transcript and manual_transcripts:
-                default_transcript = manual_transcripts[0]
-                logger.debug(f"Selected first manual transcript as default: {default_transcript}")
+            if not default_transcript and first_manual:
+                default_transcript = first_manual
+                logger.debug("Selected first manual transcript as default: %s", default_transcript)
             
             # Priority 3: Look for English auto-generated
-            elif not default_transcript and auto_generated_transcripts:
-                english_auto = next((t for t in auto_generated_transcripts if t['language_code'] in ['en', 'en-US', 'en-GB']), None)
+            elif not default_transcript and first_auto:
                 if english_auto:
                     default_transcript = english_auto
-                    logger.debug(f"Selected English auto-generated transcript as default: {default_transcript}")
+                    logger.debug("Selected English auto-generated transcript as default: %s", default_transcript)
                 else:
                     # Priority 4: Fallback to first available auto-generated
-                    default_transcript = auto_generated_transcripts[0]
-                    logger.debug(f"Selected first auto-generated transcript as default: {default_transcript}")
+                    default_transcript = first_auto
+                    logger.debug("Selected first auto-generated transcript as default: %s", default_transcript)
 
         if default_transcript:
             logger.info(f"Final selected transcript: {default_transcript['language']} ({default_transcript['language_code']})")
@@ -177,7 +275,7 @@ def print_and_select_default_transcript(video_id: str, preferred_language: Optio
 
         return default_transcript
 
-    except (TranscriptsDisabled, NoTranscriptFound):
+    except _transcript_errors():
         print("Transcripts are disabled or not found for this video.")
         return None
     except Exception as e:
@@ -197,14 +295,11 @@ def preview_transcript(video_id: str, language_code: str = None, include_metadat
     Returns:
         Dictionary with preview information, or None if not available
     """
-    logger.debug(f"Generating transcript preview for video_id: {video_id}, language: {language_code}")
+    logger.debug("Generating transcript preview for video_id: %s, language: %s", video_id, language_code)
     
     try:
-        try:
-            from .transcript_processor import TranscriptProcessor
-        except ImportError:
-            from transcript_processor import TranscriptProcessor
-        from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+        TranscriptProcessor = _transcript_processor_class()
+        from youtube_transcript_api import YouTubeTranscriptApi
         
         # If no language specified, find the default
         if language_code is None:
@@ -220,14 +315,14 @@ def preview_transcript(video_id: str, language_code: str = None, include_metadat
         for transcript in transcript_list:
             if hasattr(transcript, 'language_code') and transcript.language_code == language_code:
                 transcript_data = transcript.fetch()
-                logger.debug(f"✅ Found transcript for preview using transcript list method")
+                logger.debug("✅ Found transcript for preview using transcript list method")
                 break
         
         if not transcript_data:
             # Fallback method
             try:
                 transcript_data = YouTubeTranscriptApi.get_transcript(video_id, languages=[language_code])
-                logger.debug(f"✅ Found transcript for preview using get_transcript fallback method")
+                logger.debug("✅ Found transcript for preview using get_transcript fallback method")
             except Exception:
                 logger.warning(f"No transcript available for preview")
                 return None
@@ -245,11 +340,17 @@ def preview_transcript(video_id: str, language_code: str = None, include_metadat
         if include_metadata:
             try:
                 # Simple content analysis without config dependency
-                total_text = ' '.join([entry.get('text', '') for entry in transcript_data])
-                word_count = len(total_text.split())
+                # One pass over the entries; counting words per entry gives the
+                # same total as splitting the joined text, without building it
+                word_count = 0
+                total_chars = 0
+                for entry in transcript_data:
+                    text = entry.get('text', '')
+                    word_count += len(text.split())
+                    total_chars += len(text)
                 
                 # Basic quality indicators
-                avg_entry_length = sum(len(entry.get('text', '')) for entry in transcript_data) / len(transcript_data) if transcript_data else 0
+                avg_entry_length = total_chars / len(transcript_data) if transcript_data else 0
                 quality_score = min(100, max(0, (avg_entry_length - 10) * 2))  # Simple heuristic
                 
                 preview_data['content_insights'] = {
@@ -272,7 +373,7 @@ def preview_transcript(video_id: str, language_code: str = None, include_metadat
         logger.info(f"✅ Transcript preview generated for {video_id} ({language_code})")
         return preview_data
         
-    except (TranscriptsDisabled, NoTranscriptFound):
+    except _transcript_errors():
         logger.warning(f"Transcripts are disabled or not found for video {video_id}")
         return None
     except Exception as e:
@@ -288,52 +389,55 @@ def print_transcript_preview(video_id: str, language_code: str = None):
         print("❌ No transcript preview available")
         return
     
-    print(f"\n📄 Transcript Preview ({preview.get('language_code', 'unknown')})")
-    print("-" * 60)
-    print(preview['preview_text'])
+    lines = []
+    out = lines.append
+    
+    out(f"\n📄 Transcript Preview ({preview.get('language_code', 'unknown')})")
+    out("-" * 60)
+    out(preview['preview_text'])
     
     if 'statistics' in preview:
         stats = preview['statistics']
-        print(f"\n📊 Statistics:")
-        print(f"   • Word count: {stats['word_count']:,}")
-        print(f"   • Character count: {stats['character_count']:,}")
-        print(f"   • Estimated reading time: {stats['estimated_reading_time_minutes']} minutes")
+        out(f"\n📊 Statistics:")
+        out(f"   • Word count: {stats['word_count']:,}")
+        out(f"   • Character count: {stats['character_count']:,}")
+        out(f"   • Estimated reading time: {stats['estimated_reading_time_minutes']} minutes")
     
     if 'quality_indicators' in preview:
         quality = preview['quality_indicators']
-        print(f"\n🔍 Quality Indicators:")
-        print(f"   • Quality estimate: {quality['quality_estimate']}")
-        print(f"   • Average entry length: {quality['average_entry_length']:.1f} characters")
-        print(f"   • Has timestamps: {'Yes' if quality['has_timestamps'] else 'No'}")
+        out(f"\n🔍 Quality Indicators:")
+        out(f"   • Quality estimate: {quality['quality_estimate']}")
+        out(f"   • Average entry length: {quality['average_entry_length']:.1f} characters")
+        out(f"   • Has timestamps: {'Yes' if quality['has_timestamps'] else 'No'}")
     
     # 🆕 Enhanced metadata display
     if 'content_insights' in preview:
         insights = preview['content_insights']
-        print(f"\n🎯 Content Insights:")
-        print(f"   • Category: {insights.get('content_category', 'Unknown')}")
-        print(f"   • Language: {insights.get('language_detected', 'Unknown')}")
+        out(f"\n🎯 Content Insights:")
+        out(f"   • Category: {insights.get('content_category', 'Unknown')}")
+        out(f"   • Language: {insights.get('language_detected', 'Unknown')}")
         if insights.get('keywords'):
-            print(f"   • Key topics: {', '.join(insights['keywords'])}")
+            out(f"   • Key topics: {', '.join(insights['keywords'])}")
         if insights.get('topics'):
-            print(f"   • Main subjects: {', '.join(insights['topics'])}")
+            out(f"   • Main subjects: {', '.join(insights['topics'])}")
     
     if 'quality_insights' in preview:
         quality_insights = preview['quality_insights']
-        print(f"\n🎖️ Quality Assessment:")
-        print(f"   • Overall quality: {quality_insights.get('quality_category', 'Unknown')} ({quality_insights.get('quality_score', 0):.1f}/100)")
+        out(f"\n🎖️ Quality Assessment:")
+        out(f"   • Overall quality: {quality_insights.get('quality_category', 'Unknown')} ({quality_insights.get('quality_score', 0):.1f}/100)")
         artifact_ratio = quality_insights.get('artifact_ratio', 0)
         if artifact_ratio > 0:
-            print(f"   • Artifact ratio: {artifact_ratio:.1%}")
+            out(f"   • Artifact ratio: {artifact_ratio:.1%}")
     
     if 'content_metrics' in preview:
         metrics = preview['content_metrics']
-        print(f"\n📈 Content Metrics:")
+        out(f"\n📈 Content Metrics:")
         if metrics.get('speaking_rate_wpm', 0) > 0:
-            print(f"   • Speaking rate: {metrics['speaking_rate_wpm']} words/minute")
-        print(f"   • Readability: {metrics.get('readability', 'Unknown')}")
-        print(f"   • Lexical diversity: {metrics.get('lexical_diversity', 0):.2f}")
+            out(f"   • Speaking rate: {metrics['speaking_rate_wpm']} words/minute")
+        out(f"   • Readability: {metrics.get('readability', 'Unknown')}")
+        out(f"   • Lexical diversity: {metrics.get('lexical_diversity', 0):.2f}")
     
-    print(f"\n💾 Total entries available: {preview['total_entries']}")
+    out(f"\n💾 Total entries available: {preview['total_entries']}")
     
     # 🆕 LLM suitability indicator
     if 'quality_insights' in preview and 'statistics' in preview:
@@ -341,13 +445,16 @@ def print_transcript_preview(video_id: str, language_code: str = None):
         word_count = preview['statistics'].get('word_count', 0)
         
         if quality_score >= 80 and 100 <= word_count <= 3000:
-            print(f"✅ Excellent for LLM analysis")
+            out(f"✅ Excellent for LLM analysis")
         elif quality_score >= 70 and 50 <= word_count <= 5000:
-            print(f"✅ Good for LLM analysis")
+            out(f"✅ Good for LLM analysis")
         elif quality_score >= 60:
-            print(f"⚠️ Fair for LLM analysis - may need cleaning")
+            out(f"⚠️ Fair for LLM analysis - may need cleaning")
         else:
-            print(f"❌ Poor quality - manual review recommended")
+            out(f"❌ Poor quality - manual review recommended")
+    
+    # One write for the whole preview instead of a write per line
+    print("\n".join(lines))
 
 
 # -------------------- Display Helpers --------------------
@@ -374,6 +481,10 @@ def print_basic_info(info: Optional[Dict]):
 
 # -------------------- Main Entry Point --------------------
 
+# Anything but letters, digits, '_', ' ' and '-' (\w is str.isalnum() plus '_')
+_UNSAFE_TITLE_CHARS_RE = re.compile(r'[^\w \-]')
+
+
 def download_transcript_files(url: str, output_dir: str = None, formats: List[str] = None) -> tuple[bool, dict]:
     """
     Download and save transcript files for a YouTube video.
@@ -429,7 +540,7 @@ def download_transcript_files(url: str, output_dir: str = None, formats: List[st
             os.makedirs(output_dir, exist_ok=True)
         
         # Generate base filename
-        safe_title = "".join(c for c in info.get('title', 'video') if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_title = _UNSAFE_TITLE_CHARS_RE.sub('', info.get('title', 'video')).rstrip()
         base_filename = f"{video_id}_{language_code}_{safe_title[:50]}"
         base_path = os.path.join(output_dir, base_filename)
         
@@ -439,20 +550,17 @@ def download_transcript_files(url: str, output_dir: str = None, formats: List[st
         if formats is None:
             formats = ['clean', 'timestamped', 'structured']
         
-        # Import the download function
-        try:
-            from .yt_downloads_utils import download_transcript
-        except ImportError:
-            from yt_downloads_utils import download_transcript
+        download_transcript = _download_transcript_func()
         
         # Download transcript in selected formats
         print("📥 Downloading transcript...")
-        saved_files = download_transcript(
+        saved_files, contents = download_transcript(
             video_id=video_id,
             language_code=language_code,
             save_path=base_path,
             formats=formats,
-            video_metadata=info
+            video_metadata=info,
+            return_content=True
         )
         
         if not saved_files:
@@ -462,7 +570,10 @@ def download_transcript_files(url: str, output_dir: str = None, formats: List[st
         # Display results
         print("\n✅ Successfully generated transcript files:")
         for format_name, file_path in saved_files.items():
-            file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                file_size = 0
             print(f"   📄 {format_name}: {os.path.basename(file_path)} ({file_size:,} bytes)")
         
         # Collect structured data for database saving
@@ -478,32 +589,25 @@ def download_transcript_files(url: str, output_dir: str = None, formats: List[st
             'timestamped_text': None,
         }
         
-        # Read the generated files to extract data
+        # Use the generated content directly instead of reading the files back
         try:
-            # Read structured JSON if available
-            if 'structured' in saved_files and os.path.exists(saved_files['structured']):
-                with open(saved_files['structured'], 'r', encoding='utf-8') as f:
-                    data['structured_data'] = json.load(f)
-                    # Extract segments and chapters from structured data
-                    transcript_data = data['structured_data'].get('transcript', {})
-                    data['segments'] = transcript_data.get('entries', [])
-                    data['chapters'] = transcript_data.get('chapters', [])
+            if 'structured' in contents:
+                data['structured_data'] = contents['structured']
+                # Extract segments and chapters from structured data
+                transcript_data = data['structured_data'].get('transcript', {})
+                data['segments'] = transcript_data.get('entries', [])
+                data['chapters'] = transcript_data.get('chapters', [])
             
-            # Read clean text if available
-            if 'clean' in saved_files and os.path.exists(saved_files['clean']):
-                with open(saved_files['clean'], 'r', encoding='utf-8') as f:
-                    data['clean_text'] = f.read()
+            data['clean_text'] = contents.get('clean')
             
-            # Read timestamped text if available
-            if 'timestamped' in saved_files and os.path.exists(saved_files['timestamped']):
-                with open(saved_files['timestamped'], 'r', encoding='utf-8') as f:
-                    data['timestamped_text'] = f.read()
-                    # If no segments from structured data, parse from timestamped text
-                    if not data['segments']:
-                        data['segments'] = _parse_timestamped_text(data['timestamped_text'])
+            if 'timestamped' in contents:
+                data['timestamped_text'] = contents['timestamped']
+                # If no segments from structured data, parse from timestamped text
+                if not data['segments']:
+                    data['segments'] = _parse_timestamped_text(data['timestamped_text'])
         
         except Exception as e:
-            print(f"⚠️ Warning: Could not read generated files for database saving: {e}")
+            print(f"⚠️ Warning: Could not collect generated content for database saving: {e}")
         
         return True, data
         
@@ -512,43 +616,46 @@ def download_transcript_files(url: str, output_dir: str = None, formats: List[st
         return False, {}
 
 
-def _parse_timestamped_text(timestamped_text: str) -> List[Dict[str, Any]]:
-    """Parse timestamped text into segments for database storage."""
-    import re
-    
-    # Regex to match timestamp formats like [00:01:23] or 1:23:45.678
-    ts_re = re.compile(
-        r"^\s*(?:\[)?(?:(\d{1,2}):)?(\d{1,2}):(\d{2})(?:[\.,](\d{1,3}))?(?:\])?\s*(.*\S)\s*$"
-    )
+def download_transcript_files_many(urls: List[str], output_dir: str = None, formats: List[str] = None,
+                                   max_workers: int = 4) -> Dict[str, tuple[bool, dict]]:
+    """
+    Download transcript files for several YouTube videos concurrently.
     
-    segments = []
-    lines = timestamped_text.strip().split('\n')
+    The work per URL is network-bound, so it runs on a thread pool; max_workers
+    also caps how many requests hit YouTube at once.
     
-    for line in lines:
-        if not line.strip():
-            continue
-            
-        match = ts_re.match(line)
-        if not match:
-            continue
-            
-        # Convert timestamp to seconds
-        hours = int(match.group(1)) if match.group(1) else 0
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        milliseconds = int(match.group(4)) if match.group(4) else 0
-        
-        start_time = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-        text = match.group(5).strip()
-        
-        if text:
-            segments.append({
-                'start': start_time,
-                'text': text,
-                'duration': 3.0  # Default duration
-            })
+    Args:
+        urls: YouTube video URLs
+        output_dir: Directory to save files (defaults to current directory)
+        formats: List of formats to generate ['clean', 'timestamped', 'structured']
+        max_workers: Maximum number of videos processed at the same time
     
-    return segments
+    Returns:
+        Dict mapping each URL (in input order) to its download_transcript_files (success, data) tuple
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(lambda url: download_transcript_files(url, output_dir, formats), urls)))
+
+
+# Timestamped lines like "[00:01:23] text" or "1:23:45.678 text", matched
+# across the whole buffer ([^\S\n] is whitespace that doesn't end the line)
+_TS_RE = re.compile(
+    r"^[^\S\n]*(?:\[)?(?:(\d{1,2}):)?(\d{1,2}):(\d{2})(?:[\.,](\d{1,3}))?(?:\])?[^\S\n]*(.*\S)[^\S\n]*$",
+    re.MULTILINE
+)
+
+
+def _parse_timestamped_text(timestamped_text: str) -> List[Dict[str, Any]]:
+    """Parse timestamped text into segments for database storage."""
+    return [
+        {
+            # Convert timestamp to seconds
+            'start': int(match[1] or 0) * 3600 + int(match[2]) * 60 + int(match[3]) + int(match[4] or 0) / 1000.0,
+            'text': match[5],
+            'duration': 3.0  # Default duration
+        }
+        for match in _TS_RE.finditer(timestamped_text)
+    ]
 
 
 def main():
@@ -559,16 +666,18 @@ def main():
 Examples:
   python dl_transcription.py "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
   python dl_transcription.py "https://youtu.be/dQw4w9WgXcQ" --output-dir ./transcripts
+  python dl_transcription.py "https://youtu.be/VIDEO_ID_1" "https://youtu.be/VIDEO_ID_2" --workers 2
         """
     )
     
-    parser.add_argument("url", help="YouTube video URL")
+    parser.add_argument("urls", nargs="+", metavar="url", help="YouTube video URL(s)")
     parser.add_argument("--output-dir", "-o", help="Output directory (defaults to current directory)")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Videos to process concurrently (default: 4)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
     
-    if not args.url.strip():
+    if not all(url.strip() for url in args.urls):
         print("❌ URL cannot be empty.")
         sys.exit(1)
     
@@ -579,7 +688,11 @@ Examples:
     
     print("=== YouTube Transcript Downloader ===")
     
-    success = download_transcript_files(args.url, args.output_dir)
+    if len(args.urls) == 1:
+        success, _ = download_transcript_files(args.urls[0], args.output_dir)
+    else:
+        results = download_transcript_files_many(args.urls, args.output_dir, max_workers=max(1, args.workers))
+        success = all(ok for ok, _ in results.values())
     
     if success:
         print("\n🎉 Transcript download completed successfully!")
@@ -1,9 +1,22 @@
+import atexit
 import json
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+import traceback
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 ENCODING = "utf-8"
 DEFAULT_CONFIG_FILE = "logger_config.json"
@@ -13,65 +26,360 @@ if getattr(sys, 'frozen', False):
 else:
     MODULE_DIR = Path(__file__).parent.absolute()
 
+# Resolved once; load_config(None) uses it without probing the disk again
+_DEFAULT_CONFIG_PATH: Optional[Path] = next(
+    (path for path in (MODULE_DIR / "config" / DEFAULT_CONFIG_FILE,) if path.exists()),
+    None
+)
+
+# Log files always live next to this file, even in a frozen build where
+# MODULE_DIR points at the (temporary) bundle directory
+LOGS_DIR = Path(__file__).parent.absolute() / "logs"
+_logs_dir_ready = False
+
+# Used when there is no config file or it cannot be read; shared, not copied,
+# so callers must not modify it
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "logging": {
+        "file": {"level": "INFO"},
+        "console": {"level": "INFO"}
+    }
+}
+
+# Parsed config files by path, with the mtime they were parsed at; every
+# module calls setup_logger, but the file only changes when someone edits it
+_CONFIG_CACHE: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+_CONFIG_LOCK = threading.Lock()
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if config_path is None:
-        possible_config_paths = [
-            MODULE_DIR / "config" / DEFAULT_CONFIG_FILE,
-        ]
-        for path in possible_config_paths:
-            if path.exists():
-                config_path = path
-                break
+        config_path = _DEFAULT_CONFIG_PATH
+    if config_path is None:
+        return _DEFAULT_CONFIG
+    config_path = Path(config_path)
+    if not config_path.is_file():
+        return _DEFAULT_CONFIG
+
     try:
-        with open(config_path, 'r', encoding=ENCODING) as f:
-            return json.load(f)
-    except Exception:
-        return {
-            "logging": {
-                "file": {"level": "INFO"},
-                "console": {"level": "INFO"}
-            }
-        }
+        mtime = config_path.stat().st_mtime
+        with _CONFIG_LOCK:
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            try:
+                with open(config_path, 'rb') as f:
+                    config = _loads(f.read())
+            except ValueError as e:
+                # Cached below like a good file, so this warns once per edit
+                logging.getLogger(__name__).warning("Invalid logger config %s, using defaults: %s", config_path, e)
+                config = _DEFAULT_CONFIG
+            _CONFIG_CACHE[config_path] = (mtime, config)
+            return config
+    except OSError:
+        return _DEFAULT_CONFIG
+
+# Backup shifting for BufferedRotatingFileHandler, done off the logging threads
+# by one daemon worker that starts with the first rollover
+_rollover_queue: "queue.SimpleQueue[Tuple[BufferedRotatingFileHandler, str]]" = queue.SimpleQueue()
+_rollover_worker: Optional[threading.Thread] = None
+_rollover_worker_lock = threading.Lock()
+
+def _run_rollovers():
+    while True:
+        handler, pending_name = _rollover_queue.get()
+        try:
+            handler._shift_backups(pending_name)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+        finally:
+            handler._shift_done()
+
+def _queue_rollover(handler: "BufferedRotatingFileHandler", pending_name: str):
+    global _rollover_worker
+    with _rollover_worker_lock:
+        if _rollover_worker is None:
+            _rollover_worker = threading.Thread(target=_run_rollovers, name="log-rollover", daemon=True)
+            _rollover_worker.start()
+    _rollover_queue.put((handler, pending_name))
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes instead of flushing every record.
+
+    Records collect in a buffer_size write buffer and reach the file when it
+    fills, on the periodic flush thread (skipped when nothing was written
+    since the last flush), right away for ERROR and above, and on close
+    (logging.shutdown closes handlers at exit). The file size is
+    tracked in memory, so the rollover check neither seeks nor stats the
+    file per record.
+
+    On rollover the emitting thread only renames the full file aside and
+    opens a fresh one; shifting the numbered backups happens on a background
+    thread.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, errors=None, buffer_size: int = 65536, flush_interval: float = 30.0):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._size = 0
+        self._flush_thread = None
+        self._stop_flushing = threading.Event()
+        self._dirty = False
+        self._rollovers = 0
+        # Backup shifts queued for the worker and not finished yet
+        self._pending_shifts = 0
+        self._shifts_changed = threading.Condition()
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+        self._start_flush_thread()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _start_flush_thread(self):
+        if self.flush_interval > 0:
+            self._flush_thread = threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True)
+            self._flush_thread.start()
+
+    def _flush_periodically(self):
+        # One thread for the handler's lifetime; close() sets the event to end it
+        while not self._stop_flushing.wait(self.flush_interval):
+            if self._dirty:
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            self._dirty = False
+            super().flush()
+
+    def doRollover(self):
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            self._rollovers += 1
+            pending_name = f"{self.baseFilename}.rollover-{os.getpid()}-{self._rollovers}"
+            os.rename(self.baseFilename, pending_name)
+            with self._shifts_changed:
+                self._pending_shifts += 1
+            _queue_rollover(self, pending_name)
+        if not self.delay:
+            self.stream = self._open()
+
+    def _shift_backups(self, pending_name: str):
+        # Same shuffle as RotatingFileHandler.doRollover, ending with the set-aside file as .1
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+            dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+            if os.path.exists(sfn):
+                if os.path.exists(dfn):
+                    os.remove(dfn)
+                os.rename(sfn, dfn)
+        dfn = self.rotation_filename(self.baseFilename + ".1")
+        if os.path.exists(dfn):
+            os.remove(dfn)
+        self.rotate(pending_name, dfn)
+
+    def _shift_done(self):
+        with self._shifts_changed:
+            self._pending_shifts -= 1
+            self._shifts_changed.notify_all()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # Byte length without encoding the (usual) ASCII-only message
+            size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or ENCODING, self.errors or 'strict'))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+                self._dirty = False
+            else:
+                self._dirty = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        # Not joined: logging.shutdown calls close() holding the handler lock,
+        # which a flush in progress on that thread may be waiting for
+        self._stop_flushing.set()
+        # Let this handler's queued backup shifts finish so no set-aside file is left behind
+        with self._shifts_changed:
+            self._shifts_changed.wait_for(lambda: self._pending_shifts == 0)
+        super().close()
+
+# Loggers only enqueue records; one listener thread formats and writes them
+# with the console/file handlers of the logger each record came through
+_LOG_QUEUE = queue.SimpleQueue()
+_LOGGER_HANDLERS: Dict[str, Tuple[logging.Handler, ...]] = {}
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+class _RoutingQueueHandler(QueueHandler):
+    """QueueHandler that labels each record with the logger it was set up for."""
+
+    def __init__(self, log_queue, target: str):
+        super().__init__(log_queue)
+        self.target = target
+
+    def prepare(self, record):
+        # prepare() returns a copy, so a record passing through several of
+        # these (child and parent loggers) gets one label per copy
+        record = super().prepare(record)
+        record.log_target = self.target
+        return record
+
+class _DispatchHandler(logging.Handler):
+    """Listener-side handler that passes records on to their logger's real handlers."""
+
+    def handle(self, record):
+        for handler in _LOGGER_HANDLERS.get(getattr(record, 'log_target', record.name), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+def _ensure_listener():
+    global _LISTENER
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            _LISTENER = QueueListener(_LOG_QUEUE, _DispatchHandler())
+            _LISTENER.start()
+            # Runs before logging.shutdown (atexit is LIFO), so queued records
+            # are written before the handlers are flushed and closed
+            atexit.register(_LISTENER.stop)
+
+# (config dict, {module name: (console level, file level, log filename)}) for
+# the config setup_logger last saw; load_config hands back the same dict
+# until the file changes, so the table is rebuilt only then
+_MODULE_TABLE: Tuple[Optional[Dict[str, Any]], Dict[str, Tuple[int, int, str]]] = (None, {})
+_DEFAULT_MODULE = "default"
+
+def _module_table(config: Dict[str, Any]) -> Dict[str, Tuple[int, int, str]]:
+    global _MODULE_TABLE
+    cached_config, table = _MODULE_TABLE
+    if cached_config is config:
+        return table
+
+    logging_config = config.get("logging", {})
+    console_level = getattr(logging, logging_config.get("console", {}).get("level", "INFO"))
+    file_config = logging_config.get("file", {})
+    modules = logging_config.get("modules", {})
+    default = modules.get(_DEFAULT_MODULE, {})
+    table = {}
+    for name, module_config in {_DEFAULT_MODULE: default, **modules}.items():
+        table[name] = (
+            console_level,
+            getattr(logging, module_config.get("level", file_config.get("level", "INFO"))),
+            module_config.get("log_filename", file_config.get("log_filename", "project.log")),
+        )
+    _MODULE_TABLE = (config, table)
+    return table
+
+def _ensure_logs_dir() -> Path:
+    global _logs_dir_ready
+    if not _logs_dir_ready:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        _logs_dir_ready = True
+    return LOGS_DIR
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter that runs strftime once per second instead of once per record.
+
+    The formatted time is cached with the whole second it was made for;
+    without a datefmt the milliseconds are appended per record, as
+    logging.Formatter does.
+    """
+
+    def __init__(self, fmt=None, datefmt=None, style='%', validate=True, **kwargs):
+        super().__init__(fmt, datefmt, style, validate, **kwargs)
+        # (second, formatted time), swapped as one tuple so threads sharing
+        # the formatter never see a mismatched pair
+        self._last_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._last_time
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._last_time = (second, formatted)
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+@lru_cache(maxsize=16)
+def _make_formatter(fmt: str, datefmt: str) -> logging.Formatter:
+    # The time cache is the only per-record state, so loggers with the same format share one
+    return FastFormatter(fmt, datefmt)
 
 def setup_logger(module_name: str, config_path: Optional[Path] = None, log_dir: Optional[Path] = None) -> logging.Logger:
+    logger = logging.getLogger(module_name)
+    # Already set up by an earlier call (e.g. the module imported under a second name)
+    if any(getattr(handler, '_ytdl_managed', False) for handler in logger.handlers):
+        return logger
+
     config = load_config(config_path)
     logging_config = config.get("logging", {})
-    logs_dir = Path(__file__).parent.absolute() / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    logs_dir = _ensure_logs_dir()
 
-    module_config = logging_config.get("modules", {}).get(
-        module_name,
-        logging_config.get("modules", {}).get("default", {})
-    )
+    table = _module_table(config)
+    console_level, file_level, log_filename = table.get(module_name, table[_DEFAULT_MODULE])
 
-    logger = logging.getLogger(module_name)
-    logger.setLevel(logging.DEBUG)
+    # Close replaced handlers so buffered file output is written out
+    for handler in logger.handlers:
+        handler.close()
+    for handler in _LOGGER_HANDLERS.pop(module_name, ()):
+        handler.close()
     logger.handlers = []
 
     console_config = logging_config.get("console", {})
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, console_config.get("level", "INFO")))
-    console_handler.setFormatter(logging.Formatter(
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(_make_formatter(
         console_config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
         console_config.get("date_format", "%H:%M:%S")
     ))
-    logger.addHandler(console_handler)
 
     file_config = logging_config.get("file", {})
-    log_file = logs_dir / module_config.get("log_filename", file_config.get("log_filename", "project.log"))
+    log_file = logs_dir / log_filename
 
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=file_config.get("max_size_bytes", 1048576),
         backupCount=file_config.get("backup_count", 5),
-        encoding=file_config.get("encoding", ENCODING)
+        encoding=file_config.get("encoding", ENCODING),
+        delay=True  # Open the file with the first record, not at import
     )
-    file_handler.setLevel(getattr(logging, module_config.get("level", file_config.get("level", "INFO"))))
-    file_handler.setFormatter(logging.Formatter(
+    file_handler.setLevel(file_level)
+    file_handler.setFormatter(_make_formatter(
         file_config.get("format", "%(asctime)s - %(name)s - %(levelname)s - [%(module)s:%(lineno)d] - %(message)s"),
         file_config.get("date_format", "%Y-%m-%d %H:%M:%S")
     ))
-    logger.addHandler(file_handler)
 
-    logger.info(f"Using log file: {log_file}")
+    _LOGGER_HANDLERS[module_name] = (console_handler, file_handler)
+    queue_handler = _RoutingQueueHandler(_LOG_QUEUE, module_name)
+    queue_handler._ytdl_managed = True
+    logger.addHandler(queue_handler)
+    _ensure_listener()
+
+    # No lower than the most verbose handler, so calls below it stop at the
+    # logger's cached level check instead of building a record nobody writes
+    logger.setLevel(min(console_handler.level, file_handler.level))
+
+    logger.debug("Using log file: %s", log_file)
     return logger
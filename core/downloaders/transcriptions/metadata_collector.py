@@ -40,7 +40,7 @@ class MetadataCollector:
         # Load stop words from config with fallback
         self.stop_words = self._load_stop_words()
         
-        logger.debug(f"MetadataCollector initialized with config: {self.config}")
+        logger.debug("MetadataCollector initialized with config: %s", self.config)
     
     def _load_stop_words(self) -> set:
         """Load stop words from config with fallback to default list."""
@@ -49,7 +49,7 @@ class MetadataCollector:
             config_stop_words = self.content_analysis_config.get("stop_words", [])
             if config_stop_words:
                 stop_words_set = set(config_stop_words)
-                logger.debug(f"Loaded {len(stop_words_set)} stop words from config")
+                logger.debug("Loaded %s stop words from config", len(stop_words_set))
                 return stop_words_set
             else:
                 # Fallback to default stop words
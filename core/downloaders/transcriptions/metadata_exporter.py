@@ -22,7 +22,7 @@ logger = setup_logger("metadata_exporter")
 def export_json(metadata: Dict[str, Any], output_path: str) -> bool:
     """Export metadata as JSON file."""
     try:
-        logger.debug(f"Exporting metadata to JSON: {output_path}")
+        logger.debug("Exporting metadata to JSON: %s", output_path)
         
         # Ensure directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
@@ -41,7 +41,7 @@ def export_json(metadata: Dict[str, Any], output_path: str) -> bool:
 def export_csv(metadata: Dict[str, Any], output_path: str) -> bool:
     """Export metadata as CSV file."""
     try:
-        logger.debug(f"Exporting metadata to CSV: {output_path}")
+        logger.debug("Exporting metadata to CSV: %s", output_path)
         
         # Ensure directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
@@ -76,7 +76,7 @@ def export_csv(metadata: Dict[str, Any], output_path: str) -> bool:
 def export_markdown(metadata: Dict[str, Any], output_path: str) -> bool:
     """Export metadata as Markdown report."""
     try:
-        logger.debug(f"Exporting metadata to Markdown: {output_path}")
+        logger.debug("Exporting metadata to Markdown: %s", output_path)
         
         # Ensure directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
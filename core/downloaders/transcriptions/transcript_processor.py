@@ -55,6 +55,14 @@ except ImportError:
 logger = setup_logger("transcript_processor")
 
 
+def _entry_texts(transcript_entries: List[Any]) -> List[str]:
+    """Pull the text out of every entry (dicts or snippet objects) in one pass."""
+    return [
+        (entry.get('text', '') if isinstance(entry, dict) else getattr(entry, 'text', ''))
+        for entry in transcript_entries
+    ]
+
+
 class TranscriptProcessor:
     """Processes and formats YouTube transcripts for various use cases."""
     
@@ -72,7 +80,7 @@ class TranscriptProcessor:
         self.chapter_config = self.config.get("chapter_detection", {})
         self.preview_config = self.config.get("preview", {})
         
-        logger.debug(f"TranscriptProcessor initialized with config: {self.config}")
+        logger.debug("TranscriptProcessor initialized with config: %s", self.config)
     
     def clean_text(self, text: str) -> str:
         """Clean transcript text for better LLM consumption."""
@@ -89,7 +97,7 @@ class TranscriptProcessor:
                 # Create pattern for filler words (case insensitive, word boundaries)
                 pattern = r'\b(?:' + '|'.join(re.escape(word) for word in filler_words) + r')\b'
                 cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-                logger.debug(f"Removed filler words: {len(filler_words)} patterns")
+                logger.debug("Removed filler words: %s patterns", len(filler_words))
         
         # Normalize whitespace if enabled
         if self.text_cleaning_config.get("normalize_whitespace", True):
@@ -109,7 +117,7 @@ class TranscriptProcessor:
         
         # Final cleanup
         cleaned = cleaned.strip()
-        logger.debug(f"Text cleaning complete. Original length: {len(text)}, Cleaned length: {len(cleaned)}")
+        logger.debug("Text cleaning complete. Original length: %s, Cleaned length: %s", len(text), len(cleaned))
         
         return cleaned
     
@@ -172,7 +180,7 @@ class TranscriptProcessor:
                     'word_count': len(chapter_text.split())
                 })
                 
-                logger.debug(f"Chapter detected: {current_chapter_start:.1f}s-{start_time:.1f}s ({len(chapter_text)} chars)")
+                logger.debug("Chapter detected: %.1fs-%.1fs (%s chars)", current_chapter_start, start_time, len(chapter_text))
                 
                 # Start new chapter
                 current_chapter_start = start_time
@@ -199,7 +207,7 @@ class TranscriptProcessor:
         raw_text = ' '.join(text_parts)
         clean_text = self.clean_text(raw_text)
         
-        logger.debug(f"Clean transcript generated: {len(clean_text)} characters")
+        logger.debug("Clean transcript generated: %s characters", len(clean_text))
         return clean_text
     
     def generate_timestamped_transcript(self, transcript_entries: List[Dict]) -> str:
@@ -219,11 +227,17 @@ class TranscriptProcessor:
                 continue
         
         result = '\n'.join(lines)
-        logger.debug(f"Timestamped transcript generated: {len(lines)} lines")
+        logger.debug("Timestamped transcript generated: %s lines", len(lines))
         return result
     
-    def generate_structured_transcript(self, transcript_entries: List[Dict], video_metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate structured JSON transcript with metadata."""
+    def generate_structured_transcript(self, transcript_entries: List[Dict], video_metadata: Dict[str, Any] = None,
+                                       clean_text: Optional[str] = None, timestamped_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate structured JSON transcript with metadata.
+        
+        clean_text and timestamped_text take already generated text formats,
+        so they aren't built a second time for the 'formats' section.
+        """
         logger.debug("Generating structured transcript format")
         
         if video_metadata is None:
@@ -233,10 +247,7 @@ class TranscriptProcessor:
         chapters = self.detect_chapters(transcript_entries)
         
         # Calculate basic statistics
-        total_text = ' '.join([
-            (entry.get('text', '') if isinstance(entry, dict) else getattr(entry, 'text', ''))
-            for entry in transcript_entries
-        ])
+        total_text = ' '.join(_entry_texts(transcript_entries))
         
         word_count = len(total_text.split())
         char_count = len(total_text)
@@ -265,8 +276,8 @@ class TranscriptProcessor:
                 'chapters': chapters
             },
             'formats': {
-                'clean_text': self.generate_clean_transcript(transcript_entries),
-                'timestamped_text': self.generate_timestamped_transcript(transcript_entries)
+                'clean_text': clean_text if clean_text is not None else self.generate_clean_transcript(transcript_entries),
+                'timestamped_text': timestamped_text if timestamped_text is not None else self.generate_timestamped_transcript(transcript_entries)
             }
         }
         
@@ -305,7 +316,7 @@ class TranscriptProcessor:
             logger.warning(f"Could not add comprehensive metadata: {e}")
             # Continue without comprehensive metadata - basic structure is still useful
         
-        logger.debug(f"Structured transcript generated: {word_count} words, {len(chapters)} chapters")
+        logger.debug("Structured transcript generated: %s words, %s chapters", word_count, len(chapters))
         return structured
     
     def generate_preview(self, transcript_entries: List[Dict], video_metadata: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -338,12 +349,12 @@ class TranscriptProcessor:
             'total_entries': len(transcript_entries)
         }
         
+        # Entry texts, extracted once for the statistics and quality passes
+        texts = _entry_texts(transcript_entries) if include_stats or include_quality else []
+        
         # Add statistics if requested
         if include_stats:
-            total_text = ' '.join([
-                (entry.get('text', '') if isinstance(entry, dict) else getattr(entry, 'text', ''))
-                for entry in transcript_entries
-            ])
+            total_text = ' '.join(texts)
             word_count = len(total_text.split())
             estimated_reading_time = word_count / 200
             
@@ -356,8 +367,7 @@ class TranscriptProcessor:
         # Add quality indicators if requested
         if include_quality:
             # Simple quality heuristics
-            avg_entry_length = sum(len(entry.get('text', '') if isinstance(entry, dict) else getattr(entry, 'text', '')) 
-                                 for entry in transcript_entries) / len(transcript_entries) if transcript_entries else 0
+            avg_entry_length = sum(map(len, texts)) / len(texts) if texts else 0
             
             quality_score = "High" if avg_entry_length > 50 else "Medium" if avg_entry_length > 20 else "Low"
             
@@ -367,7 +377,7 @@ class TranscriptProcessor:
                 'has_timestamps': len(preview_lines) > 0
             }
         
-        logger.debug(f"Preview generated: {len(preview_lines)} lines shown")
+        logger.debug("Preview generated: %s lines shown", len(preview_lines))
         return preview_data
 
 
@@ -402,7 +412,10 @@ def process_transcript_data(transcript_entries: List[Dict], video_metadata: Dict
         logger.debug("Generated timestamped format")
     
     if 'structured' in formats:
-        results['structured'] = processor.generate_structured_transcript(transcript_entries, video_metadata)
+        results['structured'] = processor.generate_structured_transcript(
+            transcript_entries, video_metadata,
+            clean_text=results.get('clean'), timestamped_text=results.get('timestamped')
+        )
         logger.debug("Generated structured format")
     
     logger.info(f"Transcript processing complete: {len(formats)} formats generated")
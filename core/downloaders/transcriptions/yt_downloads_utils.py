@@ -7,9 +7,15 @@ Includes sanitization, naming, extension mapping, etc.
 
 from yt_dlp import YoutubeDL
 from typing import Optional, Dict, List, Any
+import json
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import logging  
 try:
     from .logger_utils.logger_utils import setup_logger
@@ -20,9 +26,20 @@ except ImportError:
 logger = setup_logger("yt_downloads_utils")
 
 
+def _structured_json_bytes(content: Dict[str, Any]) -> bytes:
+    """Pretty-print the structured transcript as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib handles those
+            pass
+    return json.dumps(content, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
 def download_transcript(video_id: str, language_code: str, save_path: Optional[str] = None, 
                       max_retries: int = 3, retry_delay: int = 2, formats: Optional[List[str]] = None,
-                      video_metadata: Optional[Dict[str, Any]] = None):
+                      video_metadata: Optional[Dict[str, Any]] = None, return_content: bool = False):
     """
     Download transcript with retry logic, error handling, and multiple format support.
     
@@ -35,9 +52,11 @@ def download_transcript(video_id: str, language_code: str, save_path: Optional[s
         formats: List of formats to generate ('clean', 'timestamped', 'structured'). 
                 If None, generates 'timestamped' only for backward compatibility.
         video_metadata: Video metadata for enhanced structured format
+        return_content: Also return the generated content, so callers don't read the files back
     
     Returns:
-        Dict with format names as keys and file paths as values, or single path for backward compatibility
+        Dict with format names as keys and file paths as values, or single path for backward compatibility.
+        With return_content, a tuple of (that dict, dict of format name to generated content).
     """
     from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
     try:
@@ -55,11 +74,11 @@ def download_transcript(video_id: str, language_code: str, save_path: Optional[s
     else:
         backward_compatible = False
     
-    logger.debug(f"Generating formats: {formats}")
+    logger.debug("Generating formats: %s", formats)
     
     for attempt in range(max_retries + 1):
         try:
-            logger.debug(f"Transcript download attempt {attempt + 1}/{max_retries + 1}")
+            logger.debug("Transcript download attempt %s/%s", attempt + 1, max_retries + 1)
             
             # Use the utility function from core.py for API compatibility
             from .dl_transcription import _get_transcript_list
@@ -79,14 +98,14 @@ def download_transcript(video_id: str, language_code: str, save_path: Optional[s
                         }
                         for snippet in fetched_transcript.snippets
                     ]
-                    logger.debug(f"✅ Found transcript using transcript list method")
+                    logger.debug("✅ Found transcript using transcript list method")
                     break
             
             if not transcript_data:
                 # Fallback: try direct get_transcript if it exists
                 try:
                     transcript_data = YouTubeTranscriptApi.get_transcript(video_id, languages=[language_code])
-                    logger.debug(f"✅ Found transcript using get_transcript fallback method")
+                    logger.debug("✅ Found transcript using get_transcript fallback method")
                 except Exception as fallback_error:
                     logger.warning(f"Fallback method also failed: {fallback_error}")
                     raise Exception(f"No transcript found for language: {language_code}")
@@ -147,18 +166,20 @@ def download_transcript(video_id: str, language_code: str, save_path: Optional[s
                 
                 # Save file
                 if format_name == 'structured':
-                    import json
-                    with open(filename, "w", encoding="utf-8") as f:
-                        json.dump(content, f, indent=2, ensure_ascii=False, default=str)
+                    with open(filename, "wb") as f:
+                        f.write(_structured_json_bytes(content))
                 else:
                     with open(filename, "w", encoding="utf-8") as f:
                         f.write(content)
                 
                 saved_files[format_name] = filename
-                logger.debug(f"✅ Saved {format_name} format to: {filename}")
+                logger.debug("✅ Saved %s format to: %s", format_name, filename)
 
             logger.info(f"✅ Transcript download successful on attempt {attempt + 1}: {len(saved_files)} formats saved")
             
+            if return_content:
+                return saved_files, processed_results
+            
             # Backward compatibility: return single path if only one format
             if backward_compatible and len(saved_files) == 1:
                 return list(saved_files.values())[0]
@@ -16,7 +16,11 @@ APP_CONFIG = {
         "remove_original": "False"
     },
     "download": {
-        "download_to_remote_location": "false"
+        "download_to_remote_location": "false",
+        # Hand file transfers to nginx via X-Accel-Redirect (requires an
+        # internal location mapping xaccel_prefix to MEDIA_ROOT)
+        "use_xaccel": "false",
+        "xaccel_prefix": "/protected/"
     },
     "public_access": {
         "enable_cookie_auth": True,
@@ -0,0 +1,63 @@
+"""
+Typed, read-only view of the application configuration.
+
+APP_CONFIG keeps its flags as strings ("True"/"false"). This module reads
+it once at import and exposes frozen dataclasses with real bools, so hot
+paths test an attribute instead of walking dicts and comparing strings.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+from .app_config import APP_CONFIG
+
+
+def _as_bool(value: Any) -> bool:
+    """Coerce a config flag ("True", "false", True, ...) to a bool."""
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return bool(value)
+
+
+@dataclass(frozen=True)
+class AudioConfig:
+    """Settings from APP_CONFIG["audio"]."""
+    save_to_mp3: bool
+    remove_original: bool
+
+
+@dataclass(frozen=True)
+class DownloadConfig:
+    """Settings from APP_CONFIG["download"]."""
+    download_to_remote_location: bool
+
+
+@dataclass(frozen=True)
+class PublicAccessConfig:
+    """Settings from APP_CONFIG["public_access"]."""
+    rotate_user_agents: bool
+    use_mobile_fallback: bool
+    user_agents: Tuple[str, ...]
+
+
+def _build_snapshot():
+    audio = APP_CONFIG.get("audio", {})
+    download = APP_CONFIG.get("download", {})
+    public_access = APP_CONFIG.get("public_access", {})
+    return (
+        AudioConfig(
+            save_to_mp3=_as_bool(audio.get("save_to_mp3", "False")),
+            remove_original=_as_bool(audio.get("remove_original", "True")),
+        ),
+        DownloadConfig(
+            download_to_remote_location=_as_bool(download.get("download_to_remote_location", "True")),
+        ),
+        PublicAccessConfig(
+            rotate_user_agents=_as_bool(public_access.get("rotate_user_agents", True)),
+            use_mobile_fallback=_as_bool(public_access.get("use_mobile_fallback", True)),
+            user_agents=tuple(APP_CONFIG["user_agents"]),
+        ),
+    )
+
+
+AUDIO_CFG, DOWNLOAD_CFG, PUBLIC_ACCESS_CFG = _build_snapshot()
@@ -0,0 +1,49 @@
+"""
+Database locking utilities.
+"""
+import zlib
+from contextlib import contextmanager
+
+from django.db import DatabaseError, connection
+
+
+def _int4(value: int) -> int:
+    """Fold an unsigned 32-bit value into Postgres' signed int4 range."""
+    return value - (1 << 32) if value >= (1 << 31) else value
+
+
+@contextmanager
+def advisory_lock(namespace: int, key: str):
+    """
+    Hold a Postgres session advisory lock on (namespace, key) if it is free.
+
+    Does not wait: when another session holds the lock, the block runs with
+    False so the caller can skip the duplicate work. The lock is released on
+    exit. Other databases have no advisory locks, so the block always runs
+    with True there.
+
+    Args:
+        namespace: First lock key, e.g. a user id
+        key: String hashed (CRC32) into the second lock key, e.g. a URL
+
+    Yields:
+        bool: True if this session holds the lock
+    """
+    if connection.vendor != 'postgresql':
+        yield True
+        return
+
+    lock_args = [_int4(namespace), _int4(zlib.crc32(key.encode()))]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s, %s)", lock_args)
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s, %s)", lock_args)
+            except DatabaseError:
+                # The session is gone, and its locks went with it
+                pass
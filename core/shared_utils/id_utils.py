@@ -0,0 +1,27 @@
+"""
+Identifier utilities.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new values sort
+    after old ones and inserts land at the end of a unique index instead of
+    on random pages.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), 'big')
+    # Set version (7) and variant (RFC 4122) bits
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62
+    return uuid.UUID(int=value)
@@ -0,0 +1,40 @@
+"""
+JSON utilities.
+
+Encoder/decoder classes for Django JSONFields that hand the work to orjson
+when it is installed, and fall back to the stdlib json module otherwise.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONEncoder(DjangoJSONEncoder):
+    """JSONField encoder that serializes with orjson when available."""
+
+    def encode(self, o):
+        if orjson is not None:
+            try:
+                return orjson.dumps(o, default=self.default).decode()
+            except (orjson.JSONEncodeError, TypeError):
+                # e.g. integers wider than 64 bits; the stdlib handles those
+                pass
+        return super().encode(o)
+
+
+class FastJSONDecoder(json.JSONDecoder):
+    """JSONField decoder that parses with orjson when available."""
+
+    def decode(self, s, *args, **kwargs):
+        if orjson is not None:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # e.g. NaN/Infinity written by the stdlib encoder
+                pass
+        return super().decode(s, *args, **kwargs)
@@ -0,0 +1,60 @@
+"""
+Response utilities for serving downloaded files to clients.
+"""
+import logging
+from pathlib import Path
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.http import content_disposition_header
+
+from .app_config import APP_CONFIG
+
+# Initialize logging
+logger = logging.getLogger(__name__)
+
+
+def _xaccel_uri(filepath: str):
+    """
+    Map a file under MEDIA_ROOT to the internal nginx location serving it.
+
+    Returns:
+        str or None: URI for X-Accel-Redirect, or None if the file is outside MEDIA_ROOT
+    """
+    try:
+        relative = Path(filepath).resolve().relative_to(Path(settings.MEDIA_ROOT).resolve())
+    except ValueError:
+        return None
+    prefix = APP_CONFIG.get("download", {}).get("xaccel_prefix", "/protected/")
+    return prefix.rstrip('/') + '/' + quote(relative.as_posix())
+
+
+def file_download_response(filepath: str, filename: str = None):
+    """
+    Build an attachment response for a downloaded file.
+
+    When ``download.use_xaccel`` is enabled the transfer is handed to nginx via
+    X-Accel-Redirect; otherwise a FileResponse is returned, which WSGI servers
+    honoring ``wsgi.file_wrapper`` send with sendfile().
+
+    Args:
+        filepath: Path to the file on disk
+        filename: Name offered to the client (defaults to the file's basename)
+
+    Returns:
+        HttpResponse or FileResponse
+    """
+    filename = filename or Path(filepath).name
+
+    if APP_CONFIG.get("download", {}).get("use_xaccel", "false").lower() == "true":
+        uri = _xaccel_uri(filepath)
+        if uri:
+            response = HttpResponse()
+            response['X-Accel-Redirect'] = uri
+            response['Content-Type'] = 'application/octet-stream'
+            response['Content-Disposition'] = content_disposition_header(True, filename)
+            return response
+        logger.warning(f"File outside MEDIA_ROOT, serving without X-Accel-Redirect: {filepath}")
+
+    return FileResponse(open(filepath, "rb"), as_attachment=True, filename=filename)
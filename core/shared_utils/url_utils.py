@@ -7,6 +7,7 @@ extracting metadata, and handling various URL formats consistently.
 
 import re
 import logging
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from typing import Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
@@ -32,6 +33,18 @@ class YouTubeURLError(Exception):
     pass
 
 
+# Video IDs are exactly 11 URL-safe base64 characters
+_VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+
+def _compile_patterns(patterns: Dict[str, list]) -> Dict[str, list]:
+    """Compile the URL patterns once so lookups don't go through re's cache on every call."""
+    return {
+        url_type: [re.compile(pattern, re.IGNORECASE) for pattern in type_patterns]
+        for url_type, type_patterns in patterns.items()
+    }
+
+
 class YouTubeURLSanitizer:
     """
     YouTube URL sanitizer and parser.
@@ -55,6 +68,12 @@ class YouTubeURLSanitizer:
             r'(?:https?://)?(?:www\.)?youtube\.com/watch\?.*?v=([a-zA-Z0-9_-]{11})',
         ]
     }
+    _COMPILED_PATTERNS = _compile_patterns(PATTERNS)
+    # Every pattern in one alternation, for checks that don't need the URL type
+    _ANY_PATTERN = re.compile(
+        '|'.join(f'(?:{pattern})' for patterns in PATTERNS.values() for pattern in patterns),
+        re.IGNORECASE,
+    )
     
     @classmethod
     def sanitize_url(cls, url: str, preserve_metadata: bool = True) -> YouTubeURLInfo:
@@ -136,13 +155,13 @@ class YouTubeURLSanitizer:
             Tuple of (video_id, url_type)
         """
         # Try each pattern type
-        for url_type, patterns in cls.PATTERNS.items():
+        for url_type, patterns in cls._COMPILED_PATTERNS.items():
             for pattern in patterns:
-                match = re.search(pattern, url, re.IGNORECASE)
+                match = pattern.search(url)
                 if match:
                     video_id = match.group(1)
                     # Validate video ID format
-                    if re.match(r'^[a-zA-Z0-9_-]{11}$', video_id):
+                    if _VIDEO_ID_RE.match(video_id):
                         return video_id, url_type
         
         return None, "unknown"
@@ -288,8 +307,7 @@ class YouTubeURLSanitizer:
             True if it's a valid YouTube URL, False otherwise
         """
         try:
-            video_id, _ = cls._extract_video_id(url)
-            return video_id is not None
+            return _is_youtube_url_cached(url)
         except Exception:
             return False
     
@@ -311,6 +329,13 @@ class YouTubeURLSanitizer:
             return None
 
 
+@lru_cache(maxsize=4096)
+def _is_youtube_url_cached(url: str) -> bool:
+    """Memoized validity check; repeated submissions of a URL skip the regex scan."""
+    # Each pattern captures exactly an 11-character ID, so any match is a valid URL
+    return YouTubeURLSanitizer._ANY_PATTERN.search(url) is not None
+
+
 # Convenience functions for easy imports
 def sanitize_youtube_url(url: str, preserve_metadata: bool = True) -> YouTubeURLInfo:
     """
@@ -91,10 +91,13 @@ def download_transcript_api(request):
         if download_to_remote and transcript_files:
             # Return the first file (clean format) for download
             file_path = transcript_files.get('clean')
-            if file_path and os.path.exists(file_path):
-                filename = os.path.basename(file_path)
-                fileobj = open(file_path, "rb")
-                return FileResponse(fileobj, as_attachment=True, filename=filename)
+            if file_path:
+                try:
+                    fileobj = open(file_path, "rb")
+                except FileNotFoundError:
+                    fileobj = None
+                if fileobj:
+                    return FileResponse(fileobj, as_attachment=True, filename=os.path.basename(file_path))
         
         # Return file info as JSON (server-only storage)
         return Response({
@@ -1,6 +1,7 @@
 # transcriptions_dl/tasks.py
 from background_task import background
 from django.contrib.auth import get_user_model
+from django.db import close_old_connections
 from core.downloaders.transcriptions.dl_transcription import download_transcript_files, get_video_info
 from core.shared_utils.security_utils import log_request_info
 import os
@@ -25,6 +26,9 @@ def process_transcript_download(url, task_id, output_dir, user_id, user_ip=None,
     """
     logger.info(f"Starting background transcript download task {task_id} for URL: {url}")
     
+    # Persistent connections (CONN_MAX_AGE) may have gone stale while the worker idled
+    close_old_connections()
+
     try:
         # Get user object
         user = User.objects.get(id=user_id)
@@ -58,3 +62,5 @@ def process_transcript_download(url, task_id, output_dir, user_id, user_ip=None,
     except Exception as e:
         logger.error(f"Error in background transcript download task {task_id}: {str(e)}")
         # TODO: Update database with error status when DB integration is added
+    finally:
+        close_old_connections()
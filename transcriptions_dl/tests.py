@@ -1,11 +1,25 @@
 # transcriptions_dl/tests.py
-from django.test import TestCase
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 
+from core.downloaders.transcriptions.logger_utils.logger_utils import BufferedRotatingFileHandler
+
 User = get_user_model()
 
 
@@ -201,4 +215,318 @@ class TranscriptDownloadTaskTestCase(TestCase):
             user_id=self.user.id
         )
         
-        mock_download.assert_called_once()
\ No newline at end of file
+        mock_download.assert_called_once()
+
+
+def _log_record(message, level=logging.INFO, name='transcription_test'):
+    """Build a log record without going through a logger."""
+    return logging.LogRecord(name, level, __file__, 0, message, None, None)
+
+
+class BufferedRotatingFileHandlerTestCase(SimpleTestCase):
+    """Test cases for the buffered rotating log file handler."""
+    
+    def setUp(self):
+        """Create a scratch directory for the log files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.log_file = os.path.join(self.temp_dir, 'test.log')
+    
+    def _handler(self, **kwargs):
+        handler = BufferedRotatingFileHandler(self.log_file, encoding='utf-8', flush_interval=0, **kwargs)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.addCleanup(handler.close)
+        return handler
+    
+    def _read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read().splitlines()
+    
+    def test_records_are_buffered_until_flush(self):
+        """Test that INFO records reach the file on flush, not per record."""
+        handler = self._handler()
+        handler.handle(_log_record('first'))
+        handler.handle(_log_record('second'))
+        
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        handler.flush()
+        self.assertEqual(self._read(self.log_file), ['first', 'second'])
+    
+    def test_close_writes_buffered_records(self):
+        """Test that closing the handler writes what is still buffered."""
+        handler = self._handler()
+        handler.handle(_log_record('buffered'))
+        handler.close()
+        
+        self.assertEqual(self._read(self.log_file), ['buffered'])
+    
+    def test_error_record_is_written_immediately(self):
+        """Test that an ERROR record is flushed together with the records before it."""
+        handler = self._handler()
+        handler.handle(_log_record('context'))
+        handler.handle(_log_record('failure', level=logging.ERROR))
+        
+        self.assertEqual(self._read(self.log_file), ['context', 'failure'])
+    
+    def test_rollover_keeps_numbered_backups(self):
+        """Test that rollover produces .1 (newest) to .N backups with the right records."""
+        # Each record is 3 bytes with its newline, so two fit under the 8-byte cap
+        handler = self._handler(maxBytes=8, backupCount=2)
+        for i in range(8):
+            handler.handle(_log_record(f'r{i}'))
+        handler.close()
+        
+        self.assertEqual(self._read(self.log_file), ['r6', 'r7'])
+        self.assertEqual(self._read(self.log_file + '.1'), ['r4', 'r5'])
+        self.assertEqual(self._read(self.log_file + '.2'), ['r2', 'r3'])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['test.log', 'test.log.1', 'test.log.2'])
+    
+    def test_records_survive_background_rollovers_in_order(self):
+        """Test that no record is lost or reordered while backups are shifted in the background."""
+        handler = self._handler(maxBytes=16, backupCount=100)
+        shift_backups = handler._shift_backups
+        
+        def slow_shift(pending_name):
+            # Keep shifts pending while the handler goes on writing
+            time.sleep(0.005)
+            shift_backups(pending_name)
+        
+        with patch.object(handler, '_shift_backups', side_effect=slow_shift):
+            messages = [f'record {i:03d}' for i in range(60)]
+            for message in messages:
+                handler.handle(_log_record(message))
+            handler.close()
+        
+        backups = sorted(
+            (name for name in os.listdir(self.temp_dir) if name != 'test.log'),
+            key=lambda name: int(name.rsplit('.', 1)[1]),
+            reverse=True,
+        )
+        self.assertTrue(all(name.startswith('test.log.') for name in backups))
+        written = []
+        for name in backups + ['test.log']:
+            written += self._read(os.path.join(self.temp_dir, name))
+        self.assertEqual(written, messages)
+    
+    def test_close_waits_for_pending_shift(self):
+        """Test that close() returns only after this handler's queued backup shift has run."""
+        handler = self._handler(maxBytes=8, backupCount=2)
+        shift_backups = handler._shift_backups
+        release_shift = threading.Event()
+        
+        def blocked_shift(pending_name):
+            release_shift.wait(5)
+            shift_backups(pending_name)
+        
+        with patch.object(handler, '_shift_backups', side_effect=blocked_shift):
+            for i in range(3):
+                handler.handle(_log_record(f'r{i}'))
+            closer = threading.Thread(target=handler.close)
+            closer.start()
+            closer.join(0.2)
+            self.assertTrue(closer.is_alive())
+            
+            release_shift.set()
+            closer.join(5)
+        
+        self.assertFalse(closer.is_alive())
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['test.log', 'test.log.1'])
+        self.assertEqual(self._read(self.log_file + '.1'), ['r0', 'r1'])
+    
+    def test_periodic_flush_skipped_when_nothing_buffered(self):
+        """Test that the flush thread only flushes after something was written."""
+        handler = self._handler()
+        handler.flush_interval = 0.02
+        with patch.object(handler, 'flush', wraps=handler.flush) as mock_flush:
+            handler._start_flush_thread()
+            time.sleep(0.15)
+            mock_flush.assert_not_called()
+            
+            handler.handle(_log_record('buffered'))
+            deadline = time.monotonic() + 5
+            while not mock_flush.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+        
+        mock_flush.assert_called_once()
+        self.assertEqual(self._read(self.log_file), ['buffered'])
+    
+    def test_close_stops_flush_thread(self):
+        """Test that the handler's single flush thread exits when it is closed."""
+        handler = BufferedRotatingFileHandler(self.log_file, flush_interval=30)
+        flush_thread = handler._flush_thread
+        self.assertTrue(flush_thread.is_alive())
+        
+        handler.close()
+        flush_thread.join(5)
+        self.assertFalse(flush_thread.is_alive())
+
+
+class TranscriptionLoggerRoutingTestCase(SimpleTestCase):
+    """Test cases for setup_logger's queue listener routing."""
+    
+    # Runs in a fresh interpreter so the listener, its atexit hook and the
+    # logs directory belong to this test alone
+    SCRIPT = textwrap.dedent("""
+        import sys
+        from pathlib import Path
+        from core.downloaders.transcriptions.logger_utils import logger_utils
+        
+        logs_dir, config_path = Path(sys.argv[1]), Path(sys.argv[2])
+        logger_utils.LOGS_DIR = logs_dir
+        first = logger_utils.setup_logger("routing_first", config_path=config_path)
+        second = logger_utils.setup_logger("routing_second", config_path=config_path)
+        for i in range(3):
+            first.info("first %d", i)
+            second.info("second info %d", i)
+            second.warning("second warning %d", i)
+        # No explicit flush or shutdown: exit has to drain the queue
+    """)
+    
+    def setUp(self):
+        """Write a logger config that gives each module its own file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.config_path = os.path.join(self.temp_dir, 'logger_config.json')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write("""{
+                "logging": {
+                    "console": {"level": "CRITICAL"},
+                    "file": {"level": "INFO", "format": "%(name)s %(message)s"},
+                    "modules": {
+                        "routing_first": {"log_filename": "first.log"},
+                        "routing_second": {"log_filename": "second.log", "level": "WARNING"}
+                    }
+                }
+            }""")
+    
+    def _read(self, name):
+        with open(os.path.join(self.temp_dir, name), encoding='utf-8') as f:
+            return f.read().splitlines()
+    
+    def test_records_land_in_their_module_file_by_exit(self):
+        """Test that each module's records reach its own file once the process exits."""
+        subprocess.run(
+            [sys.executable, '-c', self.SCRIPT, self.temp_dir, self.config_path],
+            cwd=settings.BASE_DIR, check=True, timeout=60,
+        )
+        
+        self.assertEqual(self._read('first.log'), [f'routing_first first {i}' for i in range(3)])
+        # The module's own WARNING level still filters on the listener side
+        self.assertEqual(self._read('second.log'), [f'routing_second second warning {i}' for i in range(3)])
+
+
+def _parse_line_by_line(timestamped_text):
+    """The parser _parse_timestamped_text replaced, kept as the reference output."""
+    ts_re = re.compile(
+        r"^\s*(?:\[)?(?:(\d{1,2}):)?(\d{1,2}):(\d{2})(?:[\.,](\d{1,3}))?(?:\])?\s*(.*\S)\s*$"
+    )
+    segments = []
+    for line in timestamped_text.strip().split('\n'):
+        if not line.strip():
+            continue
+        match = ts_re.match(line)
+        if not match:
+            continue
+        hours = int(match.group(1)) if match.group(1) else 0
+        milliseconds = int(match.group(4)) if match.group(4) else 0
+        start_time = hours * 3600 + int(match.group(2)) * 60 + int(match.group(3)) + milliseconds / 1000.0
+        text = match.group(5).strip()
+        if text:
+            segments.append({'start': start_time, 'text': text, 'duration': 3.0})
+    return segments
+
+
+class ParseTimestampedTextTestCase(SimpleTestCase):
+    """Test cases for parsing timestamped transcript text into segments."""
+    
+    def _parse(self, text):
+        from core.downloaders.transcriptions.dl_transcription import _parse_timestamped_text
+        segments = _parse_timestamped_text(text)
+        self.assertEqual(segments, _parse_line_by_line(text))
+        return segments
+    
+    def test_bracketed_minutes_and_seconds(self):
+        """Test [mm:ss] timestamps."""
+        segments = self._parse("[00:05] Hello there\n[01:30] General Kenobi")
+        
+        self.assertEqual(segments, [
+            {'start': 5.0, 'text': 'Hello there', 'duration': 3.0},
+            {'start': 90.0, 'text': 'General Kenobi', 'duration': 3.0},
+        ])
+    
+    def test_hours_and_milliseconds(self):
+        """Test h:mm:ss.mmm and h:mm:ss,mmm timestamps."""
+        segments = self._parse("1:02:03.456 First\n0:00:07,5 Second")
+        
+        self.assertEqual([segment['start'] for segment in segments], [3723.456, 7.005])
+        self.assertEqual([segment['text'] for segment in segments], ['First', 'Second'])
+    
+    def test_blank_lines_are_skipped(self):
+        """Test that blank and whitespace-only lines produce no segments."""
+        segments = self._parse("\n[00:01] One\n\n   \n\t\n[00:02] Two\n\n")
+        
+        self.assertEqual([segment['text'] for segment in segments], ['One', 'Two'])
+    
+    def test_lines_without_timestamp_are_skipped(self):
+        """Test that lines without a leading timestamp are ignored, not merged into a segment."""
+        segments = self._parse("Transcript for video\n[00:01] One\ncontinued text\n[00:02] Two")
+        
+        self.assertEqual([segment['text'] for segment in segments], ['One', 'Two'])
+    
+    def test_trailing_text_after_last_timestamp(self):
+        """Test that text after the last timestamp and trailing whitespace are handled."""
+        segments = self._parse("[00:01] One\n[00:02]   last words   \ntrailing note")
+        
+        self.assertEqual(segments[-1], {'start': 2.0, 'text': 'last words', 'duration': 3.0})
+        self.assertEqual(len(segments), 2)
+    
+    def test_crlf_line_endings(self):
+        """Test that Windows line endings don't end up in the segment text."""
+        segments = self._parse("[00:01] One\r\n[00:02] Two\r\n")
+        
+        self.assertEqual([segment['text'] for segment in segments], ['One', 'Two'])
+
+
+class TranscriptListCacheTestCase(SimpleTestCase):
+    """Test cases for the shared transcript list cache."""
+    
+    def setUp(self):
+        """Start each test with an empty cache."""
+        from core.downloaders.transcriptions import dl_transcription
+        self.module = dl_transcription
+        self.addCleanup(dl_transcription._TRANSCRIPT_LIST_CACHE.clear)
+        dl_transcription._TRANSCRIPT_LIST_CACHE.clear()
+    
+    @patch('youtube_transcript_api.YouTubeTranscriptApi')
+    def test_concurrent_inserts_and_evictions(self, mock_api_class):
+        """Test that threads filling the cache past its size neither fail nor overfill it."""
+        mock_api_class.return_value.list.side_effect = lambda video_id: f"list for {video_id}"
+        errors = []
+        
+        def fill(worker):
+            try:
+                for i in range(200):
+                    video_id = f"{worker}-{i}"
+                    self.assertEqual(self.module._get_transcript_list(video_id), f"list for {video_id}")
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.module._TRANSCRIPT_LIST_CACHE), self.module._TRANSCRIPT_LIST_CACHE_SIZE)
+    
+    @patch('youtube_transcript_api.YouTubeTranscriptApi')
+    def test_repeat_lookup_is_served_from_cache(self, mock_api_class):
+        """Test that a second lookup within the TTL doesn't ask YouTube again."""
+        mock_api_class.return_value.list.return_value = "transcripts"
+        
+        self.module._get_transcript_list("dQw4w9WgXcQ")
+        self.module._get_transcript_list("dQw4w9WgXcQ")
+        
+        mock_api_class.return_value.list.assert_called_once_with("dQw4w9WgXcQ")
@@ -96,14 +96,9 @@ def download_form(request):
     client_ip = get_client_ip(request)
     download_stats = get_download_stats(client_ip)
     
-    # Get cookie status
-    from cookie_management.cookie_manager import get_cookie_status
-    cookie_status = get_cookie_status(request.user)
-    
     context = {
         'download_stats': download_stats,
-        'ip_allowed': is_ip_allowed(client_ip),
-        'cookie_status': cookie_status
+        'ip_allowed': is_ip_allowed(client_ip)
     }
     
     return render(request, "transcriptions_dl/download_form.html", context)
@@ -4,11 +4,12 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import FileResponse
 from core.downloaders.video.download_video import download_video
 from core.shared_utils.url_utils import YouTubeURLSanitizer, YouTubeURLError
 from core.downloaders.shared_downloader import get_file_info
 from core.shared_utils.app_config import APP_CONFIG
+from core.shared_utils.response_utils import file_download_response
+from core.shared_utils.id_utils import uuid7
 from cookie_management.cookie_manager import get_user_cookies
 
 @api_view(["POST"])
@@ -55,8 +56,7 @@ def download_video_api(request):
     
     if download_to_remote:
         # Return the file (current behavior - download dialog)
-        fileobj = open(result['filepath'], "rb")
-        return FileResponse(fileobj, as_attachment=True, filename=result['filename'])
+        return file_download_response(result['filepath'], result['filename'])
     else:
         # Return file info as JSON (server-only storage)
         file_info = get_file_info(result['filepath'])
@@ -72,7 +72,6 @@ def download_video_api(request):
 from django.urls import reverse
 from background_task.models import Task
 from django.shortcuts import get_object_or_404
-import uuid
 
 
 @api_view(["POST"])
@@ -94,7 +93,7 @@ def download_video_api_async(request):
     user_download_dir = request.user.get_download_directory('video')
     
     # Create a unique task ID
-    task_id = str(uuid.uuid4())
+    task_id = str(uuid7())
     
     # Get user tracking information
     user_ip = request.META.get('REMOTE_ADDR')
@@ -132,15 +131,15 @@ def job_status(request, job_id: str):
         
         # Try to find the job by task_id first, then by job_id
         try:
-            job = DownloadJob.objects.get(task_id=job_id)
+            job = DownloadJob.objects.with_details().get(task_id=job_id)
         except DownloadJob.DoesNotExist:
             try:
-                job = DownloadJob.objects.get(job_id=job_id)
+                job = DownloadJob.objects.with_details().get(job_id=job_id)
             except DownloadJob.DoesNotExist:
                 return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
         
         # Check if user has permission to view this job
-        if job.user != request.user:
+        if job.user_id != request.user.id:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
         
         return Response({
@@ -167,26 +166,25 @@ def job_result(request, job_id: str):
         
         # Try to find the job by task_id first, then by job_id
         try:
-            job = DownloadJob.objects.get(task_id=job_id)
+            job = DownloadJob.objects.with_details().get(task_id=job_id)
         except DownloadJob.DoesNotExist:
             try:
-                job = DownloadJob.objects.get(job_id=job_id)
+                job = DownloadJob.objects.with_details().get(job_id=job_id)
             except DownloadJob.DoesNotExist:
                 return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
         
         # Check if user has permission to view this job
-        if job.user != request.user:
+        if job.user_id != request.user.id:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
         
         if job.status != "completed":
             return Response({"detail": f"Job not completed. Current status: {job.status}"}, status=status.HTTP_400_BAD_REQUEST)
         
-        if not job.filepath or not os.path.exists(job.filepath):
+        if not job.filepath or not os.path.isfile(job.filepath):
             return Response({"detail": "File not found"}, status=status.HTTP_404_NOT_FOUND)
         
         # Return the file for download
-        fileobj = open(job.filepath, "rb")
-        return FileResponse(fileobj, as_attachment=True, filename=job.filename)
+        return file_download_response(job.filepath, job.filename)
         
     except Exception as e:
         return Response({"detail": f"Error retrieving job result: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
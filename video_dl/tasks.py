@@ -9,12 +9,18 @@ from typing import Dict, Any
 from background_task import background
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
 
 # Reuse your existing core downloader
 # (keeps behavior identical between sync and async paths)
 from core.downloaders.video.download_video import download_video
 from core.shared_utils.url_utils import YouTubeURLSanitizer, YouTubeURLError
+from core.shared_utils.db_locks import advisory_lock
 from cookie_management.cookie_manager import get_user_cookies
+from video_dl.models import DownloadJob
+
+User = get_user_model()
 
 
 @background(schedule=0)  # Run immediately
@@ -29,40 +35,54 @@ def process_youtube_video(url: str, task_id: str = None, output_dir: str = None,
         user_ip: User's IP address
         user_agent: User's browser/agent string
     """
+    # Persistent connections (CONN_MAX_AGE) may have gone stale while the worker idled
+    close_old_connections()
+
     try:
         # Validate YouTube URL before processing
         if not YouTubeURLSanitizer.is_youtube_url(url):
             print(f"Background task {task_id} failed: Invalid YouTube URL")
+            DownloadJob.objects.fail_queued_job(task_id, "Invalid YouTube URL")
             return
         
-        # Get user object for database logging
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            print(f"Background task {task_id} failed: User {user_id} not found")
-            return
+        # Concurrent requests for the same user, URL and type download it only once
+        with advisory_lock(user_id or 0, f"video:{url}") as acquired:
+            if not acquired:
+                print(f"Background task {task_id} skipped: same download already running")
+                DownloadJob.objects.fail_duplicate_job(task_id, user_id, url, 'video')
+                return
+
+            # Get user object for database logging
+            try:
+                # The downloader and cookie lookup only need the primary key
+                user = User.objects.only('id').get(id=user_id)
+            except User.DoesNotExist:
+                print(f"Background task {task_id} failed: User {user_id} not found")
+                DownloadJob.objects.fail_queued_job(task_id, f"User {user_id} not found")
+                return
         
-        # Get user cookies for authentication
-        user_cookies = get_user_cookies(user) if user else None
+            # Get user cookies for authentication
+            user_cookies = get_user_cookies(user) if user else None
         
-        # Use the core download function with user-specific directory
-        result = download_video(
-            url, 
-            output_dir=output_dir,
-            user=user,
-            user_ip=user_ip,
-            user_agent=user_agent,
-            download_source='api_async',
-            task_id=task_id,
-            user_cookies=user_cookies
-        )
+            # Use the core download function with user-specific directory
+            result = download_video(
+                url, 
+                output_dir=output_dir,
+                user=user,
+                user_ip=user_ip,
+                user_agent=user_agent,
+                download_source='api_async',
+                task_id=task_id,
+                user_cookies=user_cookies
+            )
         
-        if result['success']:
-            print(f"Background task {task_id} completed successfully: {result['filename']}")
-        else:
-            print(f"Background task {task_id} failed: {result['error']}")
+            if result['success']:
+                print(f"Background task {task_id} completed successfully: {result['filename']}")
+            else:
+                print(f"Background task {task_id} failed: {result['error']}")
             
     except Exception as e:
         print(f"Background task {task_id} encountered an exception: {str(e)}")
+        DownloadJob.objects.fail_queued_job(task_id, str(e))
+    finally:
+        close_old_connections()
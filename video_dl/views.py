@@ -1,12 +1,13 @@
 # video_dl/views.py
 import os
-from django.http import HttpResponseBadRequest, FileResponse, JsonResponse
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from core.downloaders.video.download_video import download_video
 from core.downloaders.shared_downloader import get_file_info
 from core.shared_utils.app_config import APP_CONFIG
+from core.shared_utils.response_utils import file_download_response
 from core.shared_utils.security_utils import get_client_ip, log_request_info
 from core.shared_utils.rate_limiting import get_download_stats, is_ip_allowed
 from cookie_management.cookie_manager import get_user_cookies
@@ -51,8 +52,7 @@ def index(request):
             
             if download_to_remote:
                 # Return the file (current behavior - download dialog)
-                fileobj = open(result['filepath'], "rb")
-                return FileResponse(fileobj, as_attachment=True, filename=result['filename'])
+                return file_download_response(result['filepath'], result['filename'])
             else:
                 # Server-only storage - show success message and redirect
                 messages.success(request, f'Video downloaded successfully to server: {result["filename"]}')
@@ -75,14 +75,9 @@ def index(request):
     client_ip = get_client_ip(request)
     download_stats = get_download_stats(client_ip)
     
-    # Get cookie status
-    from cookie_management.cookie_manager import get_cookie_status
-    cookie_status = get_cookie_status(request.user)
-    
     context = {
         'download_stats': download_stats,
-        'ip_allowed': is_ip_allowed(client_ip),
-        'cookie_status': cookie_status
+        'ip_allowed': is_ip_allowed(client_ip)
     }
     
     return render(request, "video_dl/download_form.html", context)
@@ -104,15 +99,15 @@ def download_status(request, job_id):
         
         # Try to find the job by task_id first, then by job_id
         try:
-            job = DownloadJob.objects.get(task_id=job_id)
+            job = DownloadJob.objects.with_details().get(task_id=job_id)
         except DownloadJob.DoesNotExist:
             try:
-                job = DownloadJob.objects.get(job_id=job_id)
+                job = DownloadJob.objects.with_details().get(job_id=job_id)
             except DownloadJob.DoesNotExist:
                 return HttpResponseBadRequest("Job not found")
         
         # Check if user has permission to view this job
-        if job.user != request.user:
+        if job.user_id != request.user.id:
             return HttpResponseBadRequest("Permission denied")
         
         context = {
@@ -134,26 +129,25 @@ def download_result(request, job_id):
         
         # Try to find the job by task_id first, then by job_id
         try:
-            job = DownloadJob.objects.get(task_id=job_id)
+            job = DownloadJob.objects.with_details().get(task_id=job_id)
         except DownloadJob.DoesNotExist:
             try:
-                job = DownloadJob.objects.get(job_id=job_id)
+                job = DownloadJob.objects.with_details().get(job_id=job_id)
             except DownloadJob.DoesNotExist:
                 return HttpResponseBadRequest("Job not found")
         
         # Check if user has permission to view this job
-        if job.user != request.user:
+        if job.user_id != request.user.id:
             return HttpResponseBadRequest("Permission denied")
         
         if job.status != "completed":
             return HttpResponseBadRequest(f"Job not completed. Current status: {job.status}")
         
-        if not job.filepath or not os.path.exists(job.filepath):
+        if not job.filepath or not os.path.isfile(job.filepath):
             return HttpResponseBadRequest("File not found")
         
         # Return the file for download
-        fileobj = open(job.filepath, "rb")
-        return FileResponse(fileobj, as_attachment=True, filename=job.filename)
+        return file_download_response(job.filepath, job.filename)
         
     except Exception as e:
         return HttpResponseBadRequest(f"Error: {e}")
\ No newline at end of file
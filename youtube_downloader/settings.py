@@ -99,6 +99,9 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', ''),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Keep connections open between requests/tasks instead of reconnecting each time
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -147,9 +150,15 @@ STATIC_URL = '/static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads up to 1MB (the cookie file limit) stay in memory instead of a temp file
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024
+
 # ---- Background tasks configuration (no Redis required) ----
 # django-background-tasks uses database for task storage
 BACKGROUND_TASK_RUN_ASYNC = True
+# Downloads are I/O-bound, so each process_tasks worker runs several at once
+# in its thread pool rather than one per CPU core
+BACKGROUND_TASK_ASYNC_THREADS = int(os.getenv('BACKGROUND_TASK_ASYNC_THREADS', '16'))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -199,3 +208,12 @@ CACHES = {
         }
     }
 }
+
+# Optional: share the cache (rate limits, decrypted cookies) across web and
+# task worker processes. Requires the 'redis' package.
+if os.getenv('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+        'TIMEOUT': 3600,
+    }